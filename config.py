@@ -5,7 +5,28 @@ Global configuration constants for Medieval Deck game.
 # Screen settings - Ultrawide 3440x1440
 SCREEN_WIDTH = 3440
 SCREEN_HEIGHT = 1440
-FPS = 60
+FPS = 60  # Render frame cap, 0 = uncapped
+UPDATE_RATE = 60  # Fixed simulation steps per second, independent of rendering
+MAX_CATCHUP_STEPS = 5  # Simulation steps per frame before the backlog is dropped
+VSYNC = False
+RENDER_BACKEND = "surface"  # "texture" draws through the SDL2 renderer, falling back to "surface"
+TRANSITION_STYLE = "crossfade"  # Screen changes: "fade", "crossfade", "wipe" or None for cuts
+TRANSITION_DURATION = 0.35  # Seconds
+
+# Internal render resolution, upscaled to the display in a single blit
+RENDER_SCALE = 1.0  # Fraction of native size screens are drawn at
+RENDER_SCALE_AUTO = True  # Step through RENDER_SCALE_LEVELS to hold the frame budget
+RENDER_SCALE_LEVELS = (1.0, 0.85, 0.75, 0.6, 0.5)
+RENDER_SCALE_WINDOW = 30  # Frames averaged before the scale may change
+RENDER_SCALE_HEADROOM = 0.7  # Scale back up once frames fit in this fraction of the budget
+SCREEN_CACHE_SIZE = 2  # Screens kept instantiated; inactive ones always release heavy resources
+ASSET_BUDGET_MB = 256  # Resident image memory before least recently used surfaces are evicted
+PARTICLE_CAPACITY = 4096  # Live particles; further emission is dropped
+PARTICLE_BUDGET_MS = 4.0  # Frame time particles may take (python -m utils.particles)
+
+# Frame profiler overlay (F3 toggles, F4 dumps CSV)
+PROFILER_HISTORY = 600  # Frames kept for rolling stats and CSV export
+PROFILER_CSV_DIR = "profiles"
 
 # Colors
 BLACK = (0, 0, 0)
@@ -33,8 +54,29 @@ CARDS_DIR = "cards"
 
 # AI Generation settings - Ultrawide resolution
 AI_SEED = 42
+AI_MODEL_ID = "stabilityai/stable-diffusion-xl-base-1.0"
 AI_IMAGE_SIZE = (3440, 1440)
 AI_BATCH_SIZE = 1
+AI_GENERATION_TIMEOUT = 900  # Seconds per generation job, None disables
+AI_CHECKPOINT_INTERVAL = 5  # Denoising steps between latent checkpoints, 0 disables
+AI_DAEMON_HOST = "127.0.0.1"  # Generation daemon (python -m gen_assets.daemon)
+AI_DAEMON_PORT = 7865
+AI_SHARED_FRAME_TTL = 60  # Seconds a daemon keeps a shared memory frame for its receiver
+AI_VARIANT_STRENGTH = 0.45  # img2img strength for background variants
+AI_VARIANT_STEP_SCALE = 0.6  # Fraction of the txt2img step count used for variants
+
+# Generation autotuner (python -m gen_assets.autotuner) - seconds per image
+AUTOTUNE_BUDGETS = {'background': 90.0, 'sprite': 30.0, 'ui': 15.0, 'card': 30.0}
+AUTOTUNE_STEPS = (20, 25, 30, 35)
+AUTOTUNE_RESOLUTION_TIERS = (1.0, 0.75, 0.5)  # Generated smaller, upscaled to target
+AUTOTUNE_ATTENTION_MODES = ("sdpa", "xformers", "sliced")
+AUTOTUNE_VAE_MODES = ("full", "sliced", "tiled")
+HARDWARE_PROFILES_PATH = "gen_assets/hardware_profiles.json"
+
+# Card art generation - SDXL portrait bucket close to the card ratio
+CARD_ART_SIZE = (832, 1216)
+CARD_THUMBNAIL_SIZE = (160, 234)
+CARD_ART_BATCH_SIZE = 4
 
 # Heroes
 HEROES = {
@@ -4,7 +4,8 @@ Implements consistent SDXL prompts based on art.txt guidelines
 Gothic medieval realism with artistic touch
 """
 
-from config import AI_SEED, AI_IMAGE_SIZE
+import zlib
+from config import AI_SEED, AI_IMAGE_SIZE, CARD_ART_SIZE
 
 class ArtDirection:
     """
@@ -19,6 +20,14 @@ class ArtDirection:
     COLD_PALETTE = "deep blue, grey, violet tones, golden highlights"
     WARM_PALETTE = "crimson red, emerald green, warm gold accents"
     
+    # Card palettes - distinct colors per card type
+    CARD_PALETTES = {
+        'attack': "crimson red, burnished steel, ember orange highlights",
+        'defense': "steel blue, slate grey, silver highlights",
+        'magic': "deep violet, sapphire blue, glowing arcane accents",
+        'special': "royal gold, ivory, warm candlelight"
+    }
+    
     # Quality settings
     QUALITY_TAGS = "highly detailed, masterpiece, best quality, sharp focus, professional artwork"
     
@@ -78,6 +87,65 @@ class ArtDirection:
         
         return base_config
     
+    @classmethod
+    def get_background_variant_prompt(cls, hero_type, variant_type):
+        """
+        Generate prompts for backgrounds derived from a hero background
+        
+        Args:
+            hero_type: Hero whose background is the source
+            variant_type: 'combat', 'event' or 'shop'
+            
+        Returns:
+            dict: Complete variant prompt configuration
+        """
+        base_scene = cls.get_hero_background_prompt(hero_type)
+        
+        variants = {
+            'combat': {
+                'positive': f"""
+                Battle-scarred version of the same location, smoke and embers in the air,
+                scattered weapons and broken shields, ominous red firelight,
+                tense combat atmosphere, same architecture and composition,
+                {cls.BASE_STYLE}, {cls.WARM_PALETTE}, {cls.QUALITY_TAGS}
+                """.strip(),
+                'scene_desc': f"Combat arena version of: {base_scene['scene_desc']}"
+            },
+            
+            'event': {
+                'positive': f"""
+                Quiet moment in the same location, mysterious stranger's lantern glow,
+                scattered clues and an old letter, soft mist, sense of discovery,
+                same architecture and composition,
+                {cls.BASE_STYLE}, {cls.COLD_PALETTE}, {cls.QUALITY_TAGS}
+                """.strip(),
+                'scene_desc': f"Random event version of: {base_scene['scene_desc']}"
+            },
+            
+            'shop': {
+                'positive': f"""
+                Merchant stall set up in the same location, wooden crates and potion shelves,
+                hanging lanterns, gold coins and relics on display, welcoming warm light,
+                same architecture and composition,
+                {cls.BASE_STYLE}, {cls.WARM_PALETTE}, {cls.QUALITY_TAGS}
+                """.strip(),
+                'scene_desc': f"Merchant shop version of: {base_scene['scene_desc']}"
+            }
+        }
+        
+        variant_order = ['combat', 'event', 'shop']
+        base_config = dict(variants.get(variant_type, variants['combat']))
+        base_config.update({
+            'negative': cls.NEGATIVE_PROMPT,
+            'width': AI_IMAGE_SIZE[0],
+            'height': AI_IMAGE_SIZE[1],
+            'seed': AI_SEED + 1 + (variant_order.index(variant_type) if variant_type in variant_order else 0),
+            'hero': hero_type,
+            'variant': variant_type
+        })
+        
+        return base_config
+    
     @classmethod
     def get_hero_sprite_prompt(cls, hero_type):
         """
@@ -224,4 +292,33 @@ class ArtDirection:
             'element': element_type
         })
         
-        return base_config
\ No newline at end of file
+        return base_config
+    
+    @classmethod
+    def get_card_art_prompt(cls, card):
+        """
+        Generate card illustration prompt from a card definition
+        
+        Args:
+            card: Card definition dict (id, name, type, art)
+            
+        Returns:
+            dict: Complete card art prompt configuration
+        """
+        card_type = card.get('type', 'special')
+        palette = cls.CARD_PALETTES.get(card_type, cls.CARD_PALETTES['special'])
+        subject = card.get('art', card['name'])
+        
+        return {
+            'positive': f"""
+            Medieval card illustration of {subject}, centered subject,
+            ornate painted vignette, textured parchment and stone framing,
+            {cls.BASE_STYLE}, {palette}, {cls.QUALITY_TAGS}
+            """.strip(),
+            'desc': f"{card['name']} ({card_type} card)",
+            'negative': cls.NEGATIVE_PROMPT,
+            'width': CARD_ART_SIZE[0],
+            'height': CARD_ART_SIZE[1],
+            'seed': AI_SEED + zlib.crc32(card['id'].encode()) % 1000,  # Stable across runs
+            'card': card['id']
+        }
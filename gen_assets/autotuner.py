@@ -0,0 +1,269 @@
+"""
+Generation Autotuner for Medieval Deck
+Sweeps steps, resolution tiers and attention/VAE options on the local GPU and
+picks the best configuration that fits a time budget per asset class
+Results are saved as a hardware profile that RTX5070Optimizer loads on startup
+
+Run with: python -m gen_assets.autotuner
+"""
+
+import os
+import json
+import time
+import platform
+import torch
+from config import (AI_IMAGE_SIZE, CARD_ART_SIZE, AUTOTUNE_BUDGETS, AUTOTUNE_STEPS,
+                    AUTOTUNE_RESOLUTION_TIERS, AUTOTUNE_ATTENTION_MODES,
+                    AUTOTUNE_VAE_MODES, HARDWARE_PROFILES_PATH)
+
+# Representative target resolution of each asset class
+ASSET_CLASS_RESOLUTIONS = {
+    'background': AI_IMAGE_SIZE,
+    'sprite': (1024, 1024),
+    'ui': (512, 512),
+    'card': CARD_ART_SIZE
+}
+
+def get_asset_class(prompt_config):
+    """
+    Classify a prompt configuration for tuned parameter lookup
+
+    Args:
+        prompt_config: Prompt configuration dict
+
+    Returns:
+        str: 'background', 'sprite', 'ui', 'card' or None
+    """
+    if 'element' in prompt_config:
+        return 'ui'
+    if 'card' in prompt_config:
+        return 'card'
+    if 'character_desc' in prompt_config:
+        return 'sprite'
+    if 'scene_desc' in prompt_config or 'variant' in prompt_config:
+        return 'background'
+    return None
+
+def get_hardware_id():
+    """Identifier of the generation device that profiles are stored under"""
+    if torch.cuda.is_available():
+        return torch.cuda.get_device_name(0)
+    return f"cpu-{platform.machine() or 'unknown'}"
+
+def get_tier_resolution(resolution, scale):
+    """
+    Scale a resolution to a tier, keeping SDXL's multiple-of-8 constraint
+
+    Args:
+        resolution: Target (width, height)
+        scale: Resolution tier factor
+
+    Returns:
+        tuple: (width, height) to generate at
+    """
+    return tuple(max(8, int(round(side * scale / 8)) * 8) for side in resolution)
+
+def load_hardware_profile(hardware_id=None, path=HARDWARE_PROFILES_PATH):
+    """
+    Load the tuned profile for a device
+
+    Args:
+        hardware_id: Device identifier (defaults to the current device)
+        path: Profiles JSON file
+
+    Returns:
+        dict: asset class -> tuned parameters, or None if not tuned yet
+    """
+    if not os.path.exists(path):
+        return None
+
+    try:
+        with open(path, "r") as f:
+            profiles = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Warning: Ignoring unreadable hardware profiles {path}: {e}")
+        return None
+
+    profile = profiles.get(hardware_id or get_hardware_id())
+    return profile['asset_classes'] if profile else None
+
+def save_hardware_profile(asset_classes, hardware_id=None, path=HARDWARE_PROFILES_PATH):
+    """
+    Store a tuned profile, keeping the profiles of other devices
+
+    Args:
+        asset_classes: asset class -> tuned parameters
+        hardware_id: Device identifier (defaults to the current device)
+        path: Profiles JSON file
+    """
+    profiles = {}
+    if os.path.exists(path):
+        try:
+            with open(path, "r") as f:
+                profiles = json.load(f)
+        except (OSError, ValueError):
+            profiles = {}
+
+    profiles[hardware_id or get_hardware_id()] = {
+        'tuned_at': time.strftime("%Y-%m-%d %H:%M:%S"),
+        'asset_classes': asset_classes
+    }
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w") as f:
+        json.dump(profiles, f, indent=2)
+    os.replace(temp_path, path)
+
+class GenerationAutotuner:
+    """
+    Picks generation parameters per asset class from measured timings
+    Quality ranks resolution tier first, then step count; attention and VAE
+    options only affect speed, so the fastest of equal quality wins
+    """
+
+    def __init__(self, measure_fn, budgets=None, steps=AUTOTUNE_STEPS,
+                 resolution_tiers=AUTOTUNE_RESOLUTION_TIERS,
+                 attention_modes=AUTOTUNE_ATTENTION_MODES, vae_modes=AUTOTUNE_VAE_MODES):
+        """
+        Initialize autotuner
+
+        Args:
+            measure_fn: Callable(asset_class, candidate) -> seconds per image
+                        (None if the candidate is unsupported on this machine)
+            budgets: asset class -> seconds per image
+            steps: Step counts to sweep
+            resolution_tiers: Resolution factors to sweep
+            attention_modes: Attention implementations to sweep
+            vae_modes: VAE decode modes to sweep
+        """
+        self.measure_fn = measure_fn
+        self.budgets = budgets or AUTOTUNE_BUDGETS
+        self.steps = sorted(steps)
+        self.resolution_tiers = sorted(resolution_tiers, reverse=True)
+        self.attention_modes = attention_modes
+        self.vae_modes = vae_modes
+        self.measurements = []
+
+    def tune_asset_class(self, asset_class):
+        """
+        Sweep candidates for one asset class
+
+        Args:
+            asset_class: Asset class with a budget
+
+        Returns:
+            dict: Chosen parameters with their measured time
+        """
+        budget = self.budgets[asset_class]
+        resolution = ASSET_CLASS_RESOLUTIONS[asset_class]
+        results = []
+
+        for scale in self.resolution_tiers:
+            width, height = get_tier_resolution(resolution, scale)
+            for attention in self.attention_modes:
+                for vae in self.vae_modes:
+                    # Time grows with steps, so stop a combination once it is over budget
+                    for steps in self.steps:
+                        candidate = {
+                            'num_inference_steps': steps,
+                            'resolution_scale': scale,
+                            'width': width,
+                            'height': height,
+                            'attention': attention,
+                            'vae': vae
+                        }
+                        seconds = self.measure_fn(asset_class, candidate)
+                        if seconds is None:
+                            break
+
+                        candidate['seconds'] = seconds
+                        results.append(candidate)
+                        self.measurements.append(dict(candidate, asset_class=asset_class))
+                        if seconds > budget:
+                            break
+
+        if not results:
+            raise RuntimeError(f"No supported generation configuration for {asset_class}")
+
+        within_budget = [result for result in results if result['seconds'] <= budget]
+        if within_budget:
+            best = max(within_budget, key=lambda result: (
+                result['resolution_scale'], result['num_inference_steps'], -result['seconds']
+            ))
+        else:
+            best = min(results, key=lambda result: result['seconds'])
+
+        best = dict(best, budget=budget, within_budget=bool(within_budget))
+        status = "within" if best['within_budget'] else "OVER"
+        print(f"{asset_class}: {best['num_inference_steps']} steps at {best['width']}x{best['height']} "
+              f"({best['attention']} attention, {best['vae']} VAE) - "
+              f"{best['seconds']:.1f}s, {status} {budget:.0f}s budget")
+        return best
+
+    def tune(self, asset_classes=None):
+        """
+        Tune every asset class
+
+        Args:
+            asset_classes: Classes to tune (defaults to all budgeted classes)
+
+        Returns:
+            dict: asset class -> chosen parameters
+        """
+        return {asset_class: self.tune_asset_class(asset_class)
+                for asset_class in (asset_classes or self.budgets)}
+
+def make_benchmark_measure(optimizer, pipeline, prompt):
+    """
+    Build a measure function that times real generations via benchmark_generation
+
+    Args:
+        optimizer: RTX5070Optimizer
+        pipeline: Loaded SDXL pipeline
+        prompt: Benchmark prompt
+
+    Returns:
+        callable: measure_fn for GenerationAutotuner
+    """
+    warmed_up = set()
+
+    def measure(asset_class, candidate):
+        if not optimizer.apply_pipeline_options(pipeline, candidate):
+            return None
+
+        # Each new shape/attention combination recompiles, so warm it up once
+        shape_key = (candidate['width'], candidate['height'], candidate['attention'])
+        params = optimizer.get_optimal_generation_params((candidate['width'], candidate['height']))
+        params['num_inference_steps'] = candidate['num_inference_steps']
+
+        try:
+            results = optimizer.benchmark_generation(
+                pipeline, prompt, num_runs=1, params=params, warmup=shape_key not in warmed_up
+            )
+        except Exception as e:
+            print(f"Candidate failed ({e}), skipping")
+            return None
+
+        warmed_up.add(shape_key)
+        return results['average_time']
+
+    return measure
+
+if __name__ == "__main__":
+    from .generate_backgrounds import AssetGenerator
+
+    generator = AssetGenerator(use_daemon=False)
+    generator._initialize_pipeline()
+    if isinstance(generator.pipeline, str):
+        print("Autotuning needs a local SDXL pipeline")
+    else:
+        tuner = GenerationAutotuner(make_benchmark_measure(
+            generator.optimizer, generator.pipeline,
+            "Medieval knight in ornate armor, dramatic lighting, highly detailed"
+        ))
+        profile = tuner.tune()
+        save_hardware_profile(profile)
+        print(f"Hardware profile saved for {get_hardware_id()} ({len(tuner.measurements)} runs)")
@@ -0,0 +1,149 @@
+"""
+Card Art Pipeline for Medieval Deck
+Bulk generation of card illustrations and in-hand thumbnails into gen_assets/cards
+"""
+
+import os
+import json
+import time
+from PIL import Image
+from config import CARDS_DIR, CARD_THUMBNAIL_SIZE, CARD_ART_BATCH_SIZE
+from .art_direction import ArtDirection
+
+class CardArtPipeline:
+    """
+    Generates art for every card definition in batches
+    Existing art is skipped with a filesystem check before the pipeline is loaded
+    """
+
+    def __init__(self, asset_generator, output_dir="gen_assets/cards",
+                 batch_size=CARD_ART_BATCH_SIZE):
+        """
+        Initialize card art pipeline
+
+        Args:
+            asset_generator: AssetGenerator used for image generation
+            output_dir: Directory for card art and thumbnails
+            batch_size: Cards generated per pipeline call
+        """
+        self.asset_generator = asset_generator
+        self.output_dir = output_dir
+        self.thumbnail_dir = os.path.join(output_dir, "thumbnails")
+        self.batch_size = max(1, batch_size)
+        self.last_stats = None
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        os.makedirs(self.thumbnail_dir, exist_ok=True)
+
+    @staticmethod
+    def load_card_definitions(path=None):
+        """
+        Load card definitions from JSON
+
+        Args:
+            path: Definitions file (defaults to cards/base_cards.json)
+
+        Returns:
+            list: Card definition dicts
+        """
+        path = path or os.path.join(CARDS_DIR, "base_cards.json")
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data['cards'] if isinstance(data, dict) else data
+
+    def get_card_paths(self, prompt_config):
+        """
+        Get art and thumbnail paths for a card prompt
+
+        Args:
+            prompt_config: Card art prompt configuration
+
+        Returns:
+            tuple: (art_path, thumbnail_path)
+        """
+        filename = f"card_{self.asset_generator._get_cache_filename(prompt_config)}"
+        return (os.path.join(self.output_dir, filename),
+                os.path.join(self.thumbnail_dir, filename))
+
+    def _save_card(self, image, art_path, thumbnail_path):
+        """Write full card art and its in-hand thumbnail"""
+        image.save(art_path, "PNG", optimize=True)
+        thumbnail = image.convert("RGB").resize(CARD_THUMBNAIL_SIZE, Image.LANCZOS)
+        thumbnail.save(thumbnail_path, "PNG", optimize=True)
+
+    def generate_all(self, cards=None):
+        """
+        Generate art for all cards that do not have it yet
+
+        Args:
+            cards: Card definitions (defaults to the base card set)
+
+        Returns:
+            dict: card id -> {'art': path, 'thumbnail': path}
+        """
+        cards = cards if cards is not None else self.load_card_definitions()
+        start_time = time.time()
+        results = {}
+        pending = []
+
+        # Fast skip pass: no pipeline work for cards whose art already exists
+        for card in cards:
+            prompt_config = ArtDirection.get_card_art_prompt(card)
+            art_path, thumbnail_path = self.get_card_paths(prompt_config)
+
+            if os.path.exists(art_path) and os.path.exists(thumbnail_path):
+                results[card['id']] = {'art': art_path, 'thumbnail': thumbnail_path}
+                self.asset_generator._record_metrics(
+                    'generation', os.path.basename(art_path), prompt_config, cache_hit=True
+                )
+            else:
+                pending.append((card, prompt_config, art_path, thumbnail_path))
+
+        skipped = len(results)
+        print(f"Card art: {skipped} cached, {len(pending)} to generate "
+              f"in batches of {self.batch_size}")
+
+        generation_start = time.time()
+        failed = 0
+
+        for i in range(0, len(pending), self.batch_size):
+            batch = pending[i:i + self.batch_size]
+
+            try:
+                images = self.asset_generator.generate_image_batch(
+                    [prompt_config for _, prompt_config, _, _ in batch]
+                )
+            except Exception as e:
+                print(f"Error generating card batch {i // self.batch_size + 1}: {e}")
+                failed += len(batch)
+                continue
+
+            for (card, _, art_path, thumbnail_path), image in zip(batch, images):
+                self._save_card(image, art_path, thumbnail_path)
+                results[card['id']] = {'art': art_path, 'thumbnail': thumbnail_path}
+                print(f"[OK] Card art generated: {card['name']}")
+
+        generated = len(pending) - failed
+        generation_time = time.time() - generation_start
+        cards_per_minute = generated / generation_time * 60 if generated and generation_time > 0 else 0.0
+
+        self.last_stats = {
+            'total': len(cards),
+            'generated': generated,
+            'skipped': skipped,
+            'failed': failed,
+            'elapsed_s': time.time() - start_time,
+            'cards_per_minute': cards_per_minute
+        }
+
+        print(f"Card art complete: {generated} generated, {skipped} skipped, {failed} failed")
+        print(f"Throughput: {cards_per_minute:.1f} cards/min")
+        return results
+
+if __name__ == "__main__":
+    import sys
+    from .generate_backgrounds import AssetGenerator
+
+    # Overnight bake: python -m gen_assets.card_art [--mock]
+    pipeline = CardArtPipeline(AssetGenerator(use_mock='--mock' in sys.argv))
+    pipeline.generate_all()
@@ -0,0 +1,373 @@
+"""
+Generation Daemon for Medieval Deck
+Long-lived localhost server owning one warm, optimized SDXL pipeline
+Any number of clients (game, test scripts, bake jobs) share it instead of
+paying from_pretrained + torch.compile per process
+
+Run with: python -m gen_assets.daemon [--mock] [--port N]
+"""
+
+import io
+import os
+import json
+import base64
+import threading
+import urllib.request
+import urllib.error
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from PIL import Image
+from config import AI_DAEMON_HOST, AI_DAEMON_PORT, AI_GENERATION_TIMEOUT
+from .shared_frames import SharedImageWriter, AsyncImageWriter
+
+def _encode_png(image):
+    """Encode a PIL image as PNG bytes (fast compression for local transfer)"""
+    buffer = io.BytesIO()
+    image.save(buffer, "PNG", compress_level=1)
+    return buffer.getvalue()
+
+def _decode_png(data):
+    """Decode PNG bytes into a loaded PIL image"""
+    image = Image.open(io.BytesIO(data))
+    image.load()
+    return image
+
+class GenerationDaemon:
+    """
+    Localhost HTTP server wrapping an AssetGenerator
+    Requests are served concurrently but generations run one at a time on the GPU
+    """
+
+    def __init__(self, asset_generator, host=AI_DAEMON_HOST, port=AI_DAEMON_PORT, asset_dirs=None):
+        """
+        Initialize daemon
+
+        Args:
+            asset_generator: AssetGenerator owning the pipeline (use_daemon=False)
+            host: Interface to bind (localhost only by default)
+            port: Port to bind (0 picks a free port)
+            asset_dirs: Directories clients may have PNGs saved into
+                        (defaults to the generator's asset directories)
+        """
+        self.asset_generator = asset_generator
+        if asset_dirs is None:
+            asset_dirs = [asset_generator.backgrounds_dir, "gen_assets/heroes", "gen_assets/ui", "gen_assets/cards"]
+        self.asset_dirs = [os.path.realpath(directory) for directory in asset_dirs]
+        self.requests_served = 0
+        self.frame_writer = SharedImageWriter()
+        self.png_writer = AsyncImageWriter()
+        self._generation_lock = threading.Lock()
+        self._thread = None
+        self._stopping = threading.Event()
+
+        self.server = ThreadingHTTPServer((host, port), self._make_handler())
+        self.server.daemon_threads = True
+        self.host, self.port = self.server.server_address[:2]
+
+    @property
+    def backend(self):
+        """Name of the pipeline backend in use"""
+        return self.asset_generator.backend_name
+
+    def warm_up(self):
+        """Load and optimize the pipeline before accepting requests"""
+        self.asset_generator._initialize_pipeline()
+        print(f"Generation daemon warm - backend: {self.backend}")
+
+    def resolve_save_path(self, save_path):
+        """
+        Validate a client-requested PNG path
+
+        Args:
+            save_path: Path sent by the client
+
+        Returns:
+            str: Resolved path inside one of the asset directories
+
+        Raises:
+            PermissionError: Path is not a PNG inside the asset directories
+        """
+        path = os.path.realpath(save_path)
+        if path.lower().endswith(".png"):
+            for directory in self.asset_dirs:
+                if os.path.commonpath([path, directory]) == directory:
+                    return path
+        raise PermissionError(f"Refusing to save outside the asset directories: {save_path}")
+
+    def generate(self, prompt_config):
+        """
+        Generate an image for a client request
+
+        Args:
+            prompt_config: Complete prompt configuration
+
+        Returns:
+            PIL.Image: Generated image
+        """
+        with self._generation_lock:
+            self.asset_generator._initialize_pipeline()
+            image = self.asset_generator._generate_image(prompt_config)
+            self.requests_served += 1
+            return image
+
+    def derive_variant(self, source_image, prompt_config, strength, steps):
+        """
+        Run an img2img variant pass for a client request
+
+        Returns:
+            PIL.Image: Variant image
+        """
+        with self._generation_lock:
+            self.asset_generator._initialize_pipeline()
+            image = self.asset_generator._derive_variant_image(
+                source_image, prompt_config, strength, steps
+            )
+            self.requests_served += 1
+            return image
+
+    def _make_handler(self):
+        """Build the request handler class bound to this daemon"""
+        daemon = self
+
+        class GenerationRequestHandler(BaseHTTPRequestHandler):
+            """HTTP endpoints: GET /health, /progress, POST /generate, /variant, /cancel
+
+            /generate with transfer='shared_memory' answers with a frame descriptor
+            instead of PNG bytes and persists save_path in the background;
+            save_path must be a PNG inside the daemon's asset directories
+            """
+
+            def _send(self, status, body, content_type="application/json"):
+                if isinstance(body, dict):
+                    body = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _read_json(self):
+                length = int(self.headers.get("Content-Length", 0))
+                return json.loads(self.rfile.read(length) or b"{}")
+
+            def do_GET(self):
+                if self.path == "/health":
+                    self._send(200, {
+                        'status': 'ok',
+                        'backend': daemon.backend,
+                        'requests_served': daemon.requests_served
+                    })
+                elif self.path == "/progress":
+                    self._send(200, {'progress': daemon.asset_generator.get_generation_progress()})
+                else:
+                    self._send(404, {'error': f"Unknown endpoint {self.path}"})
+
+            def do_POST(self):
+                try:
+                    request = self._read_json()
+
+                    if self.path == "/generate":
+                        save_path = request.get('save_path')
+                        if save_path:
+                            # Checked before generating so a rejected path costs no GPU time
+                            save_path = daemon.resolve_save_path(save_path)
+                        image = daemon.generate(request['prompt_config'])
+                        if request.get('transfer') == 'shared_memory':
+                            frame = daemon.frame_writer.publish(image)
+                            if save_path:
+                                daemon.png_writer.save(image, save_path)
+                            self._send(200, {'frame': frame})
+                            return
+                    elif self.path == "/variant":
+                        source_image = _decode_png(base64.b64decode(request['source_png']))
+                        image = daemon.derive_variant(
+                            source_image, request['prompt_config'],
+                            request['strength'], request['steps']
+                        )
+                    elif self.path == "/cancel":
+                        self._send(200, {'cancelled': daemon.asset_generator.cancel_generation()})
+                        return
+                    else:
+                        self._send(404, {'error': f"Unknown endpoint {self.path}"})
+                        return
+
+                    self._send(200, _encode_png(image), "image/png")
+
+                except PermissionError as e:
+                    self._send(403, {'error': str(e), 'type': type(e).__name__})
+                except Exception as e:
+                    print(f"Generation daemon request failed: {e}")
+                    self._send(500, {'error': str(e), 'type': type(e).__name__})
+
+            def log_message(self, format, *args):
+                pass  # Keep the daemon console for generation output
+
+        return GenerationRequestHandler
+
+    def _expire_frames(self):
+        """Unlink shared frames no client received within their TTL"""
+        interval = max(0.1, self.frame_writer.ttl / 4)
+        while not self._stopping.wait(interval):
+            self.frame_writer.expire()
+
+    def serve_forever(self):
+        """Serve requests on the calling thread until stopped"""
+        print(f"Generation daemon listening on http://{self.host}:{self.port}")
+        threading.Thread(target=self._expire_frames, name="SharedFrameExpiry", daemon=True).start()
+        self.server.serve_forever()
+
+    def start(self):
+        """Serve requests on a background thread"""
+        self._thread = threading.Thread(
+            target=self.serve_forever, name="GenerationDaemon", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """Stop serving and release the socket"""
+        self.server.shutdown()
+        self.server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._stopping.set()
+        self.png_writer.flush()
+        self.frame_writer.close()
+
+class DaemonClient:
+    """Client for a running GenerationDaemon"""
+
+    def __init__(self, host=AI_DAEMON_HOST, port=AI_DAEMON_PORT, timeout=AI_GENERATION_TIMEOUT):
+        """
+        Initialize client
+
+        Args:
+            host: Daemon host
+            port: Daemon port
+            timeout: Seconds to wait for a generation response
+        """
+        self.base_url = f"http://{host}:{port}"
+        self.timeout = timeout
+
+    def _post(self, path, payload, timeout=None):
+        """POST JSON and return (content_type, body)"""
+        request = urllib.request.Request(
+            f"{self.base_url}{path}",
+            data=json.dumps(payload).encode(),
+            headers={"Content-Type": "application/json"}
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=timeout or self.timeout) as response:
+                return response.headers.get("Content-Type"), response.read()
+        except urllib.error.HTTPError as e:
+            error = json.loads(e.read() or b"{}")
+            raise RuntimeError(f"Daemon error: {error.get('error', e)}")
+
+    def health(self, probe_timeout=0.25):
+        """
+        Query daemon status
+
+        Returns:
+            dict: Health information or None if the daemon is not reachable
+        """
+        try:
+            with urllib.request.urlopen(f"{self.base_url}/health", timeout=probe_timeout) as response:
+                return json.loads(response.read())
+        except Exception:
+            return None
+
+    def is_available(self):
+        """True if a daemon is answering on this address"""
+        return self.health() is not None
+
+    def progress(self, probe_timeout=0.25):
+        """
+        Query progress of the generation running on the daemon
+
+        Returns:
+            dict: GenerationProgress snapshot or None if idle or unreachable
+        """
+        try:
+            with urllib.request.urlopen(f"{self.base_url}/progress", timeout=probe_timeout) as response:
+                return json.loads(response.read())['progress']
+        except Exception:
+            return None
+
+    def generate(self, prompt_config):
+        """
+        Generate an image on the daemon
+
+        Args:
+            prompt_config: Complete prompt configuration
+
+        Returns:
+            PIL.Image: Generated image
+        """
+        _, body = self._post("/generate", {'prompt_config': prompt_config})
+        return _decode_png(body)
+
+    def generate_shared(self, prompt_config, save_path=None):
+        """
+        Generate an image on the daemon and receive it through shared memory
+        Skips the PNG encode/decode round trip; wrap the result with
+        SharedImageReceiver.receive
+
+        Args:
+            prompt_config: Complete prompt configuration
+            save_path: Optional PNG path the daemon persists asynchronously
+
+        Returns:
+            dict: Frame descriptor
+        """
+        _, body = self._post("/generate", {
+            'prompt_config': prompt_config,
+            'transfer': 'shared_memory',
+            'save_path': os.path.abspath(save_path) if save_path else None
+        })
+        return json.loads(body)['frame']
+
+    def derive_variant(self, source_image, prompt_config, strength, steps):
+        """
+        Run an img2img variant pass on the daemon
+
+        Returns:
+            PIL.Image: Variant image
+        """
+        _, body = self._post("/variant", {
+            'source_png': base64.b64encode(_encode_png(source_image)).decode(),
+            'prompt_config': prompt_config,
+            'strength': strength,
+            'steps': steps
+        })
+        return _decode_png(body)
+
+    def cancel(self):
+        """
+        Cancel the generation running on the daemon
+
+        Returns:
+            bool: True if a running generation was signalled
+        """
+        try:
+            _, body = self._post("/cancel", {}, timeout=5)
+            return json.loads(body).get('cancelled', False)
+        except Exception as e:
+            print(f"Warning: Could not reach generation daemon: {e}")
+            return False
+
+if __name__ == "__main__":
+    import sys
+    from .generate_backgrounds import AssetGenerator
+
+    port = AI_DAEMON_PORT
+    if '--port' in sys.argv:
+        port = int(sys.argv[sys.argv.index('--port') + 1])
+
+    daemon = GenerationDaemon(
+        AssetGenerator(use_mock='--mock' in sys.argv, use_daemon=False), port=port
+    )
+    daemon.warm_up()
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        daemon.stop()
+        print("Generation daemon stopped")
@@ -6,13 +6,23 @@ Following art direction for gothic medieval realism with maximum quality
 
 import os
 import torch
-from diffusers import StableDiffusionXLPipeline
+from diffusers import StableDiffusionXLPipeline, StableDiffusionXLImg2ImgPipeline
 from PIL import Image, ImageFilter, ImageEnhance
 import hashlib
+import json
 import time
-from config import AI_SEED, AI_IMAGE_SIZE, BACKGROUNDS_DIR
+from config import (AI_SEED, AI_IMAGE_SIZE, AI_MODEL_ID, BACKGROUNDS_DIR,
+                    AI_GENERATION_TIMEOUT, AI_CHECKPOINT_INTERVAL,
+                    AI_VARIANT_STRENGTH, AI_VARIANT_STEP_SCALE)
 from .art_direction import ArtDirection
 from .rtx_optimizer import RTX5070Optimizer
+from .prompt_cache import PromptEmbeddingCache
+from .scheduler import GenerationScheduler, JobPriority
+from .generation_control import GenerationControl, GenerationCancelled, GenerationTimeout
+from .progress import GenerationProgress, ProgressHistory
+from .daemon import DaemonClient
+from .autotuner import get_asset_class, get_hardware_id
+from .metrics import GenerationMetricsStore
 
 class AssetGenerator:
     """
@@ -20,19 +30,38 @@ class AssetGenerator:
     Optimized for RTX 5070 with consistent styling
     """
     
-    def __init__(self, use_mock=False):
-        """Initialize RTX 5070 optimized SDXL pipeline"""
+    def __init__(self, use_mock=False, use_daemon=True, backgrounds_dir=BACKGROUNDS_DIR):
+        """
+        Initialize RTX 5070 optimized SDXL pipeline
+        
+        Args:
+            use_mock: Generate mock images instead of running SDXL
+            use_daemon: Use a running generation daemon instead of a local pipeline
+            backgrounds_dir: Output directory for backgrounds, variants and their lineage
+        """
         self.use_mock = use_mock
+        self.backgrounds_dir = backgrounds_dir
+        self.daemon_client = DaemonClient() if use_daemon else None
         self.optimizer = RTX5070Optimizer()
         self.device = self.optimizer.device
         self.pipeline = None
+        self.img2img_pipeline = None
+        self.prompt_cache = None
+        self.active_control = None
+        self.progress = None
+        self.progress_history = ProgressHistory()
+        self.metrics = GenerationMetricsStore(hardware_id=get_hardware_id())
+        self.generation_timeout = AI_GENERATION_TIMEOUT
+        self.checkpoint_every = AI_CHECKPOINT_INTERVAL
+        self.checkpoint_dir = "gen_assets/checkpoints"
+        self.scheduler = GenerationScheduler()
         self.cache_dir = "gen_assets"
         
         print(f"AssetGenerator initialized - Device: {self.device}")
         print("Sprint 4: RTX 5070 optimized AI generation with maximum quality")
         
         # Ensure directories exist
-        os.makedirs(BACKGROUNDS_DIR, exist_ok=True)
+        os.makedirs(self.backgrounds_dir, exist_ok=True)
         os.makedirs("gen_assets/heroes", exist_ok=True)
         os.makedirs("gen_assets/ui", exist_ok=True)
         os.makedirs("gen_assets/cards", exist_ok=True)
@@ -44,6 +73,12 @@ class AssetGenerator:
                 print("Using mock pipeline for testing")
                 self.pipeline = "mock"
                 return
+            
+            # A running daemon already holds a warm pipeline
+            if self.daemon_client is not None and self.daemon_client.is_available():
+                print(f"Using generation daemon at {self.daemon_client.base_url}")
+                self.pipeline = "daemon"
+                return
                 
             try:
                 print("Loading RTX 5070 optimized SDXL pipeline...")
@@ -51,7 +86,7 @@ class AssetGenerator:
                 
                 # Load base SDXL model
                 self.pipeline = StableDiffusionXLPipeline.from_pretrained(
-                    "stabilityai/stable-diffusion-xl-base-1.0",
+                    AI_MODEL_ID,
                     torch_dtype=torch.float16 if self.device == "cuda" else torch.float32,
                     use_safetensors=True,
                     variant="fp16" if self.device == "cuda" else None
@@ -62,6 +97,11 @@ class AssetGenerator:
                     self.pipeline = self.optimizer.optimize_pipeline(self.pipeline)
                     self.optimizer.print_system_info()
                 
+                # Text encoder outputs are reused across runs for unchanged prompts
+                self.prompt_cache = PromptEmbeddingCache(
+                    f"{AI_MODEL_ID}:{self.pipeline.dtype}", self._encode_prompt
+                )
+                
                 print("RTX 5070 optimized SDXL pipeline ready!")
                 
             except Exception as e:
@@ -69,6 +109,51 @@ class AssetGenerator:
                 print("Using mock generation for development")
                 self.pipeline = "mock"
     
+    def _encode_prompt(self, prompt):
+        """
+        Run the SDXL text encoders for a single prompt
+        
+        Args:
+            prompt: Prompt text
+            
+        Returns:
+            tuple: (prompt_embeds, pooled_prompt_embeds)
+        """
+        with torch.no_grad():
+            prompt_embeds, _, pooled_prompt_embeds, _ = self.pipeline.encode_prompt(
+                prompt=prompt,
+                device=self.device,
+                num_images_per_prompt=1,
+                do_classifier_free_guidance=False
+            )
+        return prompt_embeds, pooled_prompt_embeds
+    
+    def _get_prompt_kwargs(self, prompt_config):
+        """
+        Build prompt arguments for the pipeline, using cached embeddings when available
+        
+        Args:
+            prompt_config: Prompt configuration dict
+            
+        Returns:
+            dict: Keyword arguments for the pipeline call
+        """
+        if self.prompt_cache is None:
+            return {
+                'prompt': prompt_config['positive'],
+                'negative_prompt': prompt_config['negative']
+            }
+        
+        prompt_embeds, pooled_prompt_embeds = self.prompt_cache.get(prompt_config['positive'])
+        negative_embeds, negative_pooled_embeds = self.prompt_cache.get(prompt_config['negative'])
+        
+        return {
+            'prompt_embeds': prompt_embeds.to(self.device),
+            'pooled_prompt_embeds': pooled_prompt_embeds.to(self.device),
+            'negative_prompt_embeds': negative_embeds.to(self.device),
+            'negative_pooled_prompt_embeds': negative_pooled_embeds.to(self.device)
+        }
+    
     def _get_cache_filename(self, prompt_config):
         """
         Generate consistent filename for caching
@@ -87,11 +172,73 @@ class AssetGenerator:
             prefix = prompt_config['hero']
         elif 'element' in prompt_config:
             prefix = prompt_config['element']
+        elif 'card' in prompt_config:
+            prefix = prompt_config['card']
         else:
             prefix = "asset"
             
         return f"{prefix}_{hash_obj.hexdigest()[:8]}.png"
     
+    @property
+    def backend_name(self):
+        """Name of the pipeline backend in use"""
+        if self.pipeline is None or isinstance(self.pipeline, str):
+            return self.pipeline or "unloaded"
+        return type(self.pipeline).__name__
+    
+    def _get_vram_gb(self):
+        """Allocated VRAM in GB (None on CPU)"""
+        return self.optimizer.get_memory_info().get('vram_allocated_gb')
+    
+    def _record_metrics(self, kind, asset_id, prompt_config, wall_time_s=None, steps=None,
+                        vram_before_gb=None, cache_hit=False, batch_size=1):
+        """
+        Record a generation or cache hit in the metrics store
+        
+        Args:
+            kind: 'generation', 'variant', 'batch' or 'benchmark'
+            asset_id: Asset cache filename
+            prompt_config: Prompt configuration (for the resolution)
+            wall_time_s: Generation wall time
+            steps: Denoising steps if known
+            vram_before_gb: Allocated VRAM before generating
+            cache_hit: True if served from disk
+            batch_size: Images in the same pipeline call
+        """
+        if self.metrics is None:
+            return
+            
+        try:
+            self.metrics.record(
+                kind, asset_id, prompt_config['width'], prompt_config['height'], steps,
+                wall_time_s, vram_before_gb, None if cache_hit else self._get_vram_gb(),
+                self.backend_name, cache_hit, batch_size
+            )
+        except Exception as e:
+            print(f"Warning: Could not record generation metrics: {e}")
+    
+    def _generate_and_record(self, prompt_config, asset_id):
+        """
+        Generate an image and record its wall time, steps and VRAM
+        
+        Args:
+            prompt_config: Complete prompt configuration
+            asset_id: Asset cache filename
+            
+        Returns:
+            PIL.Image: Generated image
+        """
+        vram_before = self._get_vram_gb()
+        self.progress = None
+        start_time = time.time()
+        
+        image = self._generate_image(prompt_config)
+        
+        steps = self.progress.total_steps if self.progress else None
+        self._record_metrics('generation', asset_id, prompt_config,
+                             time.time() - start_time, steps, vram_before)
+        return image
+    
     def _generate_image(self, prompt_config):
         """
         Generate image using SDXL or mock for development
@@ -104,7 +251,7 @@ class AssetGenerator:
         """
         if self.pipeline == "mock":
             # Create mock image for development
-            from PIL import Image, ImageDraw, ImageFont
+            from PIL import ImageDraw, ImageFont
             
             img = Image.new('RGB', (prompt_config['width'], prompt_config['height']), 
                           color=(64, 32, 96))  # Dark gothic color
@@ -123,6 +270,9 @@ class AssetGenerator:
             elif 'element' in prompt_config:
                 text = f"MOCK {prompt_config['element'].upper()}\nUI ELEMENT"
                 desc = prompt_config.get('desc', 'UI element')
+            elif 'card' in prompt_config:
+                text = f"MOCK {prompt_config['card'].upper()}\nCARD ART"
+                desc = prompt_config.get('desc', 'Card art')
             else:
                 text = "MOCK ASSET"
                 desc = "Generated asset"
@@ -141,33 +291,235 @@ class AssetGenerator:
             
             return img
         
+        elif self.pipeline == "daemon":
+            return self.daemon_client.generate(prompt_config)
+        
         else:
             # RTX 5070 optimized SDXL generation
             generator = torch.Generator(device=self.device).manual_seed(prompt_config['seed'])
             
-            # Get optimal parameters for RTX 5070
+            # Get optimal parameters for RTX 5070 (tuned per asset class when profiled)
+            asset_class = get_asset_class(prompt_config)
             optimal_params = self.optimizer.get_optimal_generation_params(
-                (prompt_config['width'], prompt_config['height'])
+                (prompt_config['width'], prompt_config['height']), asset_class
             )
             optimal_params['generator'] = generator
+            total_steps = optimal_params['num_inference_steps']
+            self.optimizer.apply_pipeline_options(
+                self.pipeline, self.optimizer.get_pipeline_options(asset_class)
+            )
+            
+            # Per-job control: timeout, cancellation, resumable checkpoints and progress
+            width, height = optimal_params['width'], optimal_params['height']
+            job_id = os.path.splitext(self._get_cache_filename(prompt_config))[0]
+            job_id = f"{job_id}_{width}x{height}_{total_steps}"
+            progress = GenerationProgress(
+                job_id, total_steps,
+                self.progress_history.expected_seconds_per_step(width, height, total_steps)
+            )
+            control = GenerationControl(
+                job_id,
+                timeout=prompt_config.get('timeout', self.generation_timeout),
+                checkpoint_every=self.checkpoint_every,
+                checkpoint_dir=self.checkpoint_dir,
+                progress=progress
+            )
+            checkpoint = control.load_checkpoint(total_steps)
+            self.active_control = control
+            self.progress = progress
             
             # Generate with optimization context
+            outcome = "failed"
+            try:
+                with self.optimizer.optimized_generation():
+                    start_time = time.time()
+                    
+                    if checkpoint:
+                        image = self._resume_from_checkpoint(
+                            prompt_config, optimal_params, control, checkpoint
+                        )
+                    else:
+                        control.start(total_steps)
+                        image = self.pipeline(
+                            **self._get_prompt_kwargs(prompt_config),
+                            **optimal_params,
+                            callback_on_step_end=control.step_callback,
+                            callback_on_step_end_tensor_inputs=['latents']
+                        ).images[0]
+                    
+                    generation_time = time.time() - start_time
+                    print(f"Generation completed in {generation_time:.2f}s "
+                          f"({progress.steps_per_second:.2f} it/s)")
+                outcome = "completed"
+            except GenerationTimeout:
+                outcome = "timeout"
+                raise
+            except GenerationCancelled:
+                outcome = "cancelled"
+                raise
+            finally:
+                # Close the progress on every path so no frozen bar is left behind
+                self.active_control = None
+                progress.finish(outcome)
+                self.progress_history.record(width, height, total_steps,
+                                             progress.seconds_per_step, outcome)
+            
+            control.clear_checkpoint()
+            
+            # Lower resolution tiers are upscaled to the requested size
+            target_size = (prompt_config['width'], prompt_config['height'])
+            if image.size != target_size:
+                image = image.resize(target_size, Image.LANCZOS)
+            
+            # Apply post-processing for enhanced quality
+            image = self._enhance_image_quality(image)
+            
+            return image
+    
+    def generate_image_batch(self, prompt_configs):
+        """
+        Generate several same-size images in a single pipeline call
+        
+        Args:
+            prompt_configs: Prompt configurations sharing width and height
+            
+        Returns:
+            list: PIL images in the order of prompt_configs
+        """
+        self._initialize_pipeline()
+        
+        if self.pipeline in ("mock", "daemon") or len(prompt_configs) == 1:
+            return [self._generate_and_record(prompt_config, self._get_cache_filename(prompt_config))
+                    for prompt_config in prompt_configs]
+        
+        first = prompt_configs[0]
+        asset_class = get_asset_class(first)
+        optimal_params = self.optimizer.get_optimal_generation_params(
+            (first['width'], first['height']), asset_class
+        )
+        self.optimizer.apply_pipeline_options(
+            self.pipeline, self.optimizer.get_pipeline_options(asset_class)
+        )
+        optimal_params['generator'] = [
+            torch.Generator(device=self.device).manual_seed(prompt_config['seed'])
+            for prompt_config in prompt_configs
+        ]
+        total_steps = optimal_params['num_inference_steps']
+        
+        # Stack per-prompt embeddings (or prompt strings) along the batch dimension
+        prompt_kwargs = [self._get_prompt_kwargs(prompt_config) for prompt_config in prompt_configs]
+        batch_kwargs = {}
+        for key in prompt_kwargs[0]:
+            values = [kwargs[key] for kwargs in prompt_kwargs]
+            batch_kwargs[key] = torch.cat(values) if isinstance(values[0], torch.Tensor) else values
+        
+        timeout = self.generation_timeout * len(prompt_configs) if self.generation_timeout else None
+        control = GenerationControl(f"batch_{len(prompt_configs)}", timeout=timeout)
+        self.active_control = control
+        vram_before = self._get_vram_gb()
+        
+        try:
             with self.optimizer.optimized_generation():
                 start_time = time.time()
+                control.start(total_steps)
                 
-                image = self.pipeline(
-                    prompt=prompt_config['positive'],
-                    negative_prompt=prompt_config['negative'],
-                    **optimal_params
-                ).images[0]
+                images = self.pipeline(
+                    **batch_kwargs,
+                    **optimal_params,
+                    callback_on_step_end=control.step_callback,
+                    callback_on_step_end_tensor_inputs=['latents']
+                ).images
                 
                 generation_time = time.time() - start_time
-                print(f"Generation completed in {generation_time:.2f}s")
-            
-            # Apply post-processing for enhanced quality
-            image = self._enhance_image_quality(image)
+                print(f"Batch of {len(images)} completed in {generation_time:.2f}s")
+        finally:
+            self.active_control = None
+        
+        for prompt_config in prompt_configs:
+            self._record_metrics('batch', self._get_cache_filename(prompt_config), prompt_config,
+                                 generation_time / len(images), total_steps, vram_before,
+                                 batch_size=len(images))
+        
+        target_size = (first['width'], first['height'])
+        return [self._enhance_image_quality(
+                    image if image.size == target_size else image.resize(target_size, Image.LANCZOS)
+                ) for image in images]
+    
+    def _get_img2img_pipeline(self):
+        """
+        Get an img2img pipeline sharing the loaded SDXL components
+        
+        Returns:
+            Pipeline accepting image/strength/denoising_start arguments
+        """
+        if self.img2img_pipeline is None:
+            if hasattr(self.pipeline, 'components'):
+                self.img2img_pipeline = StableDiffusionXLImg2ImgPipeline(**self.pipeline.components)
+            else:
+                # Stand-in pipelines accept img2img arguments directly
+                self.img2img_pipeline = self.pipeline
+        return self.img2img_pipeline
+    
+    def _resume_from_checkpoint(self, prompt_config, optimal_params, control, checkpoint):
+        """
+        Continue an interrupted generation from its checkpointed latents
+        
+        Args:
+            prompt_config: Complete prompt configuration
+            optimal_params: Generation parameters of the original job
+            control: GenerationControl of the job
+            checkpoint: Loaded checkpoint dict
             
-            return image
+        Returns:
+            PIL.Image: Generated image
+        """
+        total_steps = optimal_params['num_inference_steps']
+        params = {key: value for key, value in optimal_params.items()
+                  if key not in ('width', 'height')}
+        
+        pipeline = self._get_img2img_pipeline()
+        control.start(total_steps, step_offset=checkpoint['step'])
+        
+        # denoising_start skips the completed steps without re-noising the latents
+        return pipeline(
+            **self._get_prompt_kwargs(prompt_config),
+            **params,
+            image=checkpoint['latents'].to(self.device, getattr(pipeline, 'dtype', None)),
+            denoising_start=checkpoint['step'] / total_steps,
+            callback_on_step_end=control.step_callback,
+            callback_on_step_end_tensor_inputs=['latents']
+        ).images[0]
+    
+    def get_generation_progress(self):
+        """
+        Progress of the generation currently running (locally or on the daemon)
+        
+        Returns:
+            dict: GenerationProgress snapshot or None if nothing is running
+        """
+        if self.pipeline == "daemon":
+            return self.daemon_client.progress()
+        
+        progress = self.progress
+        if progress is None or progress.finished:
+            return None
+        return progress.snapshot()
+    
+    def cancel_generation(self):
+        """
+        Cancel the generation currently running in the pipeline
+        
+        Returns:
+            bool: True if a running generation was signalled
+        """
+        if self.pipeline == "daemon":
+            return self.daemon_client.cancel()
+        
+        control = self.active_control
+        if control is None:
+            return False
+        control.cancel()
+        return True
     
     def _enhance_image_quality(self, image):
         """
@@ -215,11 +567,12 @@ class AssetGenerator:
         # Get art direction
         prompt_config = ArtDirection.get_hero_background_prompt(hero_type)
         cache_filename = self._get_cache_filename(prompt_config)
-        cache_path = os.path.join(BACKGROUNDS_DIR, cache_filename)
+        cache_path = os.path.join(self.backgrounds_dir, cache_filename)
         
         # Check cache first
         if os.path.exists(cache_path):
             print(f"Using cached background: {cache_filename}")
+            self._record_metrics('generation', cache_filename, prompt_config, cache_hit=True)
             return cache_path
         
         try:
@@ -227,7 +580,7 @@ class AssetGenerator:
             self._initialize_pipeline()
             
             # Generate image
-            image = self._generate_image(prompt_config)
+            image = self._generate_and_record(prompt_config, cache_filename)
             
             # Save with cache filename
             image.save(cache_path, "PNG", optimize=True)
@@ -240,6 +593,40 @@ class AssetGenerator:
             print(f"Error generating background for {hero_type}: {e}")
             return None
     
+    def generate_hero_background_frame(self, hero_type):
+        """
+        Generate background for display as soon as possible
+        With a daemon the pixels arrive through shared memory and the PNG is
+        written in the background; otherwise this is generate_hero_background
+
+        Args:
+            hero_type: 'knight', 'mage', or 'assassin'
+
+        Returns:
+            tuple: (path, frame descriptor or None); path is None if failed.
+                   With a frame the PNG is still being written: it exists once
+                   complete (the save is an atomic rename, see wait_until_saved)
+        """
+        prompt_config = ArtDirection.get_hero_background_prompt(hero_type)
+        cache_path = os.path.join(self.backgrounds_dir, self._get_cache_filename(prompt_config))
+
+        if not os.path.exists(cache_path):
+            self._initialize_pipeline()
+
+            if self.pipeline == "daemon":
+                print(f"Generating background for {hero_type} via shared memory...")
+                try:
+                    start_time = time.time()
+                    frame = self.daemon_client.generate_shared(prompt_config, save_path=cache_path)
+                    self._record_metrics('generation', os.path.basename(cache_path), prompt_config,
+                                         time.time() - start_time)
+                    # Display the frame now; the daemon persists the PNG meanwhile
+                    return cache_path, frame
+                except Exception as e:
+                    print(f"Shared frame transfer failed for {hero_type}: {e}")
+
+        return self.generate_hero_background(hero_type), None
+
     def generate_all_hero_backgrounds(self):
         """
         Generate backgrounds for all three heroes
@@ -263,6 +650,204 @@ class AssetGenerator:
         print(f"Generated {len(backgrounds)}/3 hero backgrounds")
         return backgrounds
     
+    def _get_lineage_path(self):
+        """Path of the variant lineage manifest"""
+        return os.path.join(self.backgrounds_dir, "lineage.json")
+    
+    def _load_lineage(self):
+        """
+        Load variant lineage manifest
+        
+        Returns:
+            dict: Variant filename -> lineage record
+        """
+        lineage_path = self._get_lineage_path()
+        if not os.path.exists(lineage_path):
+            return {}
+        
+        try:
+            with open(lineage_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"Warning: Could not read variant lineage: {e}")
+            return {}
+    
+    def _record_lineage(self, variant_filename, record):
+        """
+        Add a variant to the lineage manifest
+        
+        Args:
+            variant_filename: Cached variant filename
+            record: Lineage record (source, variant, strength, steps, seed)
+        """
+        lineage = self._load_lineage()
+        lineage[variant_filename] = record
+        
+        temp_path = f"{self._get_lineage_path()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(lineage, f, indent=2, sort_keys=True)
+        os.replace(temp_path, self._get_lineage_path())
+    
+    def get_variant_lineage(self, variant_path):
+        """
+        Get the lineage record of a derived background
+        
+        Args:
+            variant_path: Path to a variant background
+            
+        Returns:
+            dict: Lineage record or None if the file is not a known variant
+        """
+        return self._load_lineage().get(os.path.basename(variant_path))
+    
+    def _derive_variant_image(self, source_image, prompt_config, strength, steps):
+        """
+        Run the img2img pass for a variant (or the mock stand-in)
+        
+        Args:
+            source_image: Source PIL image
+            prompt_config: Variant prompt configuration
+            strength: img2img strength
+            steps: Reduced step count
+            
+        Returns:
+            PIL.Image: Variant image
+        """
+        if self.pipeline == "mock":
+            # Tint the source so mock variants stay visibly related to it
+            from PIL import ImageDraw
+            
+            tints = {'combat': (140, 30, 20), 'event': (40, 60, 120), 'shop': (150, 110, 40)}
+            tint = Image.new('RGB', source_image.size, tints.get(prompt_config['variant'], (64, 32, 96)))
+            image = Image.blend(source_image, tint, min(strength, 1.0) * 0.5)
+            
+            draw = ImageDraw.Draw(image)
+            draw.text((50, 120), f"MOCK {prompt_config['variant'].upper()} VARIANT", fill=(220, 220, 220))
+            return image
+        
+        if self.pipeline == "daemon":
+            return self.daemon_client.derive_variant(source_image, prompt_config, strength, steps)
+        
+        generator = torch.Generator(device=self.device).manual_seed(prompt_config['seed'])
+        control = GenerationControl(
+            os.path.splitext(self._get_cache_filename(prompt_config))[0],
+            timeout=prompt_config.get('timeout', self.generation_timeout)
+        )
+        pipeline = self._get_img2img_pipeline()
+        self.active_control = control
+        
+        try:
+            with self.optimizer.optimized_generation():
+                start_time = time.time()
+                control.start(steps)
+                
+                image = pipeline(
+                    **self._get_prompt_kwargs(prompt_config),
+                    image=source_image,
+                    strength=strength,
+                    num_inference_steps=steps,
+                    guidance_scale=7.5,
+                    generator=generator,
+                    callback_on_step_end=control.step_callback,
+                    callback_on_step_end_tensor_inputs=['latents']
+                ).images[0]
+                
+                print(f"Variant generated in {time.time() - start_time:.2f}s")
+        finally:
+            self.active_control = None
+        
+        return self._enhance_image_quality(image)
+    
+    def generate_background_variant(self, hero_type, variant_type, source_path=None,
+                                    strength=AI_VARIANT_STRENGTH):
+        """
+        Derive a themed background from an existing hero background with img2img
+        Much cheaper than txt2img: reduced step count and only strength * steps are run
+        
+        Args:
+            hero_type: Hero whose background is the source
+            variant_type: 'combat', 'event' or 'shop'
+            source_path: Source background (defaults to the hero's cached background)
+            strength: img2img strength (0 keeps the source, 1 ignores it)
+            
+        Returns:
+            str: Path to variant image or None if failed
+        """
+        print(f"Deriving {variant_type} variant from {hero_type} background...")
+        
+        source_path = source_path or self.generate_hero_background(hero_type)
+        if not source_path or not os.path.exists(source_path):
+            print(f"No source background available for {hero_type}")
+            return None
+        
+        prompt_config = ArtDirection.get_background_variant_prompt(hero_type, variant_type)
+        base_steps = self.optimizer.get_optimal_generation_params(
+            (prompt_config['width'], prompt_config['height']), 'background'
+        )['num_inference_steps']
+        steps = max(1, int(base_steps * AI_VARIANT_STEP_SCALE))
+        
+        # Lineage is part of the cache key: a new source produces a new variant
+        source_filename = os.path.basename(source_path)
+        content = f"{source_filename}_{prompt_config['positive']}_{prompt_config['seed']}_{strength}_{steps}"
+        variant_filename = f"{hero_type}_{variant_type}_{hashlib.md5(content.encode()).hexdigest()[:8]}.png"
+        cache_path = os.path.join(self.backgrounds_dir, variant_filename)
+        
+        if os.path.exists(cache_path):
+            print(f"Using cached variant: {variant_filename}")
+            self._record_metrics('variant', variant_filename, prompt_config, steps=steps, cache_hit=True)
+            return cache_path
+        
+        try:
+            self._initialize_pipeline()
+            
+            source_image = Image.open(source_path).convert('RGB')
+            vram_before = self._get_vram_gb()
+            start_time = time.time()
+            image = self._derive_variant_image(source_image, prompt_config, strength, steps)
+            self._record_metrics('variant', variant_filename, prompt_config,
+                                 time.time() - start_time, steps, vram_before)
+            
+            image.save(cache_path, "PNG", optimize=True)
+            self._record_lineage(variant_filename, {
+                'source': source_filename,
+                'hero': hero_type,
+                'variant': variant_type,
+                'strength': strength,
+                'steps': steps,
+                'seed': prompt_config['seed']
+            })
+            print(f"Variant generated and saved: {variant_filename}")
+            print(f"Scene: {prompt_config['scene_desc']}")
+            
+            return cache_path
+            
+        except Exception as e:
+            print(f"Error deriving {variant_type} variant for {hero_type}: {e}")
+            return None
+    
+    def generate_background_variants(self, hero_type, variant_types=('combat', 'event', 'shop')):
+        """
+        Derive several themed backgrounds from one hero background
+        
+        Args:
+            hero_type: Hero whose background is the source
+            variant_types: Variants to derive
+            
+        Returns:
+            dict: Mapping of variant -> path
+        """
+        variants = {}
+        
+        for variant_type in variant_types:
+            path = self.generate_background_variant(hero_type, variant_type)
+            if path:
+                variants[variant_type] = path
+            else:
+                print(f"Failed to derive {variant_type} variant for {hero_type}")
+        
+        print(f"Derived {len(variants)}/{len(variant_types)} variants for {hero_type}")
+        return variants
+    
     def generate_hero_sprite(self, hero_type):
         """
         Generate high-quality hero character sprite with RTX 5070 optimization
@@ -282,13 +867,14 @@ class AssetGenerator:
         # Check cache
         if os.path.exists(cache_path):
             print(f"Using cached sprite: {cache_filename}")
+            self._record_metrics('generation', cache_filename, prompt_config, cache_hit=True)
             return cache_path
         
         try:
             self._initialize_pipeline()
             
             # Generate base sprite
-            image = self._generate_image(prompt_config)
+            image = self._generate_and_record(prompt_config, cache_filename)
             
             # Apply sprite-specific post-processing
             image = self._process_sprite(image, hero_type)
@@ -377,10 +963,18 @@ class AssetGenerator:
             return None
             
         self._initialize_pipeline()
+        if isinstance(self.pipeline, str):
+            print(f"Benchmarking not available with the {self.pipeline} backend")
+            return None
         
         test_prompt = "Medieval knight in ornate armor, dramatic lighting, highly detailed"
         results = self.optimizer.benchmark_generation(self.pipeline, test_prompt)
         
+        params = self.optimizer.get_optimal_generation_params((1024, 1024))
+        for run_time in results['times']:
+            self._record_metrics('benchmark', 'benchmark_1024x1024', params, run_time,
+                                 params['num_inference_steps'])
+        
         # Add system info to results
         results['memory_info'] = self.optimizer.get_memory_info()
         results['device'] = self.device
@@ -406,13 +1000,14 @@ class AssetGenerator:
         # Check cache
         if os.path.exists(cache_path):
             print(f"Using cached UI element: {cache_filename}")
+            self._record_metrics('generation', cache_filename, prompt_config, cache_hit=True)
             return cache_path
         
         try:
             self._initialize_pipeline()
             
             # Generate UI element
-            image = self._generate_image(prompt_config)
+            image = self._generate_and_record(prompt_config, cache_filename)
             
             # Apply UI-specific post-processing
             image = self._process_ui_element(image, element_type)
@@ -489,13 +1084,39 @@ class AssetGenerator:
         print(f"Generated {len(elements)}/{len(ui_elements)} UI elements")
         return elements
     
-    def auto_generate_screen_assets(self, screen_name, required_assets):
+    def generate_asset(self, asset):
+        """
+        Generate a single asset by id
+        
+        Args:
+            asset: Asset id ('hero_<type>_background', 'hero_<type>_sprite',
+                   'hero_<type>_<variant>_variant' or UI element)
+            
+        Returns:
+            str: Path to generated asset or None if failed
+        """
+        if asset.startswith('hero_'):
+            # Hero-related asset
+            hero_type = asset.split('_')[1]
+            if asset.endswith('_variant'):
+                return self.generate_background_variant(hero_type, asset.split('_')[2])
+            elif asset.endswith('_background'):
+                return self.generate_hero_background(hero_type)
+            elif asset.endswith('_sprite'):
+                return self.generate_hero_sprite(hero_type)
+            return None
+        
+        # UI element
+        return self.generate_ui_element(asset)
+    
+    def auto_generate_screen_assets(self, screen_name, required_assets, priorities=None):
         """
         Automatically generate all assets required for a new screen
         
         Args:
             screen_name: Name of the screen
             required_assets: List of asset types needed
+            priorities: Optional mapping of asset -> JobPriority (default VISIBLE)
             
         Returns:
             dict: Generated assets mapping
@@ -503,28 +1124,28 @@ class AssetGenerator:
         print(f"Auto-generating assets for {screen_name} screen...")
         
         generated_assets = {}
+        priorities = priorities or {}
         
-        for asset in required_assets:
-            if asset.startswith('hero_'):
-                # Hero-related asset
-                hero_type = asset.split('_')[1]
-                if asset.endswith('_background'):
-                    path = self.generate_hero_background(hero_type)
-                elif asset.endswith('_sprite'):
-                    path = self.generate_hero_sprite(hero_type)
-                else:
-                    continue
-            else:
-                # UI element
-                path = self.generate_ui_element(asset)
-            
+        def store_result(asset, path):
             if path:
                 generated_assets[asset] = path
                 print(f"[OK] Generated {asset}")
             else:
                 print(f"[FAIL] Failed to generate {asset}")
         
+        # Jobs run in priority order, list order within a priority class
+        scheduler = GenerationScheduler()
+        for asset in required_assets:
+            scheduler.submit(
+                asset,
+                lambda asset=asset: self.generate_asset(asset),
+                priorities.get(asset, JobPriority.VISIBLE),
+                on_complete=lambda path, asset=asset: store_result(asset, path)
+            )
+        scheduler.run_pending()
+        
         print(f"Auto-generation complete: {len(generated_assets)}/{len(required_assets)} assets")
+        scheduler.print_wait_report()
         return generated_assets
     
     def get_background_path(self, hero_type):
@@ -543,7 +1164,7 @@ class AssetGenerator:
         """Remove all cached generated assets"""
         import shutil
         
-        directories = [BACKGROUNDS_DIR, "gen_assets/heroes", "gen_assets/ui", "gen_assets/cards"]
+        directories = [self.backgrounds_dir, "gen_assets/heroes", "gen_assets/ui", "gen_assets/cards"]
         
         for directory in directories:
             if os.path.exists(directory):
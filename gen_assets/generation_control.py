@@ -0,0 +1,154 @@
+"""
+Generation Control for Medieval Deck
+Per-job timeouts, cooperative cancellation and resumable latent checkpoints
+Hooks into the diffusers step-end callback
+"""
+
+import os
+import threading
+import time
+import torch
+
+class GenerationCancelled(Exception):
+    """Raised inside the pipeline when a generation job is cancelled"""
+    pass
+
+class GenerationTimeout(GenerationCancelled):
+    """Raised inside the pipeline when a generation job exceeds its timeout"""
+    pass
+
+class GenerationControl:
+    """
+    Controls a single generation job through the pipeline step callback
+    Checkpoints intermediate latents every N steps so an interrupted job can resume
+    """
+
+    def __init__(self, job_id, timeout=None, checkpoint_every=0,
+                 checkpoint_dir="gen_assets/checkpoints", progress=None):
+        """
+        Initialize job control
+
+        Args:
+            job_id: Stable job identifier (asset, resolution and step count)
+            timeout: Seconds before the job is aborted (None disables)
+            checkpoint_every: Steps between latent checkpoints (0 disables)
+            checkpoint_dir: Directory for checkpoint files
+            progress: Optional GenerationProgress updated every step
+        """
+        self.job_id = job_id
+        self.timeout = timeout
+        self.checkpoint_every = checkpoint_every
+        self.checkpoint_dir = checkpoint_dir
+        self.total_steps = None
+        self.step_offset = 0
+        self.completed_steps = 0
+        self.deadline = None
+        self.progress = progress
+        self._cancel_event = threading.Event()
+
+    @property
+    def checkpoint_path(self):
+        """Path of this job's checkpoint file"""
+        return os.path.join(self.checkpoint_dir, f"{self.job_id}.pt")
+
+    @property
+    def cancelled(self):
+        """True once cancel() has been requested"""
+        return self._cancel_event.is_set()
+
+    def cancel(self):
+        """Request cancellation; the pipeline stops at the end of its current step"""
+        self._cancel_event.set()
+
+    def start(self, total_steps, step_offset=0):
+        """
+        Arm the timeout for a pipeline run
+
+        Args:
+            total_steps: Full denoising step count of the job
+            step_offset: Steps already completed (when resuming)
+        """
+        self.total_steps = total_steps
+        self.step_offset = step_offset
+        self.completed_steps = step_offset
+        if self.timeout:
+            self.deadline = time.perf_counter() + self.timeout
+        if self.progress is not None:
+            self.progress.start(step_offset)
+
+    def load_checkpoint(self, total_steps):
+        """
+        Load the latest checkpoint for this job
+
+        Args:
+            total_steps: Step count the checkpoint must have been written for
+
+        Returns:
+            dict: {'step', 'latents'} or None if no usable checkpoint exists
+        """
+        if not self.checkpoint_every or not os.path.exists(self.checkpoint_path):
+            return None
+
+        try:
+            checkpoint = torch.load(self.checkpoint_path, map_location="cpu")
+        except Exception as e:
+            print(f"Warning: Ignoring unreadable checkpoint {self.checkpoint_path}: {e}")
+            return None
+
+        if checkpoint.get('total_steps') != total_steps or not 0 < checkpoint.get('step', 0) < total_steps:
+            return None
+
+        print(f"Resuming {self.job_id} from step {checkpoint['step']}/{total_steps}")
+        return checkpoint
+
+    def save_checkpoint(self, latents):
+        """
+        Persist intermediate latents
+
+        Args:
+            latents: Current latents tensor
+        """
+        os.makedirs(self.checkpoint_dir, exist_ok=True)
+        temp_path = f"{self.checkpoint_path}.tmp"
+        torch.save({
+            'step': self.completed_steps,
+            'total_steps': self.total_steps,
+            'latents': latents.detach().cpu()
+        }, temp_path)
+        os.replace(temp_path, self.checkpoint_path)
+
+    def clear_checkpoint(self):
+        """Remove the checkpoint once the job has finished"""
+        if os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
+
+    def step_callback(self, pipeline, step, timestep, callback_kwargs):
+        """
+        Diffusers callback_on_step_end hook
+
+        Args:
+            pipeline: Running pipeline
+            step: Step index within this pipeline run
+            timestep: Current timestep
+            callback_kwargs: Tensors requested via callback_on_step_end_tensor_inputs
+
+        Returns:
+            dict: Unchanged callback kwargs
+        """
+        self.completed_steps = self.step_offset + step + 1
+        if self.progress is not None:
+            self.progress.update(self.completed_steps)
+
+        if self.cancelled:
+            raise GenerationCancelled(f"{self.job_id} cancelled at step {self.completed_steps}")
+
+        if (self.checkpoint_every and self.completed_steps % self.checkpoint_every == 0 and
+                self.completed_steps < self.total_steps):
+            self.save_checkpoint(callback_kwargs['latents'])
+
+        if self.deadline is not None and time.perf_counter() > self.deadline:
+            raise GenerationTimeout(
+                f"{self.job_id} exceeded {self.timeout}s at step {self.completed_steps}"
+            )
+
+        return callback_kwargs
@@ -0,0 +1,229 @@
+"""
+Generation Metrics Store for Medieval Deck
+Records every generation, cache hit and benchmark run in a local SQLite database
+so performance regressions (driver/diffusers upgrades) show up over time
+
+Report with: python -m gen_assets.metrics [--asset NAME] [--last N]
+"""
+
+import os
+import sqlite3
+import time
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS generations (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp REAL NOT NULL,
+    kind TEXT NOT NULL,
+    asset_id TEXT NOT NULL,
+    width INTEGER,
+    height INTEGER,
+    steps INTEGER,
+    batch_size INTEGER DEFAULT 1,
+    wall_time_s REAL,
+    vram_before_gb REAL,
+    vram_after_gb REAL,
+    backend TEXT,
+    cache_hit INTEGER NOT NULL DEFAULT 0,
+    hardware_id TEXT,
+    diffusers_version TEXT,
+    torch_version TEXT
+)
+"""
+
+def _get_library_versions():
+    """Versions that performance most depends on"""
+    versions = {}
+    for name in ('diffusers', 'torch'):
+        try:
+            versions[name] = __import__(name).__version__
+        except Exception:
+            versions[name] = None
+    return versions
+
+class GenerationMetricsStore:
+    """
+    SQLite store of generation timings
+    Each call opens its own connection, so any thread can record
+    """
+
+    def __init__(self, path="gen_assets/generation_metrics.db", hardware_id=None):
+        """
+        Initialize store
+
+        Args:
+            path: SQLite database file
+            hardware_id: Device identifier stored with every row
+        """
+        self.path = path
+        self.hardware_id = hardware_id
+        self.versions = _get_library_versions()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(SCHEMA)
+        finally:
+            conn.close()
+
+    def _connect(self):
+        """Open a connection returning rows as dicts"""
+        conn = sqlite3.connect(self.path, timeout=10)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def record(self, kind, asset_id, width=None, height=None, steps=None, wall_time_s=None,
+               vram_before_gb=None, vram_after_gb=None, backend=None, cache_hit=False, batch_size=1):
+        """
+        Record one generation event
+
+        Args:
+            kind: 'generation', 'variant', 'batch' or 'benchmark'
+            asset_id: Asset cache filename or benchmark name
+            width: Requested width
+            height: Requested height
+            steps: Denoising steps (None if unknown, e.g. mock backend)
+            wall_time_s: Wall time of the generation
+            vram_before_gb: Allocated VRAM before generating
+            vram_after_gb: Allocated VRAM after generating
+            backend: Pipeline backend ('mock', 'daemon', pipeline class)
+            cache_hit: True if the asset was served from disk
+            batch_size: Images generated by the same pipeline call
+        """
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT INTO generations (timestamp, kind, asset_id, width, height, steps, "
+                    "batch_size, wall_time_s, vram_before_gb, vram_after_gb, backend, cache_hit, "
+                    "hardware_id, diffusers_version, torch_version) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (time.time(), kind, asset_id, width, height, steps, batch_size, wall_time_s,
+                     vram_before_gb, vram_after_gb, backend, int(bool(cache_hit)),
+                     self.hardware_id, self.versions['diffusers'], self.versions['torch'])
+                )
+        finally:
+            conn.close()
+
+    def query(self, asset_id=None, kind=None, since=None, limit=None):
+        """
+        Fetch recorded events, newest first
+
+        Args:
+            asset_id: Only rows whose asset id contains this text
+            kind: Only rows of this kind
+            since: Only rows after this UNIX timestamp
+            limit: Maximum rows
+
+        Returns:
+            list: Row dicts
+        """
+        clauses, args = [], []
+        if asset_id:
+            clauses.append("asset_id LIKE ?")
+            args.append(f"%{asset_id}%")
+        if kind:
+            clauses.append("kind = ?")
+            args.append(kind)
+        if since is not None:
+            clauses.append("timestamp >= ?")
+            args.append(since)
+
+        sql = "SELECT * FROM generations"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY timestamp DESC, id DESC"
+        if limit:
+            sql += " LIMIT ?"
+            args.append(limit)
+
+        conn = self._connect()
+        try:
+            return [dict(row) for row in conn.execute(sql, args)]
+        finally:
+            conn.close()
+
+    def summary(self, since=None):
+        """
+        Aggregate wall times per configuration and library version
+
+        Args:
+            since: Only rows after this UNIX timestamp
+
+        Returns:
+            list: Dicts with kind, backend, width, height, steps, versions,
+                  count, mean_s, min_s, max_s
+        """
+        sql = ("SELECT kind, backend, width, height, steps, diffusers_version, torch_version, "
+               "COUNT(*) AS count, AVG(wall_time_s) AS mean_s, MIN(wall_time_s) AS min_s, "
+               "MAX(wall_time_s) AS max_s FROM generations WHERE cache_hit = 0")
+        args = []
+        if since is not None:
+            sql += " AND timestamp >= ?"
+            args.append(since)
+        sql += (" GROUP BY kind, backend, width, height, steps, diffusers_version, torch_version"
+                " ORDER BY kind, width * height DESC, steps")
+
+        conn = self._connect()
+        try:
+            return [dict(row) for row in conn.execute(sql, args)]
+        finally:
+            conn.close()
+
+    def get_cache_hit_rate(self):
+        """
+        Fraction of asset requests served from disk
+
+        Returns:
+            float: Hit rate or None if nothing was recorded
+        """
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT COUNT(*), SUM(cache_hit) FROM generations WHERE kind != 'benchmark'"
+            ).fetchone()
+        finally:
+            conn.close()
+        return row[1] / row[0] if row[0] else None
+
+    def print_report(self, asset_id=None, last=20):
+        """
+        Print recent events and aggregated timings
+
+        Args:
+            asset_id: Only show events for matching asset ids
+            last: Number of recent events to list
+        """
+        print("=" * 60)
+        print("GENERATION METRICS")
+        print("=" * 60)
+
+        print(f"Last {last} events:")
+        for row in self.query(asset_id=asset_id, limit=last):
+            when = time.strftime("%Y-%m-%d %H:%M", time.localtime(row['timestamp']))
+            wall = f"{row['wall_time_s']:.2f}s" if row['wall_time_s'] is not None else "-"
+            print(f"  {when} {row['kind']:<10} {row['asset_id']:<32} "
+                  f"{row['width']}x{row['height']} {row['steps'] or '-'} steps {wall} "
+                  f"[{row['backend']}]{' (cache)' if row['cache_hit'] else ''}")
+
+        print("\nTimings by configuration:")
+        for row in self.summary():
+            print(f"  {row['kind']:<10} {row['backend']:<28} {row['width']}x{row['height']} "
+                  f"{row['steps'] or '-'} steps: {row['count']} runs, mean {row['mean_s'] or 0:.2f}s "
+                  f"(min {row['min_s'] or 0:.2f}s, max {row['max_s'] or 0:.2f}s) "
+                  f"diffusers {row['diffusers_version']}")
+
+        hit_rate = self.get_cache_hit_rate()
+        if hit_rate is not None:
+            print(f"\nCache hit rate: {hit_rate * 100:.1f}%")
+        print("=" * 60)
+
+if __name__ == "__main__":
+    import sys
+
+    asset_filter = sys.argv[sys.argv.index('--asset') + 1] if '--asset' in sys.argv else None
+    last = int(sys.argv[sys.argv.index('--last') + 1]) if '--last' in sys.argv else 20
+    GenerationMetricsStore().print_report(asset_id=asset_filter, last=last)
@@ -0,0 +1,171 @@
+"""
+Stand-in SDXL pipeline for Medieval Deck
+Mimics the diffusers call interface on CPU so generation control can be tested without a GPU
+"""
+
+import time
+import torch
+from PIL import Image
+
+class MockPipelineOutput:
+    """Mirror of the diffusers pipeline output"""
+
+    def __init__(self, images):
+        self.images = images
+
+class MockVAE:
+    """Records the VAE decode mode switches"""
+
+    def __init__(self):
+        self.slicing = False
+        self.tiling = False
+
+    def enable_slicing(self):
+        self.slicing = True
+
+    def disable_slicing(self):
+        self.slicing = False
+
+    def enable_tiling(self):
+        self.tiling = True
+
+    def disable_tiling(self):
+        self.tiling = False
+
+class MockSDXLPipeline:
+    """
+    Deterministic CPU stand-in for StableDiffusionXLPipeline
+    Runs a denoising loop over small latents, honouring step-end callbacks,
+    cached prompt embeddings and img2img arguments (image, strength, denoising_start)
+    """
+
+    def __init__(self, step_delay=0.0, fail_at_step=None):
+        """
+        Initialize stand-in pipeline
+
+        Args:
+            step_delay: Seconds to sleep per denoising step
+            fail_at_step: Raise RuntimeError at this step to simulate a crash
+        """
+        self.step_delay = step_delay
+        self.fail_at_step = fail_at_step
+        self.dtype = torch.float32
+        self.calls = []
+        self.encode_calls = 0
+        self.attention = 'sdpa'
+        self.vae = MockVAE()
+
+    def enable_xformers_memory_efficient_attention(self):
+        self.attention = 'xformers'
+
+    def disable_xformers_memory_efficient_attention(self):
+        if self.attention == 'xformers':
+            self.attention = 'sdpa'
+
+    def enable_attention_slicing(self, slice_size=None):
+        self.attention = 'sliced'
+
+    def disable_attention_slicing(self):
+        if self.attention == 'sliced':
+            self.attention = 'sdpa'
+
+    @property
+    def pipeline_options(self):
+        """Active options in the form RTX5070Optimizer.apply_pipeline_options takes"""
+        vae = 'tiled' if self.vae.tiling else 'sliced' if self.vae.slicing else 'full'
+        return {'attention': self.attention, 'vae': vae}
+
+    def encode_prompt(self, prompt, device=None, num_images_per_prompt=1,
+                      do_classifier_free_guidance=True, **kwargs):
+        """
+        Produce deterministic SDXL-shaped embeddings for a prompt
+
+        Returns:
+            tuple: (prompt_embeds, None, pooled_prompt_embeds, None)
+        """
+        self.encode_calls += 1
+        value = float(sum(ord(c) for c in prompt) % 97) / 97
+        prompt_embeds = torch.full((num_images_per_prompt, 77, 2048), value)
+        pooled_prompt_embeds = torch.full((num_images_per_prompt, 1280), value)
+        return prompt_embeds, None, pooled_prompt_embeds, None
+
+    def _initial_latents(self, width, height, generator, image, batch_size):
+        """Build starting latents from a latent tensor, a PIL image or noise"""
+        if isinstance(image, torch.Tensor):
+            return image.clone().float()
+
+        if image is not None:
+            pixels = image.convert("RGB").resize((max(width // 8, 1), max(height // 8, 1)))
+            data = torch.tensor(list(pixels.getdata()), dtype=torch.float32) / 255.0
+            data = data.reshape(pixels.height, pixels.width, 3).permute(2, 0, 1)
+            return torch.cat([data, data.mean(dim=0, keepdim=True)]).unsqueeze(0)
+
+        shape = (1, 4, max(height // 8, 1), max(width // 8, 1))
+        generators = generator if isinstance(generator, list) else [generator] * batch_size
+        return torch.cat([torch.randn(shape, generator=g) for g in generators])
+
+    def _decode(self, latents, width, height):
+        """Turn a single latent into a PIL image of the requested size"""
+        rgb = latents[:3]
+        rgb = (rgb - rgb.min()) / (rgb.max() - rgb.min() + 1e-6)
+        data = (rgb.permute(1, 2, 0) * 255).to(torch.uint8)
+        image = Image.frombytes("RGB", (data.shape[1], data.shape[0]), bytes(data.flatten().tolist()))
+        return image.resize((width, height))
+
+    def __call__(self, prompt=None, negative_prompt=None, num_inference_steps=30,
+                 width=None, height=None, generator=None, image=None, strength=None,
+                 denoising_start=None, callback_on_step_end=None,
+                 callback_on_step_end_tensor_inputs=None, **kwargs):
+        """
+        Run the stand-in denoising loop
+
+        Returns:
+            MockPipelineOutput: Output with one PIL image per batch item
+        """
+        if isinstance(image, torch.Tensor):
+            height, width = image.shape[2] * 8, image.shape[3] * 8
+        elif image is not None:
+            width, height = width or image.width, height or image.height
+        width, height = width or 1024, height or 1024
+
+        if isinstance(prompt, list):
+            batch_size = len(prompt)
+        elif 'prompt_embeds' in kwargs:
+            batch_size = kwargs['prompt_embeds'].shape[0]
+        else:
+            batch_size = 1
+
+        latents = self._initial_latents(width, height, generator, image, batch_size)
+
+        # Same step selection rules as the diffusers img2img pipeline
+        if denoising_start is not None:
+            start_step = int(round(denoising_start * num_inference_steps))
+        elif image is not None and strength is not None:
+            start_step = num_inference_steps - int(num_inference_steps * strength)
+        else:
+            start_step = 0
+
+        self.calls.append({
+            'steps': num_inference_steps,
+            'start_step': start_step,
+            'width': width,
+            'height': height,
+            'batch_size': latents.shape[0],
+            'img2img': image is not None,
+            'used_embeddings': 'prompt_embeds' in kwargs
+        })
+
+        for i, step in enumerate(range(start_step, num_inference_steps)):
+            if self.fail_at_step is not None and step == self.fail_at_step:
+                raise RuntimeError(f"Simulated pipeline failure at step {step}")
+
+            if self.step_delay:
+                time.sleep(self.step_delay)
+            latents = latents * 0.9 + 0.01 * step
+
+            if callback_on_step_end is not None:
+                timestep = 1000 - step * 1000 // num_inference_steps
+                callback_kwargs = callback_on_step_end(self, i, timestep, {'latents': latents})
+                latents = callback_kwargs.get('latents', latents)
+
+        return MockPipelineOutput([self._decode(latent, width, height) for latent in latents])
@@ -0,0 +1,277 @@
+"""
+Generation Progress for Medieval Deck
+Step-level progress, throughput and ETA for running generations
+Per-(resolution, steps) timing history so ETAs come from real measurements
+"""
+
+import os
+import json
+import threading
+import time
+
+class ProgressHistory:
+    """
+    Measured seconds-per-step keyed by resolution and step count
+    Stored as JSON next to the other generated assets
+    """
+
+    def __init__(self, path="gen_assets/generation_history.json", smoothing=0.3):
+        """
+        Initialize history
+
+        Args:
+            path: JSON file holding the measurements
+            smoothing: Weight of the newest run in the moving average
+        """
+        self.path = path
+        self.smoothing = smoothing
+        self._lock = threading.Lock()
+        self.entries = self._load()
+
+    @staticmethod
+    def get_key(width, height, steps):
+        """History key for a generation shape"""
+        return f"{width}x{height}_{steps}"
+
+    def _load(self):
+        """Load saved measurements, ignoring a missing or corrupt file"""
+        if not os.path.exists(self.path):
+            return {}
+
+        try:
+            with open(self.path, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Warning: Ignoring unreadable generation history {self.path}: {e}")
+            return {}
+
+    def _save(self):
+        """Write measurements atomically"""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump(self.entries, f, indent=2)
+        os.replace(temp_path, self.path)
+
+    def record(self, width, height, steps, seconds_per_step, outcome="completed"):
+        """
+        Add a finished generation's outcome and measured step time
+
+        Args:
+            width: Image width
+            height: Image height
+            steps: Total denoising steps
+            seconds_per_step: Measured mean step time (None if no step finished)
+            outcome: 'completed', 'cancelled', 'timeout' or 'failed'
+        """
+        key = self.get_key(width, height, steps)
+        with self._lock:
+            entry = self.entries.setdefault(key, {'seconds_per_step': None, 'runs': 0})
+            if seconds_per_step is not None:
+                if entry['seconds_per_step'] is None:
+                    entry['seconds_per_step'] = seconds_per_step
+                else:
+                    entry['seconds_per_step'] += self.smoothing * (seconds_per_step - entry['seconds_per_step'])
+            entry['runs'] += 1
+            outcomes = entry.setdefault('outcomes', {})
+            outcomes[outcome] = outcomes.get(outcome, 0) + 1
+            self._save()
+
+    def expected_seconds_per_step(self, width, height, steps):
+        """
+        Expected step time for a generation shape
+
+        Returns:
+            float: Seconds per step or None if this shape was never measured
+        """
+        entry = self.entries.get(self.get_key(width, height, steps))
+        return entry['seconds_per_step'] if entry else None
+
+class GenerationProgress:
+    """
+    Live progress of one generation, updated from the pipeline step callback
+    Read from other threads through snapshot()
+    """
+
+    def __init__(self, job_id, total_steps, expected_seconds_per_step=None):
+        """
+        Initialize progress
+
+        Args:
+            job_id: Job identifier
+            total_steps: Full denoising step count
+            expected_seconds_per_step: Historical step time for the ETA before
+                                       the first step has been measured
+        """
+        self.job_id = job_id
+        self.total_steps = total_steps
+        self.expected_seconds_per_step = expected_seconds_per_step
+        self.completed_steps = 0
+        self.start_step = 0
+        self.start_time = None
+        self.last_step_time = None
+        self.finished = False
+        self.outcome = None
+        self._next_report = 0.25
+
+    def start(self, step_offset=0):
+        """
+        Start timing a pipeline run
+
+        Args:
+            step_offset: Steps already completed (when resuming)
+        """
+        self.start_step = step_offset
+        self.completed_steps = step_offset
+        self.start_time = time.perf_counter()
+        self.last_step_time = self.start_time
+
+    def update(self, completed_steps):
+        """
+        Record a finished step
+
+        Args:
+            completed_steps: Steps completed so far, including resumed ones
+        """
+        self.completed_steps = completed_steps
+        self.last_step_time = time.perf_counter()
+
+        if self.fraction >= self._next_report and self.fraction < 1.0:
+            eta = self.eta_seconds
+            eta_text = f"{eta:.1f}s" if eta is not None else "unknown"
+            print(f"{self.job_id}: step {completed_steps}/{self.total_steps} "
+                  f"({self.steps_per_second:.2f} it/s, ETA {eta_text})")
+            while self._next_report <= self.fraction:
+                self._next_report += 0.25
+
+    def finish(self, outcome="completed"):
+        """
+        Mark the generation over
+
+        Args:
+            outcome: 'completed', 'cancelled', 'timeout' or 'failed'
+        """
+        self.outcome = outcome
+        self.finished = True
+
+    @property
+    def fraction(self):
+        """Completed fraction in [0, 1]"""
+        return min(1.0, self.completed_steps / self.total_steps) if self.total_steps else 0.0
+
+    @property
+    def measured_steps(self):
+        """Steps timed in this run"""
+        return self.completed_steps - self.start_step
+
+    @property
+    def steps_per_second(self):
+        """Measured throughput, falling back to history before the first step"""
+        if self.measured_steps > 0 and self.last_step_time > self.start_time:
+            return self.measured_steps / (self.last_step_time - self.start_time)
+        if self.expected_seconds_per_step:
+            return 1.0 / self.expected_seconds_per_step
+        return 0.0
+
+    @property
+    def seconds_per_step(self):
+        """Mean measured step time or None before the first step"""
+        if self.measured_steps > 0:
+            return (self.last_step_time - self.start_time) / self.measured_steps
+        return None
+
+    @property
+    def eta_seconds(self):
+        """Estimated seconds until completion or None if unknown"""
+        rate = self.steps_per_second
+        if not rate:
+            return None
+        remaining = (self.total_steps - self.completed_steps) / rate
+        # Time already spent on the current step counts against it
+        if self.last_step_time is not None:
+            remaining -= time.perf_counter() - self.last_step_time
+        return max(0.0, remaining)
+
+    @property
+    def seconds_since_last_step(self):
+        """Time since the last step finished; a large value means a stalled job"""
+        if self.last_step_time is None:
+            return None
+        return time.perf_counter() - self.last_step_time
+
+    def snapshot(self):
+        """
+        Thread-safe copy of the current progress
+
+        Returns:
+            dict: job_id, step, total_steps, fraction, steps_per_second,
+                  eta_s, seconds_since_last_step, finished, outcome
+        """
+        return {
+            'job_id': self.job_id,
+            'step': self.completed_steps,
+            'total_steps': self.total_steps,
+            'fraction': self.fraction,
+            'steps_per_second': self.steps_per_second,
+            'eta_s': self.eta_seconds,
+            'seconds_since_last_step': self.seconds_since_last_step,
+            'finished': self.finished,
+            'outcome': self.outcome
+        }
+
+class ProgressPoller:
+    """
+    Polls a progress source on a background thread and keeps the last snapshot
+    Readers on the game loop never wait on the source (e.g. an HTTP round trip
+    to the generation daemon)
+    """
+
+    def __init__(self, source, interval=0.5):
+        """
+        Initialize poller
+
+        Args:
+            source: Callable returning a progress snapshot or None
+            interval: Seconds between polls
+        """
+        self.source = source
+        self.interval = interval
+        self.snapshot = None
+        self._stopping = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Start polling in the background"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="ProgressPoller", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=None):
+        """
+        Stop polling; the last snapshot is cleared
+
+        Args:
+            timeout: Seconds to wait for the poll in flight
+        """
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self.snapshot = None
+
+    def _run(self):
+        """Poll loop"""
+        while not self._stopping.is_set():
+            try:
+                snapshot = self.source()
+            except Exception as e:
+                print(f"Warning: Could not poll generation progress: {e}")
+                snapshot = None
+            if not self._stopping.is_set():
+                self.snapshot = snapshot
+            self._stopping.wait(self.interval)
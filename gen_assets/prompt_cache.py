@@ -0,0 +1,121 @@
+"""
+Prompt Embedding Cache for Medieval Deck
+Stores SDXL text encoder outputs so unchanged prompts skip the CLIP encoders
+"""
+
+import os
+import hashlib
+import torch
+
+class PromptEmbeddingCache:
+    """
+    Memory + disk cache of SDXL prompt embeddings
+    Keyed by (encoder id, prompt text) so a model change never reuses stale embeddings
+    """
+
+    def __init__(self, encoder_id, encode_fn, cache_dir="gen_assets/embeddings"):
+        """
+        Initialize embedding cache
+
+        Args:
+            encoder_id: Identifier of the text encoders (model id and dtype)
+            encode_fn: Callable prompt -> (prompt_embeds, pooled_prompt_embeds)
+            cache_dir: Directory for persisted embeddings
+        """
+        self.encoder_id = encoder_id
+        self.encode_fn = encode_fn
+        self.cache_dir = cache_dir
+        self.memory = {}
+        self.stats = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0}
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _get_cache_path(self, prompt):
+        """
+        Get disk location for a prompt's embeddings
+
+        Args:
+            prompt: Prompt text
+
+        Returns:
+            str: Cache file path
+        """
+        content = f"{self.encoder_id}\n{prompt}"
+        hash_obj = hashlib.md5(content.encode())
+        return os.path.join(self.cache_dir, f"embeds_{hash_obj.hexdigest()[:16]}.pt")
+
+    def _load_from_disk(self, prompt, cache_path):
+        """
+        Load persisted embeddings, ignoring entries written for another key
+
+        Args:
+            prompt: Prompt text
+            cache_path: Cache file path
+
+        Returns:
+            tuple: (prompt_embeds, pooled_prompt_embeds) or None
+        """
+        try:
+            data = torch.load(cache_path, map_location="cpu")
+            if data.get('encoder_id') != self.encoder_id or data.get('prompt') != prompt:
+                return None
+            return data['prompt_embeds'], data['pooled_prompt_embeds']
+        except Exception as e:
+            print(f"Warning: Could not read cached embeddings {cache_path}: {e}")
+            return None
+
+    def get(self, prompt):
+        """
+        Get embeddings for a prompt, encoding only on a full cache miss
+
+        Args:
+            prompt: Prompt text
+
+        Returns:
+            tuple: (prompt_embeds, pooled_prompt_embeds) on CPU
+        """
+        key = (self.encoder_id, prompt)
+
+        if key in self.memory:
+            self.stats['memory_hits'] += 1
+            return self.memory[key]
+
+        cache_path = self._get_cache_path(prompt)
+        embeddings = None
+
+        if os.path.exists(cache_path):
+            embeddings = self._load_from_disk(prompt, cache_path)
+            if embeddings is not None:
+                self.stats['disk_hits'] += 1
+
+        if embeddings is None:
+            self.stats['misses'] += 1
+            prompt_embeds, pooled_prompt_embeds = self.encode_fn(prompt)
+            embeddings = (prompt_embeds.detach().cpu(), pooled_prompt_embeds.detach().cpu())
+
+            try:
+                torch.save({
+                    'encoder_id': self.encoder_id,
+                    'prompt': prompt,
+                    'prompt_embeds': embeddings[0],
+                    'pooled_prompt_embeds': embeddings[1]
+                }, cache_path)
+            except Exception as e:
+                print(f"Warning: Could not persist embeddings: {e}")
+
+        self.memory[key] = embeddings
+        return embeddings
+
+    def clear(self, include_disk=False):
+        """
+        Drop cached embeddings
+
+        Args:
+            include_disk: Also delete persisted embedding files
+        """
+        self.memory.clear()
+
+        if include_disk and os.path.exists(self.cache_dir):
+            for filename in os.listdir(self.cache_dir):
+                if filename.startswith("embeds_") and filename.endswith(".pt"):
+                    os.remove(os.path.join(self.cache_dir, filename))
@@ -8,6 +8,7 @@ import gc
 import psutil
 import os
 from contextlib import contextmanager
+from .autotuner import load_hardware_profile, get_tier_resolution, get_hardware_id
 
 class RTX5070Optimizer:
     """
@@ -20,6 +21,9 @@ class RTX5070Optimizer:
         self.device = self._detect_optimal_device()
         self.memory_fraction = 0.95  # Use 95% of VRAM for generation
         self.compile_mode = "reduce-overhead"  # Best for RTX 5070
+        self.applied_pipeline_options = None
+        # Options optimize_pipeline leaves active; untuned asset classes run with these
+        self.default_pipeline_options = {'attention': 'sdpa', 'vae': 'full'}
         
         print(f"RTX 5070 Optimizer initialized")
         print(f"Device: {self.device}")
@@ -28,6 +32,12 @@ class RTX5070Optimizer:
         self._setup_memory_management()
         self._setup_cuda_optimizations()
         
+        # Tuned parameters from python -m gen_assets.autotuner replace the defaults
+        self.hardware_profile = load_hardware_profile()
+        if self.hardware_profile:
+            print(f"Hardware profile loaded for {get_hardware_id()}: "
+                  f"{', '.join(sorted(self.hardware_profile))}")
+        
     def _detect_optimal_device(self):
         """Detect and configure optimal device settings"""
         if not torch.cuda.is_available():
@@ -88,9 +98,11 @@ class RTX5070Optimizer:
             Optimized pipeline
         """
         if self.device == "cpu":
+            self.applied_pipeline_options = dict(self.default_pipeline_options)
             return pipeline
             
         print("Applying RTX 5070 optimizations to pipeline...")
+        defaults = {'attention': 'sliced', 'vae': 'full'}
         
         # Move to GPU with optimal dtype
         pipeline = pipeline.to("cuda", torch_dtype=torch.float16)
@@ -103,6 +115,7 @@ class RTX5070Optimizer:
         try:
             # Enable xformers if available (major speedup)
             pipeline.enable_xformers_memory_efficient_attention()
+            defaults['attention'] = 'xformers'
             print("xFormers memory efficient attention enabled")
         except Exception as e:
             print(f"xFormers not available: {e}")
@@ -122,21 +135,27 @@ class RTX5070Optimizer:
         try:
             pipeline.vae.enable_slicing()
             pipeline.vae.enable_tiling()
+            defaults['vae'] = 'tiled'
             print("VAE slicing and tiling enabled")
         except Exception as e:
             print(f"VAE optimizations failed: {e}")
         
+        self.default_pipeline_options = defaults
+        self.applied_pipeline_options = dict(defaults)
         return pipeline
     
-    def get_optimal_generation_params(self, resolution=(3440, 1440)):
+    def get_optimal_generation_params(self, resolution=(3440, 1440), asset_class=None):
         """
         Get optimal generation parameters for RTX 5070
         
         Args:
             resolution: Target resolution tuple
+            asset_class: 'background', 'sprite', 'ui' or 'card' to use the
+                         tuned hardware profile
             
         Returns:
-            dict: Optimal parameters
+            dict: Optimal parameters (width/height may be a lower resolution
+                  tier to upscale from)
         """
         width, height = resolution
         
@@ -149,6 +168,14 @@ class RTX5070Optimizer:
             'generator': None,  # Will be set per generation
         }
         
+        tuned = self.hardware_profile.get(asset_class) if self.hardware_profile else None
+        if tuned:
+            params['num_inference_steps'] = tuned['num_inference_steps']
+            params['width'], params['height'] = get_tier_resolution(
+                resolution, tuned['resolution_scale']
+            )
+            return params
+        
         # Adjust based on resolution for memory optimization
         total_pixels = width * height
         if total_pixels > 3840 * 2160:  # 4K+
@@ -158,6 +185,68 @@ class RTX5070Optimizer:
             
         return params
     
+    def get_pipeline_options(self, asset_class):
+        """
+        Get tuned attention/VAE options for an asset class
+        
+        Args:
+            asset_class: Asset class name
+            
+        Returns:
+            dict: {'attention', 'vae'}; the pipeline defaults if the class is not
+                  tuned, so options tuned for another class do not carry over
+        """
+        tuned = self.hardware_profile.get(asset_class) if self.hardware_profile else None
+        if not tuned:
+            return dict(self.default_pipeline_options)
+        return {'attention': tuned['attention'], 'vae': tuned['vae']}
+    
+    def apply_pipeline_options(self, pipeline, options):
+        """
+        Switch the pipeline's attention implementation and VAE decode mode
+        
+        Args:
+            pipeline: Diffusers SDXL pipeline
+            options: {'attention': 'sdpa'|'xformers'|'sliced', 'vae': 'full'|'sliced'|'tiled'}
+            
+        Returns:
+            bool: True if the options are active, False if unsupported
+        """
+        if not options:
+            return True
+            
+        options = {'attention': options['attention'], 'vae': options['vae']}
+        if options == self.applied_pipeline_options:
+            return True
+        
+        try:
+            if options['attention'] == 'xformers':
+                pipeline.disable_attention_slicing()
+                pipeline.enable_xformers_memory_efficient_attention()
+            else:
+                pipeline.disable_xformers_memory_efficient_attention()
+                if options['attention'] == 'sliced':
+                    pipeline.enable_attention_slicing(1)
+                else:
+                    pipeline.disable_attention_slicing()  # PyTorch SDPA
+            
+            if options['vae'] == 'full':
+                pipeline.vae.disable_slicing()
+                pipeline.vae.disable_tiling()
+            elif options['vae'] == 'sliced':
+                pipeline.vae.enable_slicing()
+                pipeline.vae.disable_tiling()
+            else:
+                pipeline.vae.enable_slicing()
+                pipeline.vae.enable_tiling()
+        except Exception as e:
+            print(f"Pipeline options {options} not supported: {e}")
+            self.applied_pipeline_options = None
+            return False
+        
+        self.applied_pipeline_options = options
+        return True
+    
     @contextmanager
     def optimized_generation(self):
         """Context manager for optimized generation session"""
@@ -181,7 +270,7 @@ class RTX5070Optimizer:
                 vram_after = torch.cuda.memory_allocated() / 1024**3
                 print(f"VRAM after cleanup: {vram_after:.2f} GB")
     
-    def benchmark_generation(self, pipeline, prompt, num_runs=3):
+    def benchmark_generation(self, pipeline, prompt, num_runs=3, params=None, warmup=True):
         """
         Benchmark generation performance
         
@@ -189,6 +278,8 @@ class RTX5070Optimizer:
             pipeline: SDXL pipeline
             prompt: Test prompt
             num_runs: Number of benchmark runs
+            params: Generation parameters (defaults to the 1024x1024 settings)
+            warmup: Run an untimed generation first
             
         Returns:
             dict: Benchmark results
@@ -197,12 +288,14 @@ class RTX5070Optimizer:
         
         print(f"Benchmarking generation performance ({num_runs} runs)...")
         
-        params = self.get_optimal_generation_params((1024, 1024))  # Standard test size
+        if params is None:
+            params = self.get_optimal_generation_params((1024, 1024))  # Standard test size
         times = []
         
         # Warm-up run
-        with self.optimized_generation():
-            _ = pipeline(prompt, **params)
+        if warmup:
+            with self.optimized_generation():
+                _ = pipeline(prompt, **params)
         
         # Benchmark runs
         for i in range(num_runs):
@@ -0,0 +1,320 @@
+"""
+Generation Scheduler for Medieval Deck
+Priority queue for asset generation so on-screen assets are generated first
+"""
+
+import heapq
+import itertools
+import threading
+import time
+
+class JobPriority:
+    """Priority classes for generation jobs (lower value runs first)"""
+    VISIBLE = 0       # Needed by the frame the player is looking at
+    NEXT = 1          # Needed by the next likely screen or navigation step
+    SPECULATIVE = 2   # May be needed later
+
+    NAMES = {
+        VISIBLE: "visible",
+        NEXT: "next",
+        SPECULATIVE: "speculative"
+    }
+
+class GenerationJob:
+    """Single queued generation task with timing information"""
+
+    def __init__(self, job_id, task, priority, on_complete=None, on_cancel=None):
+        """
+        Initialize job
+
+        Args:
+            job_id: Unique job identifier (usually the asset id)
+            task: Callable producing the job result
+            priority: JobPriority class
+            on_complete: Optional callable receiving the result
+            on_cancel: Optional callable interrupting the task while it runs
+        """
+        self.job_id = job_id
+        self.task = task
+        self.priority = priority
+        self.on_complete = on_complete
+        self.on_cancel = on_cancel
+        self.cancelled = False
+        self.submitted_at = time.perf_counter()
+        self.started_at = None
+        self.finished_at = None
+        self.result = None
+        self.error = None
+        self.done = threading.Event()
+
+    @property
+    def wait_time(self):
+        """Seconds spent queued before the job started"""
+        if self.started_at is None:
+            return time.perf_counter() - self.submitted_at
+        return self.started_at - self.submitted_at
+
+class GenerationScheduler:
+    """
+    Priority scheduler for generation jobs
+    Jobs run one at a time (single pipeline) in priority order, FIFO within a class
+    """
+
+    def __init__(self):
+        """Initialize empty scheduler"""
+        self.jobs = {}
+        self._heap = []
+        self._entries = {}
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._run_lock = threading.Lock()
+        self._worker = None
+        self._running = False
+        self.wait_times = {priority: [] for priority in JobPriority.NAMES}
+
+    def _push(self, job, priority):
+        """Queue a heap entry for the job (caller holds the lock)"""
+        job.priority = priority
+        entry = [priority, next(self._counter), job]
+        self._entries[job.job_id] = entry
+        heapq.heappush(self._heap, entry)
+
+    def submit(self, job_id, task, priority=JobPriority.SPECULATIVE, on_complete=None,
+               on_cancel=None):
+        """
+        Queue a generation job
+
+        Args:
+            job_id: Unique job identifier
+            task: Callable producing the result
+            priority: JobPriority class
+            on_complete: Optional callable receiving the result
+            on_cancel: Optional callable interrupting the task while it runs
+
+        Returns:
+            GenerationJob: Queued (or already known) job
+        """
+        with self._condition:
+            existing = self.jobs.get(job_id)
+            if existing is not None:
+                # Resubmitting a pending job can only raise its priority
+                if job_id in self._entries and priority < existing.priority:
+                    self._bump_locked(job_id, priority)
+                return existing
+
+            job = GenerationJob(job_id, task, priority, on_complete, on_cancel)
+            self.jobs[job_id] = job
+            self._push(job, priority)
+            self._condition.notify()
+            return job
+
+    def _bump_locked(self, job_id, priority):
+        """Re-queue a pending job with a new priority (caller holds the lock)"""
+        entry = self._entries[job_id]
+        job = entry[2]
+        entry[2] = None  # Lazy deletion of the old heap entry
+        self._push(job, priority)
+
+    def bump(self, job_id, priority):
+        """
+        Change the priority of a pending job
+
+        Args:
+            job_id: Job identifier
+            priority: New JobPriority class
+
+        Returns:
+            bool: True if the job is pending with the new priority
+        """
+        with self._condition:
+            entry = self._entries.get(job_id)
+            if entry is None:
+                return False
+
+            if entry[0] != priority:
+                self._bump_locked(job_id, priority)
+                self._condition.notify()
+            return True
+
+    def cancel(self, job_id):
+        """
+        Cancel a queued or running job
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            bool: True if the job was dequeued or asked to stop
+        """
+        with self._condition:
+            job = self.jobs.get(job_id)
+            if job is None or job.done.is_set():
+                return False
+
+            job.cancelled = True
+            entry = self._entries.pop(job_id, None)
+            if entry is not None:
+                entry[2] = None
+                job.done.set()
+                return True
+
+        if job.started_at is not None and job.on_cancel:
+            job.on_cancel()
+            return True
+        return False
+
+    def _pop_next(self, max_priority=None):
+        """Pop the highest priority job (caller holds the lock)"""
+        while self._heap:
+            priority, _, job = self._heap[0]
+            if job is None:
+                heapq.heappop(self._heap)
+                continue
+            if max_priority is not None and priority > max_priority:
+                return None
+
+            heapq.heappop(self._heap)
+            del self._entries[job.job_id]
+            return job
+        return None
+
+    def _run_job(self, job):
+        """Execute a job and record its queue wait time"""
+        with self._run_lock:
+            if job.cancelled:
+                job.done.set()
+                return
+            job.started_at = time.perf_counter()
+            try:
+                job.result = job.task()
+            except Exception as e:
+                job.error = e
+                print(f"Generation job {job.job_id} failed: {e}")
+            job.finished_at = time.perf_counter()
+
+        try:
+            with self._condition:
+                self.wait_times[job.priority].append(job.wait_time)
+
+            if job.error is None and job.on_complete:
+                try:
+                    job.on_complete(job.result)
+                except Exception as e:
+                    print(f"Generation job {job.job_id} completion callback failed: {e}")
+        finally:
+            job.done.set()
+
+    def run_pending(self, max_priority=None):
+        """
+        Run queued jobs on the calling thread
+
+        Args:
+            max_priority: Only run jobs at or above this class (None runs all)
+
+        Returns:
+            int: Number of jobs executed
+        """
+        executed = 0
+        while True:
+            with self._condition:
+                job = self._pop_next(max_priority)
+            if job is None:
+                return executed
+            self._run_job(job)
+            executed += 1
+
+    def start(self):
+        """Start background worker draining the queue"""
+        if self._worker is not None and self._worker.is_alive():
+            return
+
+        self._running = True
+        self._worker = threading.Thread(
+            target=self._worker_loop, name="GenerationScheduler", daemon=True
+        )
+        self._worker.start()
+
+    def stop(self, timeout=None):
+        """
+        Stop background worker after its current job
+
+        Args:
+            timeout: Seconds to wait for the worker to exit
+        """
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+
+        if self._worker is not None:
+            self._worker.join(timeout)
+            self._worker = None
+
+    def _worker_loop(self):
+        """Background worker: run jobs as they arrive, report when idle"""
+        ran_since_report = False
+        while True:
+            with self._condition:
+                job = self._pop_next()
+                while job is None and self._running:
+                    if ran_since_report:
+                        break
+                    self._condition.wait()
+                    job = self._pop_next()
+                if not self._running:
+                    if job is not None:
+                        self._push(job, job.priority)
+                    return
+
+            if job is None:
+                self.print_wait_report()
+                ran_since_report = False
+                continue
+
+            self._run_job(job)
+            ran_since_report = True
+
+    def wait(self, job_id, timeout=None):
+        """
+        Block until a job finishes
+
+        Args:
+            job_id: Job identifier
+            timeout: Maximum seconds to wait
+
+        Returns:
+            Job result, or None if unknown, failed or still running
+        """
+        job = self.jobs.get(job_id)
+        if job is None or not job.done.wait(timeout):
+            return None
+        return job.result
+
+    def pending_count(self):
+        """Number of queued jobs not yet started"""
+        with self._condition:
+            return len(self._entries)
+
+    def get_wait_stats(self):
+        """
+        Get queue wait statistics per priority class
+
+        Returns:
+            dict: Class name -> count, mean and max wait in milliseconds
+        """
+        with self._condition:
+            stats = {}
+            for priority, name in JobPriority.NAMES.items():
+                waits = self.wait_times[priority]
+                stats[name] = {
+                    'count': len(waits),
+                    'mean_ms': sum(waits) / len(waits) * 1000 if waits else 0.0,
+                    'max_ms': max(waits) * 1000 if waits else 0.0
+                }
+            return stats
+
+    def print_wait_report(self):
+        """Print queue wait time per priority class"""
+        print("Generation queue wait times:")
+        for name, stats in self.get_wait_stats().items():
+            print(f"  {name:<12} jobs: {stats['count']:3d}  "
+                  f"mean: {stats['mean_ms']:8.1f}ms  max: {stats['max_ms']:8.1f}ms")
@@ -0,0 +1,230 @@
+"""
+Shared Frame Transfer for Medieval Deck
+Zero-copy handoff of generated RGBA pixels from a generator worker to the game
+The worker writes pixels into multiprocessing.shared_memory, the game wraps the
+buffer with pygame.image.frombuffer, and the PNG is persisted asynchronously
+"""
+
+import os
+import queue
+import threading
+import time
+from multiprocessing import shared_memory, resource_tracker
+import pygame
+from config import AI_SHARED_FRAME_TTL
+
+def _create_segment(size):
+    """
+    Create a shared memory segment owned by whoever unlinks it (the receiver,
+    or the writer once the frame expires)
+
+    Args:
+        size: Segment size in bytes
+
+    Returns:
+        SharedMemory: New segment
+    """
+    try:
+        return shared_memory.SharedMemory(create=True, size=size, track=False)  # Python 3.13+
+    except TypeError:
+        segment = shared_memory.SharedMemory(create=True, size=size)
+        if os.name == "posix":
+            # Otherwise the worker's resource tracker unlinks it when the worker exits
+            resource_tracker.unregister(segment._name, "shared_memory")
+        return segment
+
+def _destroy_segment(segment):
+    """Close and unlink a segment, tolerating one the other side already unlinked"""
+    segment.close()
+    try:
+        segment.unlink()
+    except FileNotFoundError:
+        pass
+
+class SharedImageWriter:
+    """
+    Worker side: publishes PIL images as RGBA pixels in shared memory
+    Published segments stay open for ttl seconds so they survive until the
+    receiver attaches (on Windows a segment is destroyed when its last handle
+    closes), then they are unlinked so frames nobody received do not leak.
+    Unlinking an attached segment only removes its name; the receiver's
+    mapping stays valid until it releases the frame.
+    """
+
+    def __init__(self, ttl=AI_SHARED_FRAME_TTL):
+        """
+        Initialize writer
+
+        Args:
+            ttl: Seconds a published frame is kept for its receiver
+        """
+        self.ttl = ttl
+        self._frames = {}  # Segment name -> (segment, expiry time)
+        self._lock = threading.Lock()
+
+    def publish(self, image):
+        """
+        Copy an image into a new shared memory segment
+
+        Args:
+            image: PIL image
+
+        Returns:
+            dict: Frame descriptor (name, width, height, format)
+        """
+        rgba = image.convert("RGBA")
+        pixels = rgba.tobytes()
+
+        self.expire()
+        segment = _create_segment(len(pixels))
+        segment.buf[:len(pixels)] = pixels
+        with self._lock:
+            self._frames[segment.name] = (segment, time.monotonic() + self.ttl)
+
+        return {
+            'name': segment.name,
+            'width': rgba.width,
+            'height': rgba.height,
+            'format': "RGBA"
+        }
+
+    @property
+    def outstanding(self):
+        """Number of published frames not yet expired"""
+        return len(self._frames)
+
+    def expire(self, now=None):
+        """
+        Unlink frames published more than ttl seconds ago
+
+        Args:
+            now: time.monotonic() value to expire against (defaults to now)
+
+        Returns:
+            int: Number of frames unlinked
+        """
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            expired = [name for name, (_, expiry) in self._frames.items() if expiry <= now]
+            segments = [self._frames.pop(name)[0] for name in expired]
+        for segment in segments:
+            _destroy_segment(segment)
+        return len(segments)
+
+    def close(self):
+        """Unlink every outstanding frame (on shutdown)"""
+        self.expire(now=float("inf"))
+
+class SharedImageReceiver:
+    """
+    Game side: wraps shared memory frames as pygame surfaces without copying
+    The receiver owns the segments and unlinks them on release
+    """
+
+    def __init__(self):
+        """Initialize receiver"""
+        self._segments = {}
+
+    def receive(self, descriptor):
+        """
+        Wrap a published frame as a surface sharing the segment's memory
+
+        Args:
+            descriptor: Frame descriptor from SharedImageWriter.publish
+
+        Returns:
+            pygame.Surface: Surface backed by the shared buffer
+
+        Raises:
+            FileNotFoundError: The frame expired before it was received
+        """
+        name = descriptor['name']
+        segment = self._segments.get(name)
+        if segment is None:
+            segment = shared_memory.SharedMemory(name=name)
+            self._segments[name] = segment
+
+        size = (descriptor['width'], descriptor['height'])
+        length = size[0] * size[1] * 4
+        return pygame.image.frombuffer(segment.buf[:length], size, descriptor['format'])
+
+    def release(self, name):
+        """
+        Unmap and destroy a frame; surfaces wrapping it must be dropped first
+
+        Args:
+            name: Segment name from the descriptor
+        """
+        segment = self._segments.pop(name, None)
+        if segment is None:
+            return
+
+        try:
+            _destroy_segment(segment)
+        except BufferError:
+            print(f"Warning: Frame {name} still referenced by a surface")
+            self._segments[name] = segment
+
+    def release_all(self):
+        """Release every received frame"""
+        for name in list(self._segments):
+            self.release(name)
+
+class AsyncImageWriter:
+    """Persists images to PNG on a background thread so delivery is not delayed"""
+
+    def __init__(self):
+        """Initialize writer thread"""
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="AsyncImageWriter", daemon=True)
+        self._thread.start()
+
+    def save(self, image, path):
+        """
+        Queue an image for saving
+
+        Args:
+            image: PIL image
+            path: Destination PNG path
+        """
+        self._queue.put((image, path))
+
+    def _run(self):
+        """Writer loop: atomic save so readers never see a partial PNG"""
+        while True:
+            image, path = self._queue.get()
+            try:
+                directory = os.path.dirname(path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                temp_path = f"{path}.tmp"
+                image.save(temp_path, "PNG", optimize=True)
+                os.replace(temp_path, path)
+            except Exception as e:
+                print(f"Warning: Could not persist {path}: {e}")
+            finally:
+                self._queue.task_done()
+
+    def flush(self):
+        """Block until all queued images are written"""
+        self._queue.join()
+
+def wait_until_saved(path, timeout=AI_SHARED_FRAME_TTL, poll_interval=0.05):
+    """
+    Wait for an AsyncImageWriter (possibly in another process) to persist a PNG
+    Saves are atomic renames, so the file existing means it is complete
+
+    Args:
+        path: PNG path being written
+        timeout: Seconds to wait
+        poll_interval: Seconds between checks
+
+    Returns:
+        bool: True once the file exists, False on timeout
+    """
+    deadline = time.monotonic() + timeout
+    while not os.path.exists(path):
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(poll_interval)
+    return True
@@ -12,9 +12,22 @@ Sprint 4 Implementation:
 import pygame
 import sys
 import os
-from config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, BLACK, WHITE
+import time
+from config import (SCREEN_WIDTH, SCREEN_HEIGHT, FPS, UPDATE_RATE, MAX_CATCHUP_STEPS,
+                    VSYNC, RENDER_BACKEND, BLACK, WHITE)
 from screens.menu import MenuScreen
 from screens.selection import SelectionScreen
+from screens.base import ScreenRegistry
+from utils.profiler import FrameProfiler, OVERLAY_RECT
+from utils.render_scale import RenderScaler, TexturePresenter
+from utils.canvas import SurfaceCanvas, TextureCanvas
+from utils.event_bus import EventBus
+from utils.input_replay import InputRecorder, InputReplay
+from utils.asset_manager import AssetManager
+from utils.transitions import TransitionEngine
+from utils.effects import Effects
+from utils.particles import ParticleSystem
+from utils.fonts import FontRegistry
 
 class GameState:
     """Game state constants for state machine"""
@@ -27,12 +40,23 @@ class GameState:
 class MedievalDeck:
     """Main game class handling the core game loop and state management"""
     
-    def __init__(self):
-        """Initialize pygame and game systems"""
+    def __init__(self, use_mock=None, render_backend=RENDER_BACKEND):
+        """
+        Initialize pygame and game systems
+        
+        Args:
+            use_mock: Generate assets with the mock pipeline (None decides from the command line)
+            render_backend: "surface" (software blits) or "texture" (SDL2 renderer)
+        """
         pygame.init()
+        self.use_mock = use_mock
+        
+        # Fonts shared by all screens, one instance per (face, size)
+        self.fonts = FontRegistry()
         
-        # Initialize display with ultrawide resolution
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        # Initialize display with ultrawide resolution (None on the texture backend)
+        self.texture_canvas = None
+        self.screen = self._create_display(render_backend)
         pygame.display.set_caption("Medieval Deck - Sprint 4")
         
         # Initialize game systems
@@ -41,33 +65,113 @@ class MedievalDeck:
         self.current_state = GameState.MENU
         self.selected_hero = None
         
-        # Initialize screen objects
-        self.menu_screen = MenuScreen(self)
-        self.selection_screen = SelectionScreen(self)
-        self.screens = {
-            GameState.MENU: self.menu_screen,
-            GameState.SELECTION: self.selection_screen
-        }
+        # Fixed-timestep simulation: update() always advances by update_dt seconds
+        self.update_dt = 1.0 / UPDATE_RATE
+        self.accumulator = 0.0
+        self.render_alpha = 1.0
+        
+        # Frame profiler overlay, toggled with F3
+        self.profiler = FrameProfiler(fonts=self.fonts)
+        self.overlay_backing = None  # Frame pixels under the overlay, restored after flip
+        
+        # Screens draw in native coordinates into a possibly smaller internal frame,
+        # or into the SDL2 renderer which scales on the GPU
+        if self.texture_canvas:
+            self.render_scaler = TexturePresenter(self.texture_canvas)
+        else:
+            self.render_scaler = RenderScaler(self.screen)
+        
+        # Global hotkeys; screens dispatch their own events through their buses
+        self.event_bus = EventBus()
+        self.event_bus.subscribe(pygame.QUIT, self._handle_quit)
+        self.event_bus.subscribe(pygame.KEYDOWN, self._handle_hotkey)
         
-        # Initialize font system for fallback rendering
-        pygame.font.init()
-        self.title_font = pygame.font.Font(None, 120)
-        self.subtitle_font = pygame.font.Font(None, 60)
-        self.text_font = pygame.font.Font(None, 40)
+        # Input recording / deterministic replay (--record / --replay)
+        self.input_recorder = None
+        self.input_replay = None
+        
+        # Fades/crossfades between screens, reusing one snapshot buffer
+        self.transitions = TransitionEngine()
+        
+        # Image surfaces shared by all screens, within ASSET_BUDGET_MB
+        self.assets = AssetManager()
+        
+        # Baked glows, panels and gradients shared by all screens
+        self.effects = Effects()
+        
+        # Combat feedback particles, drawn over whichever screen is active
+        self.particles = ParticleSystem()
+        
+        # Screens are built when first entered
+        self.screens = ScreenRegistry({
+            GameState.MENU: lambda: MenuScreen(self),
+            GameState.SELECTION: lambda: SelectionScreen(self)
+        })
+        self.screens.activate(self.current_state).on_enter(None)
+        
+        # Fonts for fallback rendering
+        self.title_font = self.fonts.get(120)
+        self.subtitle_font = self.fonts.get(60)
+        self.text_font = self.fonts.get(40)
         
         print(f"Medieval Deck initialized - Resolution: {SCREEN_WIDTH}x{SCREEN_HEIGHT}")
         print("Sprint 4: RTX 5070 optimized AI generation with hero sprites ready")
         
+    @property
+    def menu_screen(self):
+        """Menu screen (built on first access)"""
+        return self.screens[GameState.MENU]
+        
+    @property
+    def selection_screen(self):
+        """Selection screen (built on first access)"""
+        return self.screens[GameState.SELECTION]
+        
+    def _create_display(self, render_backend):
+        """
+        Create the display, vsynced if configured and supported
+        
+        Args:
+            render_backend: "texture" tries an SDL2 renderer window first
+            
+        Returns:
+            Display surface, or None when rendering through textures
+        """
+        if render_backend == "texture":
+            try:
+                self.texture_canvas = TextureCanvas.create(
+                    (SCREEN_WIDTH, SCREEN_HEIGHT), "Medieval Deck - Sprint 4", vsync=VSYNC
+                )
+                print("Rendering through SDL2 textures")
+                return None
+            except (ImportError, pygame.error) as e:
+                print(f"Texture renderer not available, using software surfaces: {e}")
+                
+        if VSYNC:
+            try:
+                # SDL only honours vsync on renderer-backed displays
+                return pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SCALED, vsync=1)
+            except pygame.error as e:
+                print(f"VSync not available: {e}")
+        return pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        
     def handle_events(self):
         """Handle pygame events and delegate to current screen"""
-        events = pygame.event.get()
+        if self.input_replay is not None:
+            pygame.event.pump()  # Keep the window responsive; live input is ignored
+            events = self.input_replay.next_events()
+        else:
+            events = pygame.event.get()
+            
+        if self.input_recorder is not None:
+            self.input_recorder.record_events(events)
+            
+        events = self.event_bus.coalesce(events)
         
         for event in events:
-            if event.type == pygame.QUIT:
-                self.running = False
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    self.running = False
+            if hasattr(event, 'pos'):
+                event.pos = self.render_scaler.to_logical(event.pos)
+        self.event_bus.dispatch(events)
         
         # Delegate events to current screen
         if self.current_state in self.screens:
@@ -75,6 +179,19 @@ class MedievalDeck:
             if new_state:
                 self.change_state(new_state)
                     
+    def _handle_quit(self, event):
+        """Window close request"""
+        self.running = False
+        
+    def _handle_hotkey(self, event):
+        """Global keys: ESC quits, F3 toggles the profiler, F4 dumps it to CSV"""
+        if event.key == pygame.K_ESCAPE:
+            self.running = False
+        elif event.key == pygame.K_F3:
+            self.profiler.toggle()
+        elif event.key == pygame.K_F4 and self.profiler.enabled:
+            self.profiler.dump_csv()
+            
     def change_state(self, new_state):
         """
         Change game state with validation
@@ -88,47 +205,176 @@ class MedievalDeck:
             return
         
         print(f"State change: {self.current_state} -> {new_state}")
+        previous_state = self.current_state
+        if previous_state in self.screens.loaded:
+            self.screens.loaded[previous_state].on_exit(new_state)
+        
+        # Snapshot the outgoing frame before the new screen draws over it
+        self.transitions.start(self.render_scaler.canvas)
+        self.particles.clear()
+            
         self.current_state = new_state
+        if new_state in self.screens:
+            self.screens.activate(new_state).on_enter(previous_state)
         
     def update(self):
         """Update game logic based on current state"""
         if self.current_state in self.screens:
             self.screens[self.current_state].update()
+        self.particles.update(self.update_dt)
+        self.transitions.update(self.update_dt)
+        
+    def advance(self, frame_time):
+        """
+        Run the fixed simulation steps covered by a frame
+        
+        Args:
+            frame_time: Real seconds since the previous frame
+            
+        Returns:
+            float: Interpolation alpha between the last two simulation states
+        """
+        self.accumulator += frame_time
         
-    def render(self):
-        """Render current game state"""
-        self.screen.fill(BLACK)
+        steps = 0
+        while self.accumulator >= self.update_dt and steps < MAX_CATCHUP_STEPS:
+            self.update()
+            self.accumulator -= self.update_dt
+            steps += 1
+            
+        # After a long hitch drop the backlog instead of spiralling into more updates
+        if self.accumulator >= self.update_dt:
+            self.accumulator %= self.update_dt
+            
+        return self.accumulator / self.update_dt
+        
+    def render(self, alpha=1.0):
+        """
+        Render current game state
+        
+        Args:
+            alpha: Interpolation factor between the previous and current
+                   simulation step, exposed to screens as render_alpha
+        """
+        self.render_alpha = alpha
+        canvas = self.render_scaler.canvas
+        canvas.fill(BLACK)
         
         # Delegate rendering to current screen
         if self.current_state in self.screens:
-            self.screens[self.current_state].render(self.screen)
+            self.screens[self.current_state].render(canvas)
         else:
             # Fallback rendering for unimplemented screens
-            self.render_fallback()
+            self.render_fallback(canvas)
+        self.profiler.mark(f"render.{self.current_state}")
+        
+        if self.particles.count:
+            self.particles.draw(canvas)
+            self.profiler.mark("particles")
+        
+        if self.transitions.active:
+            self.transitions.draw(canvas)
+            self.profiler.mark("transition")
+        
+        self.render_scaler.present()
+        self.profiler.mark("present")
+        
+        covered = None
+        if self.profiler.enabled:
+            covered = self._save_overlay_area()
+            self.profiler.draw(self.render_scaler.overlay)
+            self.profiler.mark("overlay")
             
-        pygame.display.flip()
+        self.render_scaler.flip()
+        if covered is not None:
+            # Put the frame back so a transition snapshot never contains the overlay
+            covered.surface.blit(self.overlay_backing, OVERLAY_RECT.topleft)
+        self.profiler.mark("flip")
+        
+    def _save_overlay_area(self):
+        """
+        Copy the frame pixels under the profiler overlay when it draws into the frame buffer
         
-    def render_fallback(self):
+        Returns:
+            SurfaceCanvas: Overlay canvas whose area was saved, None if the
+                           overlay does not share the frame buffer
+        """
+        overlay, canvas = self.render_scaler.overlay, self.render_scaler.canvas
+        if not (isinstance(overlay, SurfaceCanvas) and overlay.surface is getattr(canvas, 'surface', None)):
+            return None
+        if self.overlay_backing is None:
+            self.overlay_backing = pygame.Surface(OVERLAY_RECT.size).convert(overlay.surface)
+        self.overlay_backing.blit(overlay.surface, (0, 0), OVERLAY_RECT)
+        return overlay
+        
+    def render_fallback(self, canvas):
         """Fallback rendering for unimplemented screens"""
         title = self.title_font.render(f"SCREEN: {self.current_state.upper()}", True, WHITE)
         title_rect = title.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//4))
-        self.screen.blit(title, title_rect)
+        canvas.blit(title, title_rect)
         
         info = self.text_font.render("Coming in future sprint", True, WHITE)
         info_rect = info.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2))
-        self.screen.blit(info, info_rect)
+        canvas.blit(info, info_rect)
+        
+    def run_frame(self, frame_time):
+        """
+        Process one frame: events, fixed simulation steps and rendering
+        
+        Args:
+            frame_time: Real seconds since the previous frame
+                        (replaced by the recorded one during replay)
+        """
+        if self.input_replay is not None:
+            frame_time = self.input_replay.begin_frame()
+            if frame_time is None:
+                self.running = False
+                return
+        if self.input_recorder is not None:
+            self.input_recorder.begin_frame(frame_time)
+            
+        self.profiler.begin_frame()
+        
+        self.handle_events()
+        self.profiler.mark("events")
+        
+        alpha = self.advance(frame_time)
+        self.profiler.mark("update")
+        
+        self.render(alpha)
         
     def run(self):
-        """Main game loop"""
+        """Main game loop: fixed-timestep simulation, rendering at its own rate"""
+        previous_time = time.perf_counter()
+        
         while self.running:
-            self.handle_events()
-            self.update()
-            self.render()
-            self.clock.tick(FPS)
+            current_time = time.perf_counter()
+            frame_time = current_time - previous_time
+            previous_time = current_time
+            
+            self.run_frame(frame_time)
+            self.render_scaler.record_frame((time.perf_counter() - current_time) * 1000)
             
+            if FPS and not (self.input_replay and self.input_replay.fast):
+                self.clock.tick(FPS)
+            self.profiler.mark("wait")
+            self.profiler.end_frame()
+            
+            if self.input_replay is not None and self.input_replay.finished:
+                self.running = False
+                
+        if self.input_recorder is not None:
+            self.input_recorder.close()
+        if self.input_replay is not None:
+            self.input_replay.print_summary()
+        self.assets.print_stats()
         pygame.quit()
-        sys.exit()
 
 if __name__ == "__main__":
     game = MedievalDeck()
-    game.run()
\ No newline at end of file
+    if '--record' in sys.argv:
+        game.input_recorder = InputRecorder(sys.argv[sys.argv.index('--record') + 1])
+    elif '--replay' in sys.argv:
+        game.input_replay = InputReplay(sys.argv[sys.argv.index('--replay') + 1], fast='--fast' in sys.argv)
+    game.run()
+    sys.exit()
\ No newline at end of file
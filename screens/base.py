@@ -0,0 +1,99 @@
+"""
+Screen lifecycle for Medieval Deck
+Screens are built on first use and release their heavy resources while inactive
+"""
+
+from collections import OrderedDict
+from config import SCREEN_CACHE_SIZE
+
+class BaseScreen:
+    """
+    Lifecycle hooks called by the game state machine
+    Subclasses override what they need; the defaults do nothing
+    """
+
+    def on_enter(self, previous_state):
+        """
+        Screen becomes active
+
+        Args:
+            previous_state: State that was active before, None at startup
+        """
+
+    def on_exit(self, next_state):
+        """
+        Screen stops being active
+
+        Args:
+            next_state: State being switched to
+        """
+
+    def suspend(self):
+        """Release heavy resources (full-screen surfaces, frames); on_enter restores them"""
+
+    def unload(self):
+        """Screen is dropped from the registry; stop workers and free everything"""
+        self.suspend()
+
+class ScreenRegistry:
+    """
+    Maps game states to screens, constructing each on first access
+    Inactive screens are suspended and at most max_loaded stay instantiated
+    """
+
+    def __init__(self, factories, max_loaded=SCREEN_CACHE_SIZE):
+        """
+        Initialize registry
+
+        Args:
+            factories: dict state -> callable returning the screen
+            max_loaded: Screens kept instantiated, least recently active dropped first
+        """
+        self.factories = dict(factories)
+        self.max_loaded = max_loaded
+        self.loaded = OrderedDict()
+
+    def __contains__(self, state):
+        return state in self.factories
+
+    def __getitem__(self, state):
+        screen = self.loaded.get(state)
+        if screen is None:
+            screen = self.factories[state]()
+            self.loaded[state] = screen
+            print(f"Screen loaded: {state}")
+        return screen
+
+    def register(self, state, factory):
+        """
+        Add a screen factory
+
+        Args:
+            state: Game state constant
+            factory: Callable returning the screen
+        """
+        self.factories[state] = factory
+
+    def activate(self, state):
+        """
+        Make a screen the active one: suspend the others and drop the oldest
+
+        Args:
+            state: State becoming active
+
+        Returns:
+            Screen for state
+        """
+        screen = self[state]
+        self.loaded.move_to_end(state)
+
+        for other_state, other in list(self.loaded.items()):
+            if other_state != state and hasattr(other, 'suspend'):
+                other.suspend()
+
+        while len(self.loaded) > max(1, self.max_loaded):
+            old_state, old_screen = self.loaded.popitem(last=False)
+            if hasattr(old_screen, 'unload'):
+                old_screen.unload()
+            print(f"Screen unloaded: {old_state}")
+        return screen
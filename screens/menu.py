@@ -3,12 +3,16 @@ Main menu screen for Medieval Deck
 Sprint 2 Implementation: Interactive menu with navigation buttons
 """
 
-import pygame
 import sys
 from config import SCREEN_WIDTH, SCREEN_HEIGHT, WHITE, BLACK, GOLD
 from utils.buttons import MenuButtonSet
+from utils.canvas import as_canvas
+from utils.event_bus import EventBus
+from utils.widgets import Layer, Label, ButtonSetWidget
+from utils.fonts import FontRegistry
+from screens.base import BaseScreen
 
-class MenuScreen:
+class MenuScreen(BaseScreen):
     """
     Main menu screen with title and navigation buttons
     Optimized for 3440x1440 ultrawide resolution
@@ -23,30 +27,48 @@ class MenuScreen:
         """
         self.game = game_instance
         
-        # Initialize fonts optimized for ultrawide
-        self.title_font = pygame.font.Font(None, 140)
-        self.subtitle_font = pygame.font.Font(None, 70)
-        self.button_font = pygame.font.Font(None, 50)
+        # Initialize fonts optimized for ultrawide (shared through the game's registry)
+        self.fonts = getattr(game_instance, 'fonts', None) or FontRegistry()
+        self.title_font = self.fonts.get(140)
+        self.subtitle_font = self.fonts.get(70)
+        self.button_font = self.fonts.get(50)
         
         # Create button set
         self.button_set = MenuButtonSet(SCREEN_WIDTH, SCREEN_HEIGHT, self.button_font)
         self._setup_buttons()
         
-        # Pre-render title elements
-        self.title_surface = self.title_font.render("MEDIEVAL DECK", True, GOLD)
-        self.title_rect = self.title_surface.get_rect(
-            center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//4)
-        )
+        # Buttons receive events through the bus
+        self.event_bus = EventBus()
+        self.button_set.subscribe(self.event_bus)
         
-        self.subtitle_surface = self.subtitle_font.render(
-            "A Roguelike Deckbuilder with AI-Generated Assets", True, WHITE
-        )
-        self.subtitle_rect = self.subtitle_surface.get_rect(
-            center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//4 + 100)
-        )
+        # Layout declared once; frames composite the cached widgets
+        self.layout = self._build_layout()
         
         print("Menu screen initialized for Sprint 2")
         
+    def _build_layout(self):
+        """Declare the menu widget tree: title, buttons, sprint indicator and controls"""
+        layout = Layer()
+        layout.add(Label((SCREEN_WIDTH//2, SCREEN_HEIGHT//4), "MEDIEVAL DECK",
+                         self.title_font, GOLD, anchor="center"))
+        layout.add(Label((SCREEN_WIDTH//2, SCREEN_HEIGHT//4 + 100),
+                         "A Roguelike Deckbuilder with AI-Generated Assets",
+                         self.subtitle_font, WHITE, anchor="center"))
+        layout.add(Label((SCREEN_WIDTH - 50, SCREEN_HEIGHT - 50), "Sprint 2: Menu System",
+                         self.button_font, WHITE, anchor="bottomright"))
+        layout.add(ButtonSetWidget(self.button_set))
+        
+        # Controls info
+        controls_text = [
+            "Mouse: Navigate and click buttons",
+            "ESC: Quit game",
+            "F3: Frame profiler"
+        ]
+        y_offset = SCREEN_HEIGHT - 190
+        for i, text in enumerate(controls_text):
+            layout.add(Label((50, y_offset + i * 40), text, self.button_font, WHITE, anchor="bottomleft"))
+        return layout
+        
     def _setup_buttons(self):
         """Setup menu buttons with callbacks"""
         self.button_set.add_button("JOGAR", self._start_game)
@@ -76,7 +98,7 @@ class MenuScreen:
         Returns:
             str: Next game state or None
         """
-        clicked_button = self.button_set.handle_events(events)
+        clicked_button = self.event_bus.dispatch(events)
         
         if clicked_button == "JOGAR":
             return "selection"  # Transition to hero selection
@@ -94,31 +116,12 @@ class MenuScreen:
         Render menu screen with title and buttons
         
         Args:
-            screen: Pygame surface to render on
+            screen: Pygame surface or canvas to render on (logical coordinates)
         """
+        screen = as_canvas(screen)
+        
         # Clear screen
         screen.fill(BLACK)
         
-        # Draw title
-        screen.blit(self.title_surface, self.title_rect)
-        screen.blit(self.subtitle_surface, self.subtitle_rect)
-        
-        # Draw Sprint 2 indicator
-        sprint_text = self.button_font.render("Sprint 2: Menu System", True, WHITE)
-        sprint_rect = sprint_text.get_rect(bottomright=(SCREEN_WIDTH - 50, SCREEN_HEIGHT - 50))
-        screen.blit(sprint_text, sprint_rect)
-        
-        # Draw buttons
-        self.button_set.draw(screen)
-        
-        # Draw controls info
-        controls_text = [
-            "Mouse: Navigate and click buttons",
-            "ESC: Quit game"
-        ]
-        
-        y_offset = SCREEN_HEIGHT - 150
-        for i, text in enumerate(controls_text):
-            control_surface = self.button_font.render(text, True, WHITE)
-            control_rect = control_surface.get_rect(bottomleft=(50, y_offset + i * 40))
-            screen.blit(control_surface, control_rect)
\ No newline at end of file
+        # Title, buttons and info text from the cached widget tree
+        self.layout.draw(screen)
\ No newline at end of file
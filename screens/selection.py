@@ -4,13 +4,24 @@ Sprint 4 Implementation: RTX 5070 optimized AI generation with hero sprites
 Dynamic backgrounds + character sprites with enhanced quality
 """
 
-import pygame
 import os
+import queue
+import pygame
 from config import SCREEN_WIDTH, SCREEN_HEIGHT, WHITE, BLACK, GOLD, HEROES
 from utils.buttons import Button
+from utils.canvas import as_canvas
+from utils.event_bus import EventBus
+from screens.base import BaseScreen
 from gen_assets.generate_backgrounds import AssetGenerator
+from gen_assets.scheduler import JobPriority
+from gen_assets.shared_frames import SharedImageReceiver
+from gen_assets.progress import ProgressPoller
+from utils.asset_manager import AssetManager
+from utils.effects import Effects
+from utils.widgets import Layer, Panel, Label, ButtonWidget
+from utils.fonts import FontRegistry
 
-class SelectionScreen:
+class SelectionScreen(BaseScreen):
     """
     Hero selection screen with AI-generated backgrounds
     Optimized for 3440x1440 ultrawide resolution
@@ -26,14 +37,21 @@ class SelectionScreen:
         self.game = game_instance
         # Use mock for development, real SDXL in production
         import sys
-        use_mock = 'test' in sys.argv[0] or '--test' in sys.argv
+        use_mock = getattr(game_instance, 'use_mock', None)
+        if use_mock is None:
+            use_mock = 'test' in sys.argv[0] or '--test' in sys.argv
         self.asset_generator = AssetGenerator(use_mock=use_mock)
         
-        # Initialize fonts
-        self.title_font = pygame.font.Font(None, 120)
-        self.hero_font = pygame.font.Font(None, 80)
-        self.desc_font = pygame.font.Font(None, 50)
-        self.button_font = pygame.font.Font(None, 60)
+        # Initialize fonts (shared through the game's registry)
+        self.fonts = getattr(game_instance, 'fonts', None) or FontRegistry()
+        self.title_font = self.fonts.get(120)
+        self.hero_font = self.fonts.get(80)
+        self.desc_font = self.fonts.get(50)
+        self.button_font = self.fonts.get(60)
+        
+        # Glyph atlases for text that changes with the hero or every frame
+        self.stats_text = self.fonts.atlas(80, WHITE)
+        self.status_text = self.fonts.atlas(50, WHITE)
         
         # Selection state
         self.selected_hero = None
@@ -43,6 +61,24 @@ class SelectionScreen:
         self.hero_sprites = {}
         self.ui_elements = {}
         self.current_background = None
+        self.current_background_hero = None
+        
+        # Surfaces are requested by asset id from the game's asset manager
+        self.assets = getattr(game_instance, 'assets', None) or AssetManager()
+        self.effects = getattr(game_instance, 'effects', None) or Effects()
+        
+        # Backgrounds handed over by the daemon through shared memory
+        self.frame_receiver = SharedImageReceiver()
+        self.pending_frames = {}
+        
+        # Finished generation jobs, registered on the main thread by update()
+        # once their file is on disk (shared frames arrive before the PNG)
+        self.finished_assets = queue.Queue()
+        self.unsaved_assets = {}
+        
+        # Progress of the running generation, polled a few times per second off the game loop
+        self.progress_poller = ProgressPoller(self.asset_generator.get_generation_progress)
+        self.generation_progress = None
         
         # Hero layout for ultrawide
         self.hero_positions = self._calculate_hero_positions()
@@ -73,6 +109,13 @@ class SelectionScreen:
             80, 80, "▶", self.hero_font
         )
         
+        # Each widget only hears the event types (and clicks in the region) it handles
+        self.event_bus = EventBus()
+        self._subscribe_events()
+        
+        # Static chrome declared once; per-hero text is updated in place
+        self.layout = self._build_layout()
+        
         print("Selection screen initialized for Sprint 4")
         print("RTX 5070 optimized AI generation system ready")
         
@@ -110,48 +153,188 @@ class SelectionScreen:
                 bg_color=(0, 0, 0, 0)  # Transparent
             )
             
+    def _build_layout(self):
+        """Declare the widget tree for the title, buttons, counter, description and sprint indicator"""
+        layout = Layer()
+        layout.add(Label((SCREEN_WIDTH // 2, 100), "ESCOLHA SEU HERÓI", self.title_font, GOLD, anchor="center"))
+        
+        for button in (self.confirm_button, self.back_button, self.left_arrow, self.right_arrow):
+            layout.add(ButtonWidget(button))
+            
+        self.counter_label = layout.add(Label((SCREEN_WIDTH // 2, SCREEN_HEIGHT - 180), "",
+                                              self.desc_font, WHITE, anchor="center"))
+        
+        # Description box (translucent panel with the text composited in)
+        self.description_panel = layout.add(Panel((50, SCREEN_HEIGHT - 300, SCREEN_WIDTH - 100, 150),
+                                                  (0, 0, 0, 180), GOLD, 3))
+        self.description_label = self.description_panel.add(Label((SCREEN_WIDTH // 2 - 50, 75), "",
+                                                                  self.desc_font, WHITE, anchor="center"))
+        
+        layout.add(Label((SCREEN_WIDTH - 20, SCREEN_HEIGHT - 20), "Sprint 4: RTX 5070 Optimized AI + Hero Sprites",
+                         self.desc_font, WHITE, anchor="bottomright"))
+        return layout
+        
+    def _get_asset_priorities(self):
+        """
+        Get generation priority for every asset this screen can show
+        
+        Returns:
+            dict: Asset id -> JobPriority
+        """
+        priorities = {
+            'arrow_left': JobPriority.VISIBLE,
+            'arrow_right': JobPriority.VISIBLE,
+            'menu_background': JobPriority.SPECULATIVE,
+            'title_emblem': JobPriority.SPECULATIVE
+        }
+        
+        # Arrow navigation only reaches the neighbours of the current hero next
+        current = self.heroes_list.index(self.selected_hero or self.heroes_list[0])
+        neighbours = {
+            self.heroes_list[(current - 1) % len(self.heroes_list)],
+            self.heroes_list[(current + 1) % len(self.heroes_list)]
+        }
+        
+        for index, hero in enumerate(self.heroes_list):
+            if index == current:
+                priority = JobPriority.VISIBLE
+            elif hero in neighbours:
+                priority = JobPriority.NEXT
+            else:
+                priority = JobPriority.SPECULATIVE
+            priorities[f"hero_{hero}_background"] = priority
+            priorities[f"hero_{hero}_sprite"] = priority
+            
+        return priorities
+    
+    def _generate_asset(self, asset):
+        """
+        Generate an asset (runs on the scheduler thread)
+        Backgrounds rendered by a daemon are queued as shared frames for display
+        
+        Args:
+            asset: Asset id
+            
+        Returns:
+            str: Generated asset path or None
+        """
+        if asset.startswith('hero_') and asset.endswith('_background'):
+            hero_type = asset.split('_')[1]
+            path, frame = self.asset_generator.generate_hero_background_frame(hero_type)
+            if frame:
+                self.pending_frames[hero_type] = frame
+            return path
+            
+        return self.asset_generator.generate_asset(asset)
+    
+    def _store_asset(self, asset, path):
+        """
+        Queue a finished generation job for the main thread (runs on the scheduler thread)
+        
+        Args:
+            asset: Asset id
+            path: Generated asset path or None
+        """
+        if path:
+            self.finished_assets.put((asset, path))
+    
+    def _register_finished_assets(self):
+        """Hand generated files to the asset manager (main thread only; it is not thread-safe)"""
+        while True:
+            try:
+                asset, path = self.finished_assets.get_nowait()
+            except queue.Empty:
+                break
+            self.unsaved_assets[asset] = path
+            
+        # The daemon's PNG saves are atomic renames, so an existing file is complete
+        for asset, path in list(self.unsaved_assets.items()):
+            if os.path.exists(path):
+                del self.unsaved_assets[asset]
+                self._register_asset(asset, path)
+    
+    def _register_asset(self, asset, path):
+        """
+        Record a generated asset file
+        
+        Args:
+            asset: Asset id
+            path: Generated asset path
+        """
+        self.assets.register(asset, path)
+        if asset.startswith('hero_'):
+            hero_type = asset.split('_')[1]
+            if asset.endswith('_background'):
+                self.hero_backgrounds[hero_type] = path
+            else:
+                self.hero_sprites[hero_type] = path
+        else:
+            self.ui_elements[asset] = path
+    
     def _preload_assets(self):
-        """Preload hero backgrounds and sprites with RTX 5070 optimization"""
+        """Queue hero assets by priority, generating what the first frame needs right away"""
         print("Preloading hero assets with RTX 5070 optimization...")
         
         try:
-            # Generate all backgrounds
-            self.hero_backgrounds = self.asset_generator.generate_all_hero_backgrounds()
-            print(f"Loaded {len(self.hero_backgrounds)} RTX optimized backgrounds")
+            scheduler = self.asset_generator.scheduler
+            self.selected_hero = self.heroes_list[0]
             
-            # Generate all hero sprites
-            self.hero_sprites = self.asset_generator.generate_all_hero_sprites()
-            print(f"Loaded {len(self.hero_sprites)} high-quality hero sprites")
+            for asset, priority in self._get_asset_priorities().items():
+                scheduler.submit(
+                    asset,
+                    lambda asset=asset: self._generate_asset(asset),
+                    priority,
+                    on_complete=lambda path, asset=asset: self._store_asset(asset, path),
+                    on_cancel=self.asset_generator.cancel_generation
+                )
             
-            # Generate UI elements (arrows, etc.)
-            self.ui_elements = self.asset_generator.generate_all_ui_elements()
-            print(f"Loaded {len(self.ui_elements)} UI elements")
+            # On-screen assets block the first frame, everything else streams in
+            scheduler.run_pending(max_priority=JobPriority.VISIBLE)
+            self._register_finished_assets()
+            print(f"Loaded {len(self.hero_backgrounds)} backgrounds, {len(self.hero_sprites)} sprites, "
+                  f"{len(self.ui_elements)} UI elements for the first frame")
             
-            # Set default hero and background
-            self.selected_hero = self.heroes_list[0]
             self._load_background(self.selected_hero)
+            scheduler.start()
+            self.progress_poller.start()
                 
         except Exception as e:
             print(f"Warning: Asset preloading failed: {e}")
             print("Using fallback rendering")
+    
+    def _reprioritize_assets(self):
+        """Bump pending generation jobs after the player navigates"""
+        scheduler = self.asset_generator.scheduler
+        for asset, priority in self._get_asset_priorities().items():
+            scheduler.bump(asset, priority)
             
     def _load_background(self, hero_type):
         """
-        Load and scale background for hero
+        Acquire the screen-sized background for hero from the asset manager
+        A pending shared frame is handed to the manager straight from shared memory,
+        before the daemon has finished writing its PNG
         
         Args:
             hero_type: Hero to load background for
         """
-        if hero_type in self.hero_backgrounds:
-            bg_path = self.hero_backgrounds[hero_type]
+        self._release_background()
+        
+        frame = self.pending_frames.pop(hero_type, None)
+        if frame or hero_type in self.hero_backgrounds:
+            asset_id = f"hero_{hero_type}_background"
+            self.current_background_hero = hero_type
             
             try:
-                # Load and scale background
-                background = pygame.image.load(bg_path)
-                self.current_background = pygame.transform.scale(
-                    background, (SCREEN_WIDTH, SCREEN_HEIGHT)
-                )
-                print(f"Background loaded for {hero_type}")
+                if frame:
+                    try:
+                        self._put_frame(asset_id, frame)
+                    except FileNotFoundError:
+                        # The daemon expired the frame; the PNG loads once registered
+                        print(f"Shared frame for {hero_type} expired, loading from disk")
+                
+                self.current_background = self.assets.acquire(asset_id, (SCREEN_WIDTH, SCREEN_HEIGHT))
+                if self.current_background:
+                    print(f"Background loaded for {hero_type}")
                 
             except Exception as e:
                 print(f"Error loading background for {hero_type}: {e}")
@@ -159,6 +342,56 @@ class SelectionScreen:
         else:
             self.current_background = None
             
+    def _put_frame(self, asset_id, frame):
+        """
+        Hand a shared memory frame to the asset manager
+        Screen-sized frames are kept zero-copy and their segment is released on eviction
+        
+        Args:
+            asset_id: Background asset id
+            frame: Shared frame descriptor
+        """
+        surface = self.frame_receiver.receive(frame)
+        name = frame['name']
+        
+        if surface.get_size() == (SCREEN_WIDTH, SCREEN_HEIGHT):
+            self.assets.put(asset_id, surface, (SCREEN_WIDTH, SCREEN_HEIGHT),
+                            on_evict=lambda: self.frame_receiver.release(name))
+        else:
+            scaled = pygame.transform.scale(surface, (SCREEN_WIDTH, SCREEN_HEIGHT))
+            del surface
+            self.frame_receiver.release(name)
+            self.assets.put(asset_id, scaled, (SCREEN_WIDTH, SCREEN_HEIGHT))
+            
+    def _release_background(self):
+        """Unpin the displayed background; the asset manager decides when it leaves memory"""
+        if self.current_background is not None:
+            self.assets.release(f"hero_{self.current_background_hero}_background",
+                                (SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.current_background = None
+            
+    def on_enter(self, previous_state):
+        """Restore the background released while the screen was inactive"""
+        if self.selected_hero and self.current_background is None:
+            self._load_background(self.selected_hero)
+            
+    def suspend(self):
+        """Unpin the full-screen background (~20 MB) so the asset manager may evict it"""
+        if self.current_background is None:
+            return
+        self._release_background()
+        self.current_background_hero = None
+        
+    def unload(self):
+        """Stop streaming generation jobs, drop backgrounds and release shared frames"""
+        self.suspend()
+        self.asset_generator.scheduler.stop(timeout=0)
+        self.progress_poller.stop(timeout=0)
+        self.pending_frames.clear()
+        for hero in self.heroes_list:
+            self.assets.invalidate(f"hero_{hero}_background")
+        self.frame_receiver.release_all()
+        
     def handle_events(self, events):
         """
         Handle selection screen events
@@ -169,41 +402,52 @@ class SelectionScreen:
         Returns:
             str: Next game state or None
         """
-        for event in events:
-            # Check arrow navigation
-            if self.left_arrow.handle_event(event):
-                self._navigate_hero(-1)
-                
-            if self.right_arrow.handle_event(event):
-                self._navigate_hero(1)
-            
-            # Check hero selection (for direct clicking)
-            for hero, button in self.hero_buttons.items():
-                if button.handle_event(event):
-                    self._select_hero(hero)
-                    
-            # Check confirm button
-            if self.confirm_button.handle_event(event):
-                if self.selected_hero:
-                    self.game.selected_hero = self.selected_hero
-                    print(f"Hero selected: {self.selected_hero}")
-                    return "gameplay"  # Transition to combat
-                    
-            # Check back button
-            if self.back_button.handle_event(event):
-                return "menu"  # Return to menu
-                
-            # Keyboard navigation
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_LEFT or event.key == pygame.K_a:
-                    self._navigate_hero(-1)
-                elif event.key == pygame.K_RIGHT or event.key == pygame.K_d:
-                    self._navigate_hero(1)
-                elif event.key == pygame.K_RETURN or event.key == pygame.K_SPACE:
-                    if self.selected_hero:
-                        self.game.selected_hero = self.selected_hero
-                        return "gameplay"
-                
+        return self.event_bus.dispatch(events)
+        
+    def _subscribe_events(self):
+        """Register buttons and keyboard navigation on the event bus"""
+        # Arrow navigation
+        self.left_arrow.subscribe(self.event_bus, lambda: self._navigate_hero(-1))
+        self.right_arrow.subscribe(self.event_bus, lambda: self._navigate_hero(1))
+        
+        # Hero selection (for direct clicking)
+        for hero, button in self.hero_buttons.items():
+            button.subscribe(self.event_bus, lambda hero=hero: self._select_hero(hero))
+            
+        self.confirm_button.subscribe(self.event_bus, self._confirm_selection)
+        self.back_button.subscribe(self.event_bus, lambda: "menu")  # Return to menu
+        
+        self.event_bus.subscribe(pygame.KEYDOWN, self._handle_key)
+        
+    def _handle_key(self, event):
+        """
+        Keyboard navigation
+        
+        Args:
+            event: KEYDOWN event
+            
+        Returns:
+            str: Next game state or None
+        """
+        if event.key == pygame.K_LEFT or event.key == pygame.K_a:
+            self._navigate_hero(-1)
+        elif event.key == pygame.K_RIGHT or event.key == pygame.K_d:
+            self._navigate_hero(1)
+        elif event.key == pygame.K_RETURN or event.key == pygame.K_SPACE:
+            return self._confirm_selection()
+        return None
+        
+    def _confirm_selection(self):
+        """
+        Confirm the selected hero
+        
+        Returns:
+            str: "gameplay" once a hero is selected, otherwise None
+        """
+        if self.selected_hero:
+            self.game.selected_hero = self.selected_hero
+            print(f"Hero selected: {self.selected_hero}")
+            return "gameplay"  # Transition to combat
         return None
         
     def _navigate_hero(self, direction):
@@ -230,11 +474,24 @@ class SelectionScreen:
                 self.current_hero_index = self.heroes_list.index(hero_type)
             
             self.selected_hero = hero_type
+            self._reprioritize_assets()
             self._load_background(hero_type)
             print(f"Selected hero: {hero_type}")
             
     def update(self):
         """Update selection screen logic"""
+        self._register_finished_assets()
+        
+        # Pick up the background once its shared frame or file arrives
+        hero = self.selected_hero
+        if hero in self.pending_frames or (
+                hero in self.hero_backgrounds and
+                (hero != self.current_background_hero or self.current_background is None)):
+            self._load_background(hero)
+            
+        # Last progress snapshot (the poller thread does the daemon round trip)
+        self.generation_progress = self.progress_poller.snapshot
+            
         # Update button hover states
         mouse_pos = pygame.mouse.get_pos()
         
@@ -251,8 +508,10 @@ class SelectionScreen:
         Render hero selection screen
         
         Args:
-            screen: Pygame surface to render on
+            screen: Pygame surface or canvas to render on (logical coordinates)
         """
+        screen = as_canvas(screen)
+        
         # Clear screen
         screen.fill(BLACK)
         
@@ -263,39 +522,41 @@ class SelectionScreen:
             # Fallback gradient background
             self._draw_fallback_background(screen)
             
-        # Draw title
-        title = self.title_font.render("ESCOLHA SEU HERÓI", True, GOLD)
-        title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 100))
-        screen.blit(title, title_rect)
-        
         # Draw current hero (single hero display)
         self._draw_current_hero(screen)
         
-        # Draw navigation arrows
+        # Title, buttons, counter, description and sprint indicator: cached widgets,
+        # re-rendered only where the hero, arrow art or button states changed
         self._draw_navigation_arrows(screen)
-        
-        # Draw hero description
-        if self.selected_hero:
-            self._draw_hero_description(screen)
-            
-        # Draw buttons
-        self.confirm_button.draw(screen)
-        self.back_button.draw(screen)
-        self.left_arrow.draw(screen)
-        self.right_arrow.draw(screen)
-        
-        # Draw sprint indicator
-        sprint_text = self.desc_font.render("Sprint 4: RTX 5070 Optimized AI + Hero Sprites", True, WHITE)
-        sprint_rect = sprint_text.get_rect(bottomright=(SCREEN_WIDTH - 20, SCREEN_HEIGHT - 20))
-        screen.blit(sprint_text, sprint_rect)
+        self._draw_hero_description(screen)
+        self.layout.draw(screen)
+        
+        # Draw generation progress while assets are still being generated
+        if self.generation_progress:
+            self._draw_generation_progress(screen)
+        
+    def _draw_generation_progress(self, screen):
+        """Draw progress bar with throughput and ETA of the running generation"""
+        progress = self.generation_progress
+        bar_rect = pygame.Rect(0, 0, 800, 24)
+        bar_rect.midbottom = (SCREEN_WIDTH // 2, SCREEN_HEIGHT - 40)
+        
+        screen.rect((30, 30, 40), bar_rect)
+        fill_rect = bar_rect.copy()
+        fill_rect.width = int(bar_rect.width * progress['fraction'])
+        screen.rect(GOLD, fill_rect)
+        screen.rect(WHITE, bar_rect, 2)
+        
+        eta = progress['eta_s']
+        eta_text = f"{eta:.0f}s" if eta is not None else "--"
+        status = (f"Gerando arte: {progress['step']}/{progress['total_steps']} passos - "
+                  f"{progress['steps_per_second']:.2f} it/s - ETA {eta_text}")
+        self.status_text.draw(screen, status, (bar_rect.centerx, bar_rect.top - 8), anchor="midbottom")
         
     def _draw_fallback_background(self, screen):
         """Draw fallback background when AI assets aren't available"""
-        # Create gothic gradient
-        for y in range(SCREEN_HEIGHT):
-            intensity = int(64 * (1 - y / SCREEN_HEIGHT))
-            color = (intensity // 2, intensity // 4, intensity)
-            pygame.draw.line(screen, color, (0, y), (SCREEN_WIDTH, y))
+        # Gothic gradient, baked once
+        screen.blit(self.effects.gradient((SCREEN_WIDTH, SCREEN_HEIGHT), (32, 16, 64), (0, 0, 0)), (0, 0))
     
     def _draw_current_hero(self, screen):
         """Draw the currently selected hero in center screen"""
@@ -308,32 +569,17 @@ class SelectionScreen:
         
         # Hero container
         hero_rect = pygame.Rect(center_x - 300, center_y - 200, 600, 400)
-        pygame.draw.rect(screen, (16, 16, 24), hero_rect)
-        pygame.draw.rect(screen, GOLD, hero_rect, 6)
-        
-        # Draw AI-generated sprite if available
-        if self.selected_hero in self.hero_sprites and os.path.exists(self.hero_sprites[self.selected_hero]):
-            try:
-                sprite_image = pygame.image.load(self.hero_sprites[self.selected_hero])
-                
-                # Scale sprite for center display
-                sprite_size = 300
-                sprite_image = pygame.transform.scale(sprite_image, (sprite_size, sprite_size))
-                
-                # Center sprite
-                sprite_rect = sprite_image.get_rect(center=(center_x, center_y - 30))
-                screen.blit(sprite_image, sprite_rect)
-                
-                # Glow effect
-                glow_surface = pygame.Surface((sprite_size + 40, sprite_size + 40))
-                glow_surface.set_alpha(40)
-                glow_surface.fill(GOLD)
-                glow_rect = glow_surface.get_rect(center=sprite_rect.center)
-                screen.blit(glow_surface, glow_rect)
-                
-            except Exception as e:
-                print(f"Error loading sprite for {self.selected_hero}: {e}")
-                self._draw_hero_placeholder_center(screen, center_x, center_y)
+        screen.rect((16, 16, 24), hero_rect)
+        screen.rect(GOLD, hero_rect, 6)
+        
+        # Draw AI-generated sprite if available (scaled copy cached by the asset manager)
+        sprite_size = 300
+        sprite_image = self.assets.get(f"hero_{self.selected_hero}_sprite", (sprite_size, sprite_size))
+        if sprite_image:
+            # Center sprite over its glow (baked once per sprite)
+            sprite_rect = sprite_image.get_rect(center=(center_x, center_y - 30))
+            self.effects.draw_glow(screen, sprite_image, sprite_rect.center, GOLD, radius=20, strength=0.6)
+            screen.blit(sprite_image, sprite_rect)
         else:
             self._draw_hero_placeholder_center(screen, center_x, center_y)
         
@@ -345,51 +591,32 @@ class SelectionScreen:
         
         # Draw stats
         stats = [f"Health: {hero_data['health']}", f"Mana: {hero_data['mana']}"]
-        stats_text = " | ".join(stats)
-        stats_surface = self.hero_font.render(stats_text, True, WHITE)
-        stats_rect = stats_surface.get_rect(center=(center_x, center_y + 220))
-        screen.blit(stats_surface, stats_rect)
+        self.stats_text.draw(screen, " | ".join(stats), (center_x, center_y + 220), anchor="center")
     
     def _draw_hero_placeholder_center(self, screen, center_x, center_y):
         """Draw placeholder for center hero display"""
         placeholder_rect = pygame.Rect(center_x - 150, center_y - 150, 300, 300)
-        pygame.draw.rect(screen, (64, 64, 64), placeholder_rect)
-        pygame.draw.rect(screen, WHITE, placeholder_rect, 4)
+        screen.rect((64, 64, 64), placeholder_rect)
+        screen.rect(WHITE, placeholder_rect, 4)
         
         # Draw hero initial
         initial = self.selected_hero[0].upper()
-        initial_font = pygame.font.Font(None, 200)
+        initial_font = self.fonts.get(200)
         initial_surface = initial_font.render(initial, True, WHITE)
         initial_rect = initial_surface.get_rect(center=placeholder_rect.center)
         screen.blit(initial_surface, initial_rect)
     
     def _draw_navigation_arrows(self, screen):
         """Draw navigation arrows with AI-generated graphics if available"""
-        # Left arrow
-        if 'arrow_left' in self.ui_elements and os.path.exists(self.ui_elements['arrow_left']):
-            try:
-                arrow_img = pygame.image.load(self.ui_elements['arrow_left'])
-                arrow_img = pygame.transform.scale(arrow_img, (60, 60))
-                arrow_rect = arrow_img.get_rect(center=self.left_arrow.rect.center)
-                screen.blit(arrow_img, arrow_rect)
-            except:
-                pass  # Fallback to button text
-        
-        # Right arrow  
-        if 'arrow_right' in self.ui_elements and os.path.exists(self.ui_elements['arrow_right']):
-            try:
-                arrow_img = pygame.image.load(self.ui_elements['arrow_right'])
-                arrow_img = pygame.transform.scale(arrow_img, (60, 60))
-                arrow_rect = arrow_img.get_rect(center=self.right_arrow.rect.center)
-                screen.blit(arrow_img, arrow_rect)
-            except:
-                pass  # Fallback to button text
+        # Arrow graphics skin the arrow buttons, falling back to the button text;
+        # the skin only changes (and the composites rebuild) when the asset is reloaded
+        for asset_id, button in (('arrow_left', self.left_arrow), ('arrow_right', self.right_arrow)):
+            arrow_img = self.assets.get(asset_id, button.rect.size)
+            if arrow_img is not button.skin:
+                button.set_skin(arrow_img, show_text=False)
         
         # Hero counter
-        counter_text = f"{self.current_hero_index + 1} / {len(self.heroes_list)}"
-        counter_surface = self.desc_font.render(counter_text, True, WHITE)
-        counter_rect = counter_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 180))
-        screen.blit(counter_surface, counter_rect)
+        self.counter_label.set_text(f"{self.current_hero_index + 1} / {len(self.heroes_list)}")
             
     def _draw_heroes_with_sprites(self, screen):
         """Draw hero selection areas with AI-generated sprites"""
@@ -398,33 +625,18 @@ class SelectionScreen:
             
             # Draw hero container
             border_color = GOLD if hero == self.selected_hero else WHITE
-            pygame.draw.rect(screen, (16, 16, 24), rect)  # Darker background
-            pygame.draw.rect(screen, border_color, rect, 4)
-            
-            # Draw AI-generated sprite if available
-            if hero in self.hero_sprites and os.path.exists(self.hero_sprites[hero]):
-                try:
-                    sprite_image = pygame.image.load(self.hero_sprites[hero])
-                    
-                    # Scale sprite to fit in hero area (maintaining aspect ratio)
-                    sprite_size = min(rect.width - 40, rect.height - 120)
-                    sprite_image = pygame.transform.scale(sprite_image, (sprite_size, sprite_size))
-                    
-                    # Center sprite in hero area
-                    sprite_rect = sprite_image.get_rect(center=(rect.centerx, rect.centery - 20))
-                    screen.blit(sprite_image, sprite_rect)
-                    
-                    # Add subtle glow effect for selected hero
-                    if hero == self.selected_hero:
-                        glow_surface = pygame.Surface((sprite_size + 20, sprite_size + 20))
-                        glow_surface.set_alpha(30)
-                        glow_surface.fill(GOLD)
-                        glow_rect = glow_surface.get_rect(center=sprite_rect.center)
-                        screen.blit(glow_surface, glow_rect)
-                        
-                except Exception as e:
-                    print(f"Error loading sprite for {hero}: {e}")
-                    self._draw_hero_placeholder(screen, hero, rect)
+            screen.rect((16, 16, 24), rect)  # Darker background
+            screen.rect(border_color, rect, 4)
+            
+            # Draw AI-generated sprite if available, scaled to fit in hero area
+            sprite_size = min(rect.width - 40, rect.height - 120)
+            sprite_image = self.assets.get(f"hero_{hero}_sprite", (sprite_size, sprite_size))
+            if sprite_image:
+                # Center sprite in hero area, over a subtle glow for the selected hero
+                sprite_rect = sprite_image.get_rect(center=(rect.centerx, rect.centery - 20))
+                if hero == self.selected_hero:
+                    self.effects.draw_glow(screen, sprite_image, sprite_rect.center, GOLD, radius=10, strength=0.5)
+                screen.blit(sprite_image, sprite_rect)
             else:
                 self._draw_hero_placeholder(screen, hero, rect)
             
@@ -448,12 +660,12 @@ class SelectionScreen:
         placeholder_rect = pygame.Rect(
             rect.centerx - 100, rect.centery - 100, 200, 200
         )
-        pygame.draw.rect(screen, placeholder_color, placeholder_rect)
-        pygame.draw.rect(screen, WHITE, placeholder_rect, 2)
+        screen.rect(placeholder_color, placeholder_rect)
+        screen.rect(WHITE, placeholder_rect, 2)
         
         # Draw hero initial
         initial = hero[0].upper()
-        initial_font = pygame.font.Font(None, 120)
+        initial_font = self.fonts.get(120)
         initial_surface = initial_font.render(initial, True, WHITE)
         initial_rect = initial_surface.get_rect(center=placeholder_rect.center)
         screen.blit(initial_surface, initial_rect)
@@ -464,19 +676,10 @@ class SelectionScreen:
             rect = self.hero_positions[self.selected_hero]['rect']
             # Animated selection border
             border_width = 6
-            pygame.draw.rect(screen, GOLD, rect.inflate(border_width * 2, border_width * 2), border_width)
+            screen.rect(GOLD, rect.inflate(border_width * 2, border_width * 2), border_width)
             
     def _draw_hero_description(self, screen):
-        """Draw detailed description of selected hero"""
+        """Update the description panel for the selected hero (drawn with the layout)"""
+        self.description_panel.set(visible=bool(self.selected_hero))
         if self.selected_hero:
-            hero_data = HEROES[self.selected_hero]
-            
-            # Description box
-            desc_rect = pygame.Rect(50, SCREEN_HEIGHT - 300, SCREEN_WIDTH - 100, 150)
-            pygame.draw.rect(screen, (0, 0, 0, 180), desc_rect)
-            pygame.draw.rect(screen, GOLD, desc_rect, 3)
-            
-            # Description text
-            desc_surface = self.desc_font.render(hero_data['description'], True, WHITE)
-            desc_text_rect = desc_surface.get_rect(center=desc_rect.center)
-            screen.blit(desc_surface, desc_text_rect)
\ No newline at end of file
+            self.description_label.set_text(HEROES[self.selected_hero]['description'])
\ No newline at end of file
@@ -0,0 +1,15 @@
+"""
+pytest configuration for the Medieval Deck test scripts
+The scripts report a failed check by printing [FAIL] and returning False;
+pytest ignores return values, so those are turned into failures here
+"""
+
+import pytest
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_pyfunc_call(pyfuncitem):
+    """Call the test and fail it if it returned False"""
+    funcargs = {arg: pyfuncitem.funcargs[arg] for arg in pyfuncitem._fixtureinfo.argnames}
+    if pyfuncitem.obj(**funcargs) is False:
+        pytest.fail("test returned False (see [FAIL] output)", pytrace=False)
+    return True
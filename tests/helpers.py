@@ -0,0 +1,89 @@
+"""
+Shared setup for the Medieval Deck test scripts
+Each script's tests return True/False and print [OK]/[FAIL]; run_tests is the
+__main__ runner that reports them
+"""
+
+import os
+import pygame
+from gen_assets.generate_backgrounds import AssetGenerator
+from gen_assets.metrics import GenerationMetricsStore
+from gen_assets.progress import ProgressHistory
+
+def run_tests(title, tests, results_label, success_message):
+    """
+    Run test functions and print the results banner
+
+    Args:
+        title: Banner title ('FONTS TEST')
+        tests: Test functions returning True/False
+        results_label: Results line prefix ('FONTS')
+        success_message: Printed when every test passed
+
+    Returns:
+        bool: True if every test passed
+    """
+    print("=" * 60)
+    print(f"MEDIEVAL DECK - {title}")
+    print("=" * 60)
+
+    passed = 0
+    total = len(tests)
+
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+            print()
+        except Exception as e:
+            print(f"[ERROR] Test {test.__name__} crashed: {e}")
+            print()
+
+    print("=" * 60)
+    print(f"{results_label} RESULTS: {passed}/{total} tests passed")
+
+    if passed == total:
+        print(f"[SUCCESS] {success_message}")
+    else:
+        print(f"[WARNING] {total - passed} tests failed - Review implementation")
+    print("=" * 60)
+    return passed == total
+
+def make_mock_generator(work_dir, pipeline=None):
+    """
+    Mock AssetGenerator whose backgrounds, metrics, ETA history and
+    checkpoints all live in a temporary directory
+
+    Args:
+        work_dir: Temporary directory
+        pipeline: Stand-in pipeline driving the real generation path (optional)
+
+    Returns:
+        AssetGenerator
+    """
+    generator = AssetGenerator(use_mock=True, backgrounds_dir=work_dir)
+    if pipeline is not None:
+        generator.pipeline = pipeline
+    generator.metrics = GenerationMetricsStore(os.path.join(work_dir, "metrics.db"), hardware_id="test")
+    generator.progress_history = ProgressHistory(os.path.join(work_dir, "history.json"))
+    generator.checkpoint_every = 0
+    generator.checkpoint_dir = work_dir
+    return generator
+
+def make_selection_screen(size=(100, 100)):
+    """
+    Selection screen on a dummy display, with no hero selected yet
+
+    Returns:
+        tuple: (display surface, SelectionScreen)
+    """
+    from screens.selection import SelectionScreen
+
+    screen = pygame.display.set_mode(size)
+    return screen, SelectionScreen(type('Game', (), {'selected_hero': None})())
+
+def make_surface(color, size=(100, 100)):
+    """Solid 32-bit surface"""
+    surface = pygame.Surface(size, depth=32)
+    surface.fill(color)
+    return surface
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Test script for the byte-budgeted asset manager
+"""
+
+import pygame
+import sys
+import os
+import tempfile
+import threading
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.asset_manager import AssetManager, surface_bytes
+from tests.helpers import run_tests, make_selection_screen, make_surface
+
+def resident_matches(assets):
+    """True if resident_bytes is the pixel memory of the cached surfaces"""
+    return assets.resident_bytes == sum(surface_bytes(surface) for surface in assets.entries.values())
+
+def test_lookup_and_stats():
+    """Test id lookup, per-size caching and hit/miss accounting"""
+    try:
+        pygame.init()
+        with tempfile.TemporaryDirectory() as work_dir:
+            path = os.path.join(work_dir, "sprite.png")
+            pygame.image.save(make_surface((200, 50, 50), (64, 64)), path)
+            broken = os.path.join(work_dir, "broken.png")
+            with open(broken, "w") as f:
+                f.write("not an image")
+
+            assets = AssetManager()
+            assets.register("hero_knight_sprite", path)
+            assets.register("arrow_left", broken)
+
+            first = assets.get("hero_knight_sprite", (32, 32))
+            second = assets.get("hero_knight_sprite", (32, 32))
+            full = assets.get("hero_knight_sprite")
+            if first is not second or first.get_size() != (32, 32) or full.get_size() != (64, 64):
+                print("[FAIL] Sized lookups not cached separately")
+                return False
+
+            if assets.get("unknown") is not None or assets.get("arrow_left") or assets.get("arrow_left"):
+                print("[FAIL] Unknown or broken assets returned a surface")
+                return False
+
+            stats = assets.get_stats()
+            if (stats['hits'], stats['misses'], stats['entries']) != (1, 3, 2):
+                print(f"[FAIL] Unexpected stats: {stats}")
+                return False
+            if stats['resident_bytes'] != surface_bytes(first) + surface_bytes(full) or not resident_matches(assets):
+                print(f"[FAIL] Resident bytes {stats['resident_bytes']} do not match the cached surfaces")
+                return False
+
+            print("[OK] Lookups cached per size, broken file loaded once")
+            return True
+    except Exception as e:
+        print(f"[FAIL] Lookup test failed: {e}")
+        return False
+    finally:
+        pygame.quit()
+
+def test_budget_eviction_and_pinning():
+    """Test LRU eviction keeps within budget and skips pinned surfaces"""
+    try:
+        pygame.init()
+        evicted = []
+        one = surface_bytes(make_surface((0, 0, 0)))
+        assets = AssetManager(budget_bytes=int(one * 2.5))
+
+        assets.put("a", make_surface((255, 0, 0)), on_evict=lambda: evicted.append("a"))
+        assets.put("b", make_surface((0, 255, 0)), on_evict=lambda: evicted.append("b"))
+        if assets.resident_bytes != one * 2 or evicted:
+            print(f"[FAIL] Two surfaces should fit the budget: {assets.get_stats()}")
+            return False
+        assets.acquire("a")
+        assets.put("c", make_surface((0, 0, 255)))
+
+        if evicted != ["b"] or assets.get("a") is None or assets.resident_bytes != one * 2:
+            print(f"[FAIL] Pinned surface evicted or budget exceeded: {evicted}")
+            return False
+
+        assets.release("a")
+        assets.get("c")
+        assets.put("d", make_surface((255, 255, 255)))
+        if evicted != ["b", "a"] or assets.evictions != 2:
+            print(f"[FAIL] Released surface not evicted first: {evicted}")
+            return False
+
+        assets.invalidate("c")
+        if assets.get("c") is not None or assets.resident_bytes != one:
+            print("[FAIL] Invalidate did not drop the surface")
+            return False
+
+        print(f"[OK] Budget {assets.budget_bytes} bytes held, {assets.evictions} evictions")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Eviction test failed: {e}")
+        return False
+    finally:
+        pygame.quit()
+
+def test_lru_eviction_order():
+    """Test lookups refresh recency so the least recently used surface goes first"""
+    try:
+        pygame.init()
+        evicted = []
+        one = surface_bytes(make_surface((0, 0, 0)))
+        assets = AssetManager(budget_bytes=one * 3)
+
+        for asset_id in "abc":
+            assets.put(asset_id, make_surface((0, 0, 0)), on_evict=lambda asset_id=asset_id: evicted.append(asset_id))
+        assets.get("a")
+        for asset_id in "de":
+            assets.put(asset_id, make_surface((0, 0, 0)), on_evict=lambda asset_id=asset_id: evicted.append(asset_id))
+            if assets.resident_bytes > assets.budget_bytes or not resident_matches(assets):
+                print(f"[FAIL] Budget exceeded after adding {asset_id}: {assets.get_stats()}")
+                return False
+
+        cached = [asset_id for asset_id, _ in assets.entries]
+        if evicted != ["b", "c"] or cached != ["a", "d", "e"] or assets.resident_bytes != one * 3:
+            print(f"[FAIL] Evicted {evicted}, cached {cached}")
+            return False
+
+        print(f"[OK] Evicted {evicted} in LRU order, recently used 'a' kept")
+        return True
+    except Exception as e:
+        print(f"[FAIL] LRU order test failed: {e}")
+        return False
+    finally:
+        pygame.quit()
+
+def test_selection_screen_uses_manager():
+    """Test the selection screen draws sprites and backgrounds from the manager"""
+    try:
+        pygame.init()
+        screen, selection = make_selection_screen()
+        assets = selection.assets
+
+        selection.render(screen)
+        misses = assets.misses
+        for _ in range(5):
+            selection.render(screen)
+
+        if assets.misses != misses or assets.hits == 0:
+            print(f"[FAIL] Sprites reloaded every frame: {assets.get_stats()}")
+            return False
+
+        background_key = (f"hero_{selection.selected_hero}_background", selection.current_background.get_size())
+        if not assets.refcounts.get(background_key):
+            print("[FAIL] Displayed background not pinned")
+            return False
+
+        selection.suspend()
+        if assets.refcounts.get(background_key):
+            print("[FAIL] Background still pinned after suspend")
+            return False
+
+        if not resident_matches(assets) or assets.resident_bytes > assets.budget_bytes:
+            print(f"[FAIL] Resident bytes out of budget or out of sync: {assets.get_stats()}")
+            return False
+
+        print(f"[OK] {assets.hits} hits after the first frame, background unpinned on suspend")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Selection integration test failed: {e}")
+        return False
+    finally:
+        pygame.quit()
+
+def test_worker_results_registered_on_main_thread():
+    """Test generation results from the scheduler thread reach the manager through update()"""
+    try:
+        pygame.init()
+        screen, selection = make_selection_screen()
+        selection.asset_generator.scheduler.stop(timeout=30)
+        assets = selection.assets
+
+        with tempfile.TemporaryDirectory() as work_dir:
+            path = os.path.join(work_dir, "banner.png")
+            pygame.image.save(make_surface((0, 0, 200), (32, 32)), path)
+
+            # A frame handed over before the file is registered survives registration
+            frame = make_surface((0, 200, 0), (32, 32))
+            assets.put("ui_banner", frame)
+
+            worker = threading.Thread(target=selection._store_asset, args=("ui_banner", path))
+            worker.start()
+            worker.join()
+            if "ui_banner" in assets.sources or "ui_banner" in selection.ui_elements:
+                print("[FAIL] Asset manager touched from the scheduler thread")
+                return False
+
+            selection.update()
+            if assets.sources.get("ui_banner") != path or selection.ui_elements.get("ui_banner") != path:
+                print("[FAIL] Finished job not registered by update()")
+                return False
+            if assets.get("ui_banner") is not frame:
+                print("[FAIL] First registration dropped the handed-over surface")
+                return False
+
+        print("[OK] Worker results registered on the main thread, handed-over surface kept")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Main thread registration test failed: {e}")
+        return False
+    finally:
+        pygame.quit()
+
+if __name__ == "__main__":
+    run_tests("ASSET MANAGER TEST", [
+        test_lookup_and_stats,
+        test_budget_eviction_and_pinning,
+        test_lru_eviction_order,
+        test_selection_screen_uses_manager,
+        test_worker_results_registered_on_main_thread
+    ], "ASSET MANAGER", "Asset manager operational!")
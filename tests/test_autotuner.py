@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Test script for the generation parameter autotuner
+Selection logic runs against a synthetic cost model, no GPU needed
+"""
+
+import sys
+import os
+import tempfile
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import AI_IMAGE_SIZE
+from gen_assets.autotuner import (GenerationAutotuner, get_asset_class, get_tier_resolution,
+                                  load_hardware_profile, save_hardware_profile)
+from gen_assets.art_direction import ArtDirection
+from gen_assets.generate_backgrounds import AssetGenerator
+from gen_assets.mock_pipeline import MockSDXLPipeline
+from gen_assets.progress import ProgressHistory
+
+class SyntheticCostModel:
+    """Seconds per image = overhead + steps * megapixels * cost, scaled by options"""
+
+    ATTENTION_FACTORS = {'sdpa': 1.0, 'xformers': None, 'sliced': 1.3}  # No xformers installed
+    VAE_FACTORS = {'full': 1.0, 'sliced': 1.05, 'tiled': 1.1}
+
+    def __init__(self, seconds_per_megapixel_step=0.25, overhead=2.0):
+        self.seconds_per_megapixel_step = seconds_per_megapixel_step
+        self.overhead = overhead
+        self.calls = 0
+
+    def __call__(self, asset_class, candidate):
+        attention = self.ATTENTION_FACTORS[candidate['attention']]
+        if attention is None:
+            return None
+
+        self.calls += 1
+        megapixels = candidate['width'] * candidate['height'] / 1e6
+        step_cost = self.seconds_per_megapixel_step * megapixels * attention * self.VAE_FACTORS[candidate['vae']]
+        return self.overhead + candidate['num_inference_steps'] * step_cost
+
+def test_budget_selection():
+    """Test the best quality within budget is chosen with the fastest options"""
+    try:
+        cost_model = SyntheticCostModel()
+        tuner = GenerationAutotuner(cost_model, budgets={'background': 20.0, 'ui': 10.0})
+        profile = tuner.tune()
+
+        # 3440x1440 is ~4.95MP: 1.0 tier needs >=20 steps * 1.24s, 0.75 tier fits 25 steps
+        background = profile['background']
+        if (background['resolution_scale'], background['num_inference_steps']) != (0.75, 25):
+            print(f"[FAIL] Unexpected background choice: {background}")
+            return False
+
+        if background['attention'] != 'sdpa' or background['vae'] != 'full':
+            print(f"[FAIL] Slower options chosen: {background}")
+            return False
+
+        ui = profile['ui']
+        if (ui['resolution_scale'], ui['num_inference_steps']) != (1.0, 35):
+            print(f"[FAIL] Cheap UI class not given full quality: {ui}")
+            return False
+
+        print(f"[OK] Background: {background['num_inference_steps']} steps at "
+              f"{background['width']}x{background['height']} in {background['seconds']:.1f}s")
+        print(f"[OK] UI: {ui['num_inference_steps']} steps at full resolution")
+
+        full_sweep = 2 * 3 * 2 * 3 * 4  # classes * tiers * supported attention * vae * steps
+        if cost_model.calls >= full_sweep:
+            print("[FAIL] Over-budget combinations were not pruned")
+            return False
+        print(f"[OK] {cost_model.calls}/{full_sweep} candidates measured after pruning")
+
+        return True
+    except Exception as e:
+        print(f"[FAIL] Budget selection test failed: {e}")
+        return False
+
+def test_over_budget_fallback():
+    """Test the fastest configuration is chosen when nothing fits the budget"""
+    try:
+        tuner = GenerationAutotuner(SyntheticCostModel(), budgets={'background': 1.0})
+        background = tuner.tune_asset_class('background')
+
+        if background['within_budget'] or background['resolution_scale'] != 0.5 or \
+                background['num_inference_steps'] != 20:
+            print(f"[FAIL] Fastest configuration not chosen: {background}")
+            return False
+
+        print(f"[OK] Fastest fallback: {background['seconds']:.1f}s over a 1s budget")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Over budget fallback test failed: {e}")
+        return False
+
+def test_profile_replaces_table():
+    """Test a saved hardware profile replaces the hard-coded step table"""
+    try:
+        with tempfile.TemporaryDirectory() as profile_dir:
+            path = os.path.join(profile_dir, "profiles.json")
+            profile = GenerationAutotuner(SyntheticCostModel(), budgets={'background': 20.0}).tune()
+            save_hardware_profile(profile, hardware_id="test-gpu", path=path)
+            save_hardware_profile({}, hardware_id="other-gpu", path=path)
+
+            loaded = load_hardware_profile("test-gpu", path=path)
+            if loaded != profile or load_hardware_profile("missing-gpu", path=path) is not None:
+                print("[FAIL] Profile did not round trip per device")
+                return False
+            print("[OK] Hardware profile saved and reloaded per device")
+
+            generator = AssetGenerator(use_mock=True)
+            generator.optimizer.hardware_profile = loaded
+
+            params = generator.optimizer.get_optimal_generation_params(AI_IMAGE_SIZE, 'background')
+            expected_size = get_tier_resolution(AI_IMAGE_SIZE, 0.75)
+            if (params['width'], params['height']) != expected_size or params['num_inference_steps'] != 25:
+                print(f"[FAIL] Tuned parameters not used: {params}")
+                return False
+
+            untuned = generator.optimizer.get_optimal_generation_params((1024, 1024), 'sprite')
+            if untuned['num_inference_steps'] != 35:
+                print("[FAIL] Untuned class lost the default table")
+                return False
+            print(f"[OK] Background uses tuned {params['width']}x{params['height']} @ 25 steps")
+
+            # Generated at the tier resolution, delivered at the requested size
+            stand_in = MockSDXLPipeline()
+            generator.pipeline = stand_in
+            generator.checkpoint_every = 0
+            generator.progress_history = ProgressHistory(os.path.join(profile_dir, "history.json"))
+            prompt_config = dict(ArtDirection.get_hero_background_prompt('knight'), width=344, height=144)
+            image = generator._generate_image(prompt_config)
+
+            call = stand_in.calls[0]
+            if (call['width'], call['height']) != get_tier_resolution((344, 144), 0.75) or image.size != (344, 144):
+                print(f"[FAIL] Resolution tier not applied: {call['width']}x{call['height']} -> {image.size}")
+                return False
+            print(f"[OK] Generated at {call['width']}x{call['height']}, upscaled to {image.size}")
+
+            return True
+    except Exception as e:
+        print(f"[FAIL] Profile test failed: {e}")
+        return False
+
+def test_untuned_class_resets_options():
+    """Test options tuned for one asset class do not stay active for an untuned class"""
+    try:
+        with tempfile.TemporaryDirectory() as work_dir:
+            generator = AssetGenerator(use_mock=True)
+            generator.optimizer.hardware_profile = {'background': {
+                'num_inference_steps': 20, 'resolution_scale': 1.0, 'attention': 'sliced', 'vae': 'tiled'
+            }}
+            stand_in = MockSDXLPipeline()
+            generator.pipeline = stand_in
+            generator.optimizer.optimize_pipeline(stand_in)
+            generator.checkpoint_every = 0
+            generator.progress_history = ProgressHistory(os.path.join(work_dir, "history.json"))
+
+            background = dict(ArtDirection.get_hero_background_prompt('knight'), width=64, height=32)
+            generator._generate_image(background)
+            if stand_in.pipeline_options != {'attention': 'sliced', 'vae': 'tiled'}:
+                print(f"[FAIL] Tuned options not applied: {stand_in.pipeline_options}")
+                return False
+
+            ui = dict(ArtDirection.get_ui_element_prompt('arrow_left'), width=32, height=32)
+            generator._generate_image(ui)
+            defaults = generator.optimizer.default_pipeline_options
+            if stand_in.pipeline_options != defaults:
+                print(f"[FAIL] Untuned class kept {stand_in.pipeline_options}, defaults are {defaults}")
+                return False
+
+            print(f"[OK] Background ran with sliced/tiled, UI back on the defaults {defaults}")
+            return True
+    except Exception as e:
+        print(f"[FAIL] Option reset test failed: {e}")
+        return False
+
+def test_asset_classes():
+    """Test prompt configurations map to tuned asset classes"""
+    try:
+        classes = {
+            'background': ArtDirection.get_hero_background_prompt('knight'),
+            'sprite': ArtDirection.get_hero_sprite_prompt('mage'),
+            'ui': ArtDirection.get_ui_element_prompt('arrow_left'),
+            'card': ArtDirection.get_card_art_prompt({'id': 'strike', 'name': 'Strike', 'type': 'attack'})
+        }
+
+        for expected, prompt_config in classes.items():
+            if get_asset_class(prompt_config) != expected:
+                print(f"[FAIL] {expected} prompt classified as {get_asset_class(prompt_config)}")
+                return False
+
+        print(f"[OK] Asset classes detected: {', '.join(classes)}")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Asset class test failed: {e}")
+        return False
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("MEDIEVAL DECK - GENERATION AUTOTUNER TEST")
+    print("=" * 60)
+
+    tests = [
+        test_budget_selection,
+        test_over_budget_fallback,
+        test_profile_replaces_table,
+        test_untuned_class_resets_options,
+        test_asset_classes
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+            print()
+        except Exception as e:
+            print(f"[ERROR] Test {test.__name__} crashed: {e}")
+            print()
+
+    print("=" * 60)
+    print(f"AUTOTUNER RESULTS: {passed}/{total} tests passed")
+
+    if passed == total:
+        print("[SUCCESS] Generation autotuner operational!")
+    else:
+        print(f"[WARNING] {total - passed} tests failed - Review implementation")
+    print("=" * 60)
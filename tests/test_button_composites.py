@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Test script for cached button state composites and batched button drawing
+"""
+
+import pygame
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import WHITE, GRAY, DARK_GRAY, GOLD
+from utils.buttons import Button, MenuButtonSet
+
+def test_states_cached():
+    """Test each state is composited once and rebuilt only on text or size changes"""
+    try:
+        pygame.init()
+        font = pygame.font.Font(None, 40)
+        button = Button(10, 10, 200, 60, "JOGAR", font)
+        target = pygame.Surface((300, 100))
+
+        for _ in range(5):
+            button.draw(target)
+        normal = button.get_surface()
+        if target.get_at((15, 40))[:3] != DARK_GRAY or target.get_at((10, 40))[:3] != WHITE:
+            print("[FAIL] Normal composite does not match the old rect/border drawing")
+            return False
+
+        button.is_hovered = True
+        button.draw(target)
+        button.is_clicked = True
+        button.draw(target)
+        if button.rebuilds != 3 or target.get_at((15, 40))[:3] != GRAY:
+            print(f"[FAIL] Expected 3 state composites, got {button.rebuilds}")
+            return False
+
+        button.is_hovered = button.is_clicked = False
+        if button.get_surface() is not normal:
+            print("[FAIL] Normal composite not reused")
+            return False
+
+        button.text = "SAIR"
+        button.get_surface()
+        button.rect.size = (220, 60)
+        if button.get_surface().get_size() != (220, 60) or button.rebuilds != 5:
+            print(f"[FAIL] Text/size change not rebuilt ({button.rebuilds} rebuilds)")
+            return False
+
+        print(f"[OK] {button.rebuilds} composites over 7 frames and 2 style changes")
+        return True
+    except Exception as e:
+        print(f"[FAIL] State cache test failed: {e}")
+        return False
+    finally:
+        pygame.quit()
+
+def test_skinned_button():
+    """Test image skins fill the button and derive hover/pressed states"""
+    try:
+        pygame.init()
+        font = pygame.font.Font(None, 40)
+        art = pygame.Surface((32, 32))
+        art.fill((100, 50, 20))
+        button = Button(0, 0, 80, 80, "▶", font)
+        button.set_skin(art, show_text=False)
+
+        normal = button.get_surface("normal").get_at((40, 40))
+        hover = button.get_surface("hover").get_at((40, 40))
+        pressed = button.get_surface("pressed").get_at((40, 40))
+        if normal[:3] != (100, 50, 20) or hover.r <= normal.r or pressed.r >= normal.r:
+            print(f"[FAIL] Skin states wrong: {normal} {hover} {pressed}")
+            return False
+
+        button.set_skin({"normal": art, "hover": art, "pressed": art})
+        if button.get_surface("pressed").get_at((2, 2))[:3] != (100, 50, 20):
+            print("[FAIL] Per-state skin not used")
+            return False
+
+        print("[OK] Skin scaled to the button, hover brighter and pressed darker")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Skin test failed: {e}")
+        return False
+    finally:
+        pygame.quit()
+
+def test_button_set_single_blits():
+    """Test a button set draws every button through one blits call"""
+    try:
+        pygame.init()
+        font = pygame.font.Font(None, 40)
+        button_set = MenuButtonSet(1000, 800, font)
+        for text in ("JOGAR", "OPCOES", "SAIR"):
+            button_set.add_button(text)
+
+        class CountingCanvas:
+            def __init__(self, surface):
+                self.surface = surface
+                self.calls = []
+
+            def blits(self, sequence):
+                self.calls.append(len(sequence))
+                self.surface.blits(sequence, doreturn=False)
+
+        canvas = CountingCanvas(pygame.Surface((1000, 800)))
+        button_set.draw(canvas)
+        if canvas.calls != [3]:
+            print(f"[FAIL] Expected one blits call with 3 buttons, got {canvas.calls}")
+            return False
+
+        center = button_set.get_button_by_text("SAIR").rect.center
+        if canvas.surface.get_at((center[0] - 150, center[1]))[:3] != DARK_GRAY:
+            print("[FAIL] Button not drawn at its position")
+            return False
+
+        print("[OK] 3 buttons drawn in a single blits call")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Button set test failed: {e}")
+        return False
+    finally:
+        pygame.quit()
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("MEDIEVAL DECK - BUTTON COMPOSITES TEST")
+    print("=" * 60)
+
+    tests = [
+        test_states_cached,
+        test_skinned_button,
+        test_button_set_single_blits
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+            print()
+        except Exception as e:
+            print(f"[ERROR] Test {test.__name__} crashed: {e}")
+            print()
+
+    print("=" * 60)
+    print(f"BUTTON COMPOSITES RESULTS: {passed}/{total} tests passed")
+
+    if passed == total:
+        print("[SUCCESS] Button composites operational!")
+    else:
+        print(f"[WARNING] {total - passed} tests failed - Review implementation")
+    print("=" * 60)
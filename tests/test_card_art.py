@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Test script for the bulk card art pipeline
+"""
+
+import sys
+import os
+import tempfile
+from PIL import Image
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import CARD_ART_SIZE, CARD_THUMBNAIL_SIZE
+from gen_assets.card_art import CardArtPipeline
+from gen_assets.art_direction import ArtDirection
+from gen_assets.mock_pipeline import MockSDXLPipeline
+from tests.helpers import run_tests, make_mock_generator
+
+def test_card_definitions():
+    """Test base card definitions load and produce prompts"""
+    try:
+        cards = CardArtPipeline.load_card_definitions()
+        types = {card['type'] for card in cards}
+
+        if not {'attack', 'defense', 'magic'} <= types:
+            print(f"[FAIL] Missing card types: {types}")
+            return False
+
+        prompt = ArtDirection.get_card_art_prompt(cards[0])
+        if (prompt['width'], prompt['height']) != CARD_ART_SIZE:
+            print("[FAIL] Card prompt not at card resolution")
+            return False
+
+        if prompt['seed'] != ArtDirection.get_card_art_prompt(cards[0])['seed']:
+            print("[FAIL] Card seed not stable")
+            return False
+
+        print(f"[OK] {len(cards)} card definitions loaded ({', '.join(sorted(types))})")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Card definition test failed: {e}")
+        return False
+
+def test_generate_and_skip():
+    """Test card art and thumbnails are written, then skipped on the next run"""
+    try:
+        with tempfile.TemporaryDirectory() as work_dir:
+            output_dir = os.path.join(work_dir, "cards")
+            pipeline = CardArtPipeline(make_mock_generator(work_dir), output_dir)
+            cards = CardArtPipeline.load_card_definitions()[:3]
+
+            results = pipeline.generate_all(cards)
+            if len(results) != 3 or pipeline.last_stats['generated'] != 3:
+                print(f"[FAIL] Expected 3 generated cards: {pipeline.last_stats}")
+                return False
+
+            for card in cards:
+                paths = results[card['id']]
+                if Image.open(paths['art']).size != CARD_ART_SIZE:
+                    print(f"[FAIL] Art for {card['id']} not at card resolution")
+                    return False
+                if Image.open(paths['thumbnail']).size != CARD_THUMBNAIL_SIZE:
+                    print(f"[FAIL] Thumbnail for {card['id']} has wrong size")
+                    return False
+            print(f"[OK] Card art and thumbnails written - "
+                  f"{pipeline.last_stats['cards_per_minute']:.1f} cards/min")
+
+            pipeline.generate_all(cards)
+            if pipeline.last_stats['skipped'] != 3 or pipeline.last_stats['generated'] != 0:
+                print(f"[FAIL] Existing art not skipped: {pipeline.last_stats}")
+                return False
+            print(f"[OK] Existing art skipped in {pipeline.last_stats['elapsed_s'] * 1000:.1f}ms")
+
+            return True
+    except Exception as e:
+        print(f"[FAIL] Card generation test failed: {e}")
+        return False
+
+def test_batched_generation():
+    """Test cards are generated in batches through one pipeline call each"""
+    try:
+        with tempfile.TemporaryDirectory() as work_dir:
+            stand_in = MockSDXLPipeline()
+            output_dir = os.path.join(work_dir, "cards")
+            pipeline = CardArtPipeline(make_mock_generator(work_dir, stand_in), output_dir, batch_size=4)
+            cards = CardArtPipeline.load_card_definitions()[:6]
+            results = pipeline.generate_all(cards)
+
+            batch_sizes = [call['batch_size'] for call in stand_in.calls]
+            if batch_sizes != [4, 2]:
+                print(f"[FAIL] Unexpected batches: {batch_sizes}")
+                return False
+
+            if sorted(results) != sorted(card['id'] for card in cards) or \
+                    not all(os.path.exists(paths['art']) for paths in results.values()):
+                print(f"[FAIL] Batched cards not all written: {sorted(results)}")
+                return False
+
+            print(f"[OK] Cards generated in batches: {batch_sizes}")
+            return True
+    except Exception as e:
+        print(f"[FAIL] Batched generation test failed: {e}")
+        return False
+
+if __name__ == "__main__":
+    run_tests("CARD ART PIPELINE TEST", [
+        test_card_definitions,
+        test_generate_and_skip,
+        test_batched_generation
+    ], "CARD ART", "Card art pipeline operational!")
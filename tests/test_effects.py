@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Test script for the effects compositor (glows, panels, gradients)
+"""
+
+import pygame
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import GOLD
+from utils.effects import Effects
+from tests.helpers import run_tests, make_selection_screen
+
+def test_glow_baked_once():
+    """Test glows follow the sprite shape, fade out and are cached per sprite"""
+    try:
+        pygame.init()
+        effects = Effects()
+        sprite = pygame.Surface((100, 100), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, (255, 0, 0, 255), (50, 50), 40)
+
+        glow = effects.glow(sprite, GOLD, radius=16)
+        if glow.get_size() != (132, 132):
+            print(f"[FAIL] Glow size {glow.get_size()}")
+            return False
+
+        center, corner = glow.get_at((66, 66)), glow.get_at((2, 2))
+        if center.a < 200 or corner.a != 0 or center[:3] != GOLD:
+            print(f"[FAIL] Glow falloff wrong: center {center}, corner {corner}")
+            return False
+
+        if effects.glow(sprite, GOLD, radius=16) is not glow or effects.bakes != 1:
+            print("[FAIL] Glow baked again for the same sprite")
+            return False
+
+        print(f"[OK] Glow baked once, alpha {center.a} at the center and 0 at the corner")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Glow test failed: {e}")
+        return False
+    finally:
+        pygame.quit()
+
+def test_panel_and_gradient():
+    """Test panels are translucent with opaque borders and gradients span the colors"""
+    try:
+        pygame.init()
+        effects = Effects()
+        target = pygame.Surface((200, 100))
+        target.fill((200, 200, 200))
+        effects.draw_panel(target, (10, 10, 100, 50), (0, 0, 0, 128), GOLD, 3)
+
+        inside, border = target.get_at((50, 30)), target.get_at((11, 30))
+        if not 90 < inside.r < 110 or border[:3] != GOLD:
+            print(f"[FAIL] Panel not translucent: inside {inside}, border {border}")
+            return False
+
+        gradient = effects.gradient((10, 101), (32, 16, 64), (0, 0, 0))
+        if gradient.get_at((5, 0))[:3] != (32, 16, 64) or gradient.get_at((5, 100))[:3] != (0, 0, 0):
+            print("[FAIL] Gradient endpoints wrong")
+            return False
+
+        if effects.panel((100, 50), (0, 0, 0, 128), GOLD, 3) is not effects.panel((100, 50), (0, 0, 0, 128), GOLD, 3):
+            print("[FAIL] Panel not cached")
+            return False
+
+        print("[OK] Panel blends at 50%, gradient endpoints exact, both cached")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Panel test failed: {e}")
+        return False
+    finally:
+        pygame.quit()
+
+def test_selection_no_per_frame_bakes():
+    """Test the selection screen bakes its effects on the first frame only"""
+    try:
+        pygame.init()
+        screen, selection = make_selection_screen()
+        effects = selection.effects
+
+        selection.render(screen)
+        baked = effects.get_stats()
+        first_frame = pygame.image.tobytes(screen, "RGB")
+        for _ in range(5):
+            selection.render(screen)
+        stats = effects.get_stats()
+
+        if stats['bakes'] != baked['bakes'] or stats['scratch_allocations'] != baked['scratch_allocations']:
+            print(f"[FAIL] Effects rebaked per frame: {baked} -> {stats}")
+            return False
+        if stats['hits'] == 0:
+            print("[FAIL] Selection screen did not use the effects cache")
+            return False
+        if pygame.image.tobytes(screen, "RGB") != first_frame:
+            print("[FAIL] Cached effects drew a different frame than the first bake")
+            return False
+
+        print(f"[OK] {stats['bakes']} bakes on the first frame, {stats['hits']} cache hits afterwards")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Selection effects test failed: {e}")
+        return False
+    finally:
+        pygame.quit()
+
+if __name__ == "__main__":
+    run_tests("EFFECTS TEST", [
+        test_glow_baked_once,
+        test_panel_and_gradient,
+        test_selection_no_per_frame_bakes
+    ], "EFFECTS", "Effects compositor operational!")
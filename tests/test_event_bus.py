@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Test script for the type-indexed event bus
+"""
+
+import pygame
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.event_bus import EventBus
+from screens.selection import SelectionScreen
+
+def motion(pos, rel=(1, 0)):
+    """Mouse motion event"""
+    return pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=rel, buttons=(0, 0, 0))
+
+def click(pos):
+    """Left mouse button press"""
+    return pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=1)
+
+def test_type_and_region_dispatch():
+    """Test handlers only see their event type and region, and results end dispatch"""
+    try:
+        bus = EventBus()
+        calls = []
+        bus.subscribe(pygame.KEYDOWN, lambda event: calls.append("key"))
+        bus.subscribe(pygame.MOUSEBUTTONDOWN, lambda event: calls.append("left"), region=pygame.Rect(0, 0, 100, 100))
+        bus.subscribe(pygame.MOUSEBUTTONDOWN, lambda event: "right", region=pygame.Rect(200, 0, 100, 100))
+        late = bus.subscribe(pygame.MOUSEBUTTONDOWN, lambda event: calls.append("late"))
+
+        result = bus.dispatch([click((50, 50)), motion((10, 10))])
+        if calls != ["left", "late"] or result is not None:
+            print(f"[FAIL] Unexpected handlers ran: {calls}")
+            return False
+
+        calls.clear()
+        result = bus.dispatch([click((250, 50)), pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a)])
+        if result != "right" or calls:
+            print(f"[FAIL] Result did not end dispatch: {result} {calls}")
+            return False
+
+        bus.unsubscribe(pygame.MOUSEBUTTONDOWN, late)
+        bus.dispatch([click((150, 50))])
+        if calls:
+            print(f"[FAIL] Unsubscribed handler still called: {calls}")
+            return False
+
+        print("[OK] Dispatch filtered by type and region")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Dispatch test failed: {e}")
+        return False
+
+def test_motion_coalescing():
+    """Test only the last mouse motion of a frame is kept, in order"""
+    try:
+        bus = EventBus()
+        events = [motion((i, 0)) for i in range(50)] + [click((49, 0))] + [motion((60 + i, 0)) for i in range(10)]
+        coalesced = bus.coalesce(events)
+
+        if len(coalesced) != 2 or coalesced[0].type != pygame.MOUSEBUTTONDOWN:
+            print(f"[FAIL] Expected click then one motion: {coalesced}")
+            return False
+
+        last = coalesced[1]
+        if last.pos != (69, 0) or last.rel != (60, 0):
+            print(f"[FAIL] Coalesced motion wrong: {last.pos} {last.rel}")
+            return False
+
+        print(f"[OK] {len(events)} events coalesced to {len(coalesced)}")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Coalescing test failed: {e}")
+        return False
+
+def test_selection_screen_dispatch():
+    """Test the selection screen widgets work through the bus"""
+    try:
+        pygame.init()
+        pygame.display.set_mode((100, 100))
+        selection = SelectionScreen(type('Game', (), {'selected_hero': None})())
+
+        if len(selection.event_bus.handlers[pygame.KEYDOWN]) != 1:
+            print("[FAIL] Keyboard events reach more than the keyboard handler")
+            return False
+
+        selection.handle_events([click(selection.right_arrow.rect.center)])
+        if selection.selected_hero != selection.heroes_list[1]:
+            print(f"[FAIL] Right arrow click not handled: {selection.selected_hero}")
+            return False
+
+        selection.handle_events([motion(selection.confirm_button.rect.center)])
+        if not selection.confirm_button.is_hovered:
+            print("[FAIL] Hover not updated")
+            return False
+
+        result = selection.handle_events([click(selection.confirm_button.rect.center)])
+        if result != "gameplay":
+            print(f"[FAIL] Confirm returned {result}")
+            return False
+
+        if selection.handle_events([click(selection.back_button.rect.center)]) != "menu":
+            print("[FAIL] Back button did not return to menu")
+            return False
+
+        print("[OK] Arrows, hover, confirm and back dispatched through the bus")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Selection dispatch test failed: {e}")
+        return False
+    finally:
+        pygame.quit()
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("MEDIEVAL DECK - EVENT BUS TEST")
+    print("=" * 60)
+
+    tests = [
+        test_type_and_region_dispatch,
+        test_motion_coalescing,
+        test_selection_screen_dispatch
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+            print()
+        except Exception as e:
+            print(f"[ERROR] Test {test.__name__} crashed: {e}")
+            print()
+
+    print("=" * 60)
+    print(f"EVENT BUS RESULTS: {passed}/{total} tests passed")
+
+    if passed == total:
+        print("[SUCCESS] Event bus operational!")
+    else:
+        print(f"[WARNING] {total - passed} tests failed - Review implementation")
+    print("=" * 60)
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Test script for the shared font registry and glyph atlas text
+"""
+
+import pygame
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import WHITE, GOLD
+from utils.canvas import TextureCanvas
+from utils.fonts import FontRegistry, GlyphAtlas
+from main import MedievalDeck, GameState
+from tests.helpers import run_tests
+
+def draw_on_black(draw, size=(300, 60)):
+    """Red channel bytes of a black surface after draw(surface)"""
+    target = pygame.Surface(size)
+    draw(target)
+    return pygame.image.tobytes(target, "RGB")[::3]
+
+def test_registry_dedupes():
+    """Test fonts and atlases are created once per key"""
+    try:
+        pygame.init()
+        fonts = FontRegistry()
+        if fonts.get(50) is not fonts.get(50) or fonts.get(50) is fonts.get(60):
+            print("[FAIL] Fonts not keyed by size")
+            return False
+        if fonts.atlas(50) is not fonts.atlas(50, WHITE) or fonts.atlas(50, GOLD) is fonts.atlas(50):
+            print("[FAIL] Atlases not keyed by color")
+            return False
+        if fonts.atlas(50).font is not fonts.get(50):
+            print("[FAIL] Atlas does not share the registry font")
+            return False
+
+        print(f"[OK] {fonts.get_stats()}")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Registry test failed: {e}")
+        return False
+    finally:
+        pygame.quit()
+
+def test_atlas_matches_font():
+    """Test atlas text matches font.render: identical glyphs and damage numbers, same ink for longer text"""
+    try:
+        pygame.init()
+        font = pygame.font.Font(None, 40)
+        atlas = GlyphAtlas(font, WHITE)
+
+        for char, glyph in atlas.glyphs.items():
+            if pygame.image.tobytes(glyph, "RGBA") != pygame.image.tobytes(font.render(char, True, WHITE), "RGBA"):
+                print(f"[FAIL] Packed glyph {char!r} differs from font.render")
+                return False
+
+        for number in ("-12", "+5"):
+            if draw_on_black(lambda target: atlas.draw(target, number, (0, 0))) != \
+                    draw_on_black(lambda target: target.blit(font.render(number, True, WHITE), (0, 0))):
+                print(f"[FAIL] Atlas {number!r} differs from font.render")
+                return False
+
+        # Longer strings are not pixel-exact (no kerning or subpixel pen positions),
+        # but must be the same glyph ink within about a pixel per character
+        text = "HP: 27/30 -5"
+        width, height = atlas.size(text)
+        expected_width, expected_height = font.size(text)
+        if height != expected_height or abs(width - expected_width) > len(text):
+            print(f"[FAIL] Atlas size {(width, height)} vs font {(expected_width, expected_height)}")
+            return False
+        ink = sum(draw_on_black(lambda target: atlas.draw(target, text, (0, 0))))
+        expected_ink = sum(draw_on_black(lambda target: target.blit(font.render(text, True, WHITE), (0, 0))))
+        if abs(ink - expected_ink) > expected_ink * 0.01:
+            print(f"[FAIL] Atlas text ink {ink} vs font {expected_ink}")
+            return False
+
+        target = pygame.Surface((300, 60))
+        rect = atlas.draw(target, text, (150, 30), anchor="center")
+        lit = [x for x in range(300) for y in range(60) if target.get_at((x, y))[0] > 128]
+        if not lit or min(lit) < rect.left or max(lit) >= rect.right:
+            print("[FAIL] Glyphs drawn outside the text rect")
+            return False
+
+        glyphs = len(atlas.glyphs)
+        atlas.draw(target, "Ação", (0, 0))
+        if len(atlas.glyphs) != glyphs + 2:
+            print("[FAIL] Characters outside the charset not cached")
+            return False
+
+        print(f"[OK] {glyphs} glyphs identical to font.render, {width}x{height} text, extra characters cached on first use")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Atlas test failed: {e}")
+        return False
+    finally:
+        pygame.quit()
+
+def test_screens_share_fonts():
+    """Test screens take their fonts from the game's registry and changing numbers upload no new textures"""
+    try:
+        pygame.init()
+        game = MedievalDeck(use_mock=True)
+        game.change_state(GameState.SELECTION)
+        game.render()
+
+        selection = game.selection_screen
+        if selection.title_font is not game.title_font or selection.desc_font is not game.fonts.get(50):
+            print("[FAIL] Selection screen built its own fonts")
+            return False
+        fonts = game.fonts.get_stats()['fonts']
+        # Game, menu and selection asked for 10 fonts across 7 distinct sizes
+        if fonts != 7:
+            print(f"[FAIL] Expected 7 distinct (face, size) fonts, got {fonts}")
+            return False
+
+        canvas = TextureCanvas.create((400, 100), accelerated=0)
+        atlas = game.fonts.atlas(50)
+        for hp in range(30, 0, -1):
+            canvas.fill((0, 0, 0))
+            atlas.draw(canvas, f"HP {hp}", (10, 10))
+        uploads = canvas.uploads
+        del canvas  # Textures must not outlive pygame.quit
+        if uploads > 12:
+            print(f"[FAIL] {uploads} texture uploads for 30 different strings")
+            return False
+
+        print(f"[OK] {fonts} fonts shared by all screens, {uploads} glyph uploads for 30 HP values")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Shared fonts test failed: {e}")
+        return False
+    finally:
+        pygame.quit()
+
+if __name__ == "__main__":
+    run_tests("FONTS TEST", [
+        test_registry_dedupes,
+        test_atlas_matches_font,
+        test_screens_share_fonts
+    ], "FONTS", "Font registry operational!")
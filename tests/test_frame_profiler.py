@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Test script for the frame profiler overlay
+"""
+
+import pygame
+import sys
+import os
+import csv
+import tempfile
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.profiler import FrameProfiler, OVERLAY_RECT
+from main import MedievalDeck
+
+def test_disabled_records_nothing():
+    """Test a disabled profiler keeps no frames"""
+    try:
+        profiler = FrameProfiler()
+        for _ in range(100):
+            profiler.begin_frame()
+            profiler.mark("events")
+            profiler.mark("render.menu")
+            profiler.end_frame()
+
+        if profiler.frames:
+            print("[FAIL] Disabled profiler recorded frames")
+            return False
+
+        print("[OK] Disabled profiler records nothing")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Disabled profiler test failed: {e}")
+        return False
+
+def test_statistics_and_csv():
+    """Test phase statistics, percentiles, histogram and CSV export"""
+    try:
+        profiler = FrameProfiler(history=50)
+        profiler.toggle()
+        for frame in range(60):
+            profiler.begin_frame()
+            profiler.mark("events")
+            profiler.mark("render.menu")
+            profiler.end_frame()
+
+        if len(profiler.frames) != 50:
+            print(f"[FAIL] History not bounded: {len(profiler.frames)}")
+            return False
+
+        stats = profiler.get_phase_stats()
+        percentiles = profiler.get_percentiles()
+        if set(stats) != {"events", "render.menu"} or not percentiles[50] <= percentiles[99]:
+            print(f"[FAIL] Unexpected stats: {stats} {percentiles}")
+            return False
+
+        if sum(profiler.get_histogram()) != 50:
+            print("[FAIL] Histogram does not cover every frame")
+            return False
+        print(f"[OK] Phases {sorted(stats)}, p99 {percentiles[99]:.3f}ms")
+
+        with tempfile.TemporaryDirectory() as output_dir:
+            path = profiler.dump_csv(os.path.join(output_dir, "frames.csv"), last=10)
+            with open(path, newline="") as f:
+                rows = list(csv.reader(f))
+
+        if rows[0] != ["frame", "total_ms", "events", "render.menu"] or len(rows) != 11:
+            print(f"[FAIL] CSV wrong: {rows[:2]}")
+            return False
+
+        print(f"[OK] CSV exported with {len(rows) - 1} frames")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Statistics test failed: {e}")
+        return False
+
+def test_hotkey_and_overlay():
+    """Test F3 toggles profiling in the game loop and the overlay draws"""
+    try:
+        pygame.init()
+        game = MedievalDeck()
+
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_F3, mod=0, unicode=""))
+        game.run_frame(1.0 / 60)
+
+        for _ in range(3):
+            game.run_frame(1.0 / 60)
+            game.profiler.mark("wait")
+            game.profiler.end_frame()
+
+        if not game.profiler.enabled or len(game.profiler.frames) != 3:
+            print(f"[FAIL] Profiler not recording after F3: {len(game.profiler.frames)} frames")
+            return False
+
+        phases = set(game.profiler.get_phase_stats())
+        expected = {"events", "update", "render.menu", "overlay", "flip", "wait"}
+        if not expected <= phases:
+            print(f"[FAIL] Missing phases: {expected - phases}")
+            return False
+
+        print(f"[OK] Game frames profiled: {sorted(phases)}")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Hotkey test failed: {e}")
+        return False
+    finally:
+        pygame.quit()
+
+def test_overlay_text_clear_of_histogram():
+    """Test many phases are capped so their rows stay above the histogram"""
+    try:
+        pygame.init()
+        profiler = FrameProfiler()
+        profiler.toggle()
+        for _ in range(30):
+            profiler.begin_frame()
+            for index in range(16):
+                profiler.mark(f"render.screen_{index}")
+            profiler.end_frame()
+
+        target = pygame.Surface((600, 420))
+        profiler.draw(target)
+
+        # Text is antialiased white (grey pixels); bars and markers are coloured
+        graph_top = OVERLAY_RECT.bottom - 90
+        text_in_graph = []
+        for x in range(OVERLAY_RECT.left, OVERLAY_RECT.right):
+            for y in range(graph_top, OVERLAY_RECT.bottom):
+                r, g, b, _ = target.get_at((x, y))
+                if r == g == b > 0:
+                    text_in_graph.append((x, y))
+        if text_in_graph:
+            print(f"[FAIL] Phase rows drawn over the histogram at {text_in_graph[0]}")
+            return False
+
+        text_rows = [y for y in range(OVERLAY_RECT.top, graph_top)
+                     if any(target.get_at((x, y))[0] > 128 for x in range(OVERLAY_RECT.left, OVERLAY_RECT.right, 2))]
+        if not text_rows or text_rows[-1] < graph_top - 60:
+            print("[FAIL] Phase rows missing above the histogram")
+            return False
+
+        print(f"[OK] 16 phases capped above the histogram (text ends at y={text_rows[-1]}, graph at {graph_top})")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Overlay layout test failed: {e}")
+        return False
+    finally:
+        pygame.quit()
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("MEDIEVAL DECK - FRAME PROFILER TEST")
+    print("=" * 60)
+
+    tests = [
+        test_disabled_records_nothing,
+        test_statistics_and_csv,
+        test_hotkey_and_overlay,
+        test_overlay_text_clear_of_histogram
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+            print()
+        except Exception as e:
+            print(f"[ERROR] Test {test.__name__} crashed: {e}")
+            print()
+
+    print("=" * 60)
+    print(f"FRAME PROFILER RESULTS: {passed}/{total} tests passed")
+
+    if passed == total:
+        print("[SUCCESS] Frame profiler operational!")
+    else:
+        print(f"[WARNING] {total - passed} tests failed - Review implementation")
+    print("=" * 60)
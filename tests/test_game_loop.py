@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Test script for the fixed-timestep game loop
+"""
+
+import pygame
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import UPDATE_RATE, MAX_CATCHUP_STEPS
+from main import MedievalDeck
+
+def make_counting_game():
+    """Game whose update() only counts simulation steps"""
+    game = MedievalDeck()
+    game.update_count = 0
+
+    def count_update():
+        game.update_count += 1
+
+    game.update = count_update
+    return game
+
+def test_fixed_steps_and_alpha():
+    """Test partial frames accumulate into fixed steps with an interpolation alpha"""
+    try:
+        pygame.init()
+        game = make_counting_game()
+        dt = game.update_dt
+
+        alpha = game.advance(dt * 0.5)
+        if game.update_count != 0 or abs(alpha - 0.5) > 1e-6:
+            print(f"[FAIL] Half frame ran {game.update_count} steps, alpha {alpha}")
+            return False
+
+        alpha = game.advance(dt * 0.75)
+        if game.update_count != 1 or abs(alpha - 0.25) > 1e-6:
+            print(f"[FAIL] Accumulated frame ran {game.update_count} steps, alpha {alpha}")
+            return False
+
+        game.render(alpha)
+        if game.render_alpha != alpha:
+            print("[FAIL] Alpha not passed to render")
+            return False
+
+        print(f"[OK] Fixed steps of {dt * 1000:.1f}ms with alpha {alpha:.2f} passed to render")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Fixed step test failed: {e}")
+        return False
+    finally:
+        pygame.quit()
+
+def test_simulation_speed_under_slow_rendering():
+    """Test simulation keeps real-time speed when rendering drops to 24 FPS"""
+    try:
+        pygame.init()
+        game = make_counting_game()
+
+        for _ in range(24):
+            game.advance(1.0 / 24)
+
+        if abs(game.update_count - UPDATE_RATE) > 1:
+            print(f"[FAIL] {game.update_count} steps for one simulated second")
+            return False
+
+        print(f"[OK] {game.update_count} simulation steps in one second at 24 FPS")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Simulation speed test failed: {e}")
+        return False
+    finally:
+        pygame.quit()
+
+def test_catchup_cap():
+    """Test a long hitch runs at most MAX_CATCHUP_STEPS and drops the backlog"""
+    try:
+        pygame.init()
+        game = make_counting_game()
+
+        alpha = game.advance(2.0)
+        if game.update_count != MAX_CATCHUP_STEPS or not 0 <= alpha < 1:
+            print(f"[FAIL] Hitch ran {game.update_count} steps, alpha {alpha}")
+            return False
+
+        game.advance(0)
+        if game.update_count != MAX_CATCHUP_STEPS:
+            print("[FAIL] Backlog not dropped after hitch")
+            return False
+
+        print(f"[OK] 2s hitch capped at {MAX_CATCHUP_STEPS} steps")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Catch-up cap test failed: {e}")
+        return False
+    finally:
+        pygame.quit()
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("MEDIEVAL DECK - GAME LOOP TEST")
+    print("=" * 60)
+
+    tests = [
+        test_fixed_steps_and_alpha,
+        test_simulation_speed_under_slow_rendering,
+        test_catchup_cap
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+            print()
+        except Exception as e:
+            print(f"[ERROR] Test {test.__name__} crashed: {e}")
+            print()
+
+    print("=" * 60)
+    print(f"GAME LOOP RESULTS: {passed}/{total} tests passed")
+
+    if passed == total:
+        print("[SUCCESS] Fixed-timestep game loop operational!")
+    else:
+        print(f"[WARNING] {total - passed} tests failed - Review implementation")
+    print("=" * 60)
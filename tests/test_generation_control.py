@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Test script for generation timeouts, cancellation and resumable checkpoints
+Runs the real generation path against the CPU stand-in pipeline
+"""
+
+import sys
+import os
+import tempfile
+import threading
+import time
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gen_assets.generate_backgrounds import AssetGenerator
+from gen_assets.mock_pipeline import MockSDXLPipeline
+from gen_assets.generation_control import GenerationCancelled, GenerationTimeout
+from gen_assets.scheduler import GenerationScheduler, JobPriority
+from gen_assets.progress import ProgressHistory
+
+def make_prompt_config():
+    """Small prompt configuration so the stand-in runs quickly"""
+    return {
+        'positive': "Medieval knight throne room, gothic stone architecture",
+        'negative': "cartoon, anime, low quality",
+        'width': 64,
+        'height': 64,
+        'seed': 42,
+        'hero': 'knight'
+    }
+
+# ETA history lives apart from the checkpoint directories the tests inspect
+HISTORY_DIR = tempfile.TemporaryDirectory()
+
+def make_generator(pipeline, checkpoint_dir, timeout=None, checkpoint_every=0):
+    """AssetGenerator driving the stand-in pipeline through the real path"""
+    generator = AssetGenerator(use_mock=True)
+    generator.pipeline = pipeline
+    generator.generation_timeout = timeout
+    generator.checkpoint_every = checkpoint_every
+    generator.checkpoint_dir = checkpoint_dir
+    generator.progress_history = ProgressHistory(os.path.join(HISTORY_DIR.name, "history.json"))
+    return generator
+
+def test_timeout():
+    """Test a slow generation is aborted once it exceeds its timeout"""
+    try:
+        with tempfile.TemporaryDirectory() as checkpoint_dir:
+            pipeline = MockSDXLPipeline(step_delay=0.02)
+            generator = make_generator(pipeline, checkpoint_dir, timeout=0.1)
+
+            start = time.perf_counter()
+            try:
+                generator._generate_image(make_prompt_config())
+                print("[FAIL] Generation finished despite timeout")
+                return False
+            except GenerationTimeout as e:
+                elapsed = time.perf_counter() - start
+                print(f"[OK] Timed out after {elapsed:.2f}s: {e}")
+
+            if elapsed > 0.5:
+                print("[FAIL] Timeout enforced too late")
+                return False
+
+            return True
+    except Exception as e:
+        print(f"[FAIL] Timeout test failed: {e}")
+        return False
+
+def test_cooperative_cancellation():
+    """Test cancel_generation stops the pipeline at the next step"""
+    try:
+        with tempfile.TemporaryDirectory() as checkpoint_dir:
+            pipeline = MockSDXLPipeline(step_delay=0.02)
+            generator = make_generator(pipeline, checkpoint_dir)
+            outcome = {}
+
+            def run():
+                try:
+                    generator._generate_image(make_prompt_config())
+                    outcome['result'] = 'finished'
+                except GenerationCancelled as e:
+                    outcome['result'] = 'cancelled'
+
+            worker = threading.Thread(target=run)
+            worker.start()
+
+            while generator.active_control is None and worker.is_alive():
+                time.sleep(0.005)
+            time.sleep(0.05)
+
+            if not generator.cancel_generation():
+                print("[FAIL] No running generation to cancel")
+                return False
+
+            worker.join(timeout=5)
+            if outcome.get('result') != 'cancelled':
+                print(f"[FAIL] Generation not cancelled: {outcome}")
+                return False
+
+            print("[OK] Running generation cancelled through step callback")
+            return True
+    except Exception as e:
+        print(f"[FAIL] Cancellation test failed: {e}")
+        return False
+
+def test_checkpoint_resume():
+    """Test an interrupted job resumes from its last checkpoint with identical output"""
+    try:
+        with tempfile.TemporaryDirectory() as checkpoint_dir:
+            reference = make_generator(MockSDXLPipeline(), checkpoint_dir, checkpoint_every=5)
+            expected = reference._generate_image(make_prompt_config())
+
+            crashing = make_generator(MockSDXLPipeline(fail_at_step=12), checkpoint_dir, checkpoint_every=5)
+            try:
+                crashing._generate_image(make_prompt_config())
+                print("[FAIL] Simulated crash did not happen")
+                return False
+            except RuntimeError:
+                print("[OK] First run interrupted at step 12")
+
+            pipeline = MockSDXLPipeline()
+            resumed = make_generator(pipeline, checkpoint_dir, checkpoint_every=5)
+            image = resumed._generate_image(make_prompt_config())
+
+            call = pipeline.calls[-1]
+            if call['start_step'] != 10:
+                print(f"[FAIL] Resumed from step {call['start_step']} instead of 10")
+                return False
+            print(f"[OK] Resumed from step {call['start_step']}/{call['steps']}")
+
+            if list(image.getdata()) != list(expected.getdata()):
+                print("[FAIL] Resumed output differs from uninterrupted run")
+                return False
+            print("[OK] Resumed output matches uninterrupted run")
+
+            if os.listdir(checkpoint_dir):
+                print("[FAIL] Checkpoint not cleared after completion")
+                return False
+
+            return True
+    except Exception as e:
+        print(f"[FAIL] Checkpoint resume test failed: {e}")
+        return False
+
+def test_scheduler_cancel():
+    """Test scheduler cancellation of queued and running jobs"""
+    try:
+        scheduler = GenerationScheduler()
+        interrupted = threading.Event()
+        release = threading.Event()
+
+        def long_job():
+            release.wait(5)
+            return 'done' if not interrupted.is_set() else None
+
+        scheduler.submit('running', long_job, JobPriority.VISIBLE,
+                         on_cancel=lambda: (interrupted.set(), release.set()))
+        scheduler.submit('queued', lambda: 'never', JobPriority.SPECULATIVE)
+        scheduler.start()
+
+        while scheduler.jobs['running'].started_at is None:
+            time.sleep(0.005)
+
+        if not scheduler.cancel('queued') or not scheduler.cancel('running'):
+            print("[FAIL] Jobs could not be cancelled")
+            return False
+
+        scheduler.wait('running', timeout=5)
+        scheduler.stop(timeout=5)
+
+        if scheduler.jobs['queued'].started_at is not None or not interrupted.is_set():
+            print("[FAIL] Cancelled jobs still ran")
+            return False
+
+        print("[OK] Queued job dropped and running job interrupted")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Scheduler cancel test failed: {e}")
+        return False
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("MEDIEVAL DECK - GENERATION CONTROL TEST")
+    print("=" * 60)
+
+    tests = [
+        test_timeout,
+        test_cooperative_cancellation,
+        test_checkpoint_resume,
+        test_scheduler_cancel
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+            print()
+        except Exception as e:
+            print(f"[ERROR] Test {test.__name__} crashed: {e}")
+            print()
+
+    print("=" * 60)
+    print(f"GENERATION CONTROL RESULTS: {passed}/{total} tests passed")
+
+    if passed == total:
+        print("[SUCCESS] Timeouts, cancellation and checkpoints operational!")
+    else:
+        print(f"[WARNING] {total - passed} tests failed - Review implementation")
+    print("=" * 60)
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Test script for the persistent generation daemon
+Uses a stand-in daemon with the mock backend on an ephemeral port
+"""
+
+import sys
+import os
+import tempfile
+from PIL import Image
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gen_assets.generate_backgrounds import AssetGenerator
+from gen_assets.daemon import GenerationDaemon, DaemonClient
+from gen_assets.art_direction import ArtDirection
+
+def start_mock_daemon():
+    """Start a mock-backed daemon on a free port"""
+    daemon = GenerationDaemon(AssetGenerator(use_mock=True, use_daemon=False), port=0)
+    daemon.warm_up()
+    daemon.start()
+    return daemon
+
+def test_daemon_health():
+    """Test the daemon answers health checks with its backend"""
+    daemon = start_mock_daemon()
+    try:
+        health = DaemonClient(port=daemon.port).health()
+        if not health or health['backend'] != 'mock':
+            print(f"[FAIL] Unexpected health response: {health}")
+            return False
+
+        if DaemonClient(port=1).is_available():
+            print("[FAIL] Unreachable daemon reported available")
+            return False
+
+        print(f"[OK] Daemon healthy on port {daemon.port}: {health}")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Daemon health test failed: {e}")
+        return False
+    finally:
+        daemon.stop()
+
+def test_client_generation():
+    """Test a client receives generated images from the daemon"""
+    daemon = start_mock_daemon()
+    try:
+        prompt_config = ArtDirection.get_ui_element_prompt('arrow_left')
+        image = DaemonClient(port=daemon.port).generate(prompt_config)
+
+        if image.size != (prompt_config['width'], prompt_config['height']):
+            print(f"[FAIL] Wrong image size from daemon: {image.size}")
+            return False
+
+        print(f"[OK] Daemon generated {image.size[0]}x{image.size[1]} image")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Client generation test failed: {e}")
+        return False
+    finally:
+        daemon.stop()
+
+def test_generator_uses_daemon():
+    """Test AssetGenerator transparently routes generation to a running daemon"""
+    daemon = start_mock_daemon()
+    backgrounds_dir = tempfile.TemporaryDirectory()
+    try:
+        generator = AssetGenerator(backgrounds_dir=backgrounds_dir.name)
+        generator.daemon_client = DaemonClient(port=daemon.port)
+
+        generator._initialize_pipeline()
+        if generator.pipeline != "daemon":
+            print(f"[FAIL] Generator did not pick up the daemon: {generator.pipeline}")
+            return False
+
+        image = generator._generate_image(ArtDirection.get_ui_element_prompt('title_emblem'))
+        if image.size != (512, 512) or daemon.requests_served != 1:
+            print("[FAIL] Generation not served by the daemon")
+            return False
+        print("[OK] AssetGenerator generated through the daemon")
+
+        source_path = os.path.join(backgrounds_dir.name, "knight_source.png")
+        Image.new('RGB', (344, 144), (30, 30, 60)).save(source_path)
+        path = generator.generate_background_variant('knight', 'event', source_path=source_path)
+
+        if not path or daemon.requests_served != 2:
+            print("[FAIL] Variant not derived through the daemon")
+            return False
+        print("[OK] Variant derived through the daemon")
+
+        return True
+    except Exception as e:
+        print(f"[FAIL] Generator daemon test failed: {e}")
+        return False
+    finally:
+        daemon.stop()
+        backgrounds_dir.cleanup()
+
+def test_save_path_confined():
+    """Test the daemon refuses to write PNGs outside its asset directories"""
+    with tempfile.TemporaryDirectory() as asset_dir, tempfile.TemporaryDirectory() as other_dir:
+        daemon = GenerationDaemon(AssetGenerator(use_mock=True, use_daemon=False), port=0,
+                                  asset_dirs=[asset_dir])
+        daemon.warm_up()
+        daemon.start()
+        try:
+            client = DaemonClient(port=daemon.port)
+            prompt_config = ArtDirection.get_ui_element_prompt('arrow_left')
+            rejected = [os.path.join(other_dir, "evil.png"),
+                        os.path.join(asset_dir, "..", os.path.basename(other_dir), "evil.png"),
+                        os.path.join(asset_dir, "notes.txt")]
+            for save_path in rejected:
+                try:
+                    client.generate_shared(prompt_config, save_path=save_path)
+                    print(f"[FAIL] Daemon accepted {save_path}")
+                    return False
+                except RuntimeError:
+                    pass
+
+            daemon.png_writer.flush()
+            if os.listdir(other_dir) or os.listdir(asset_dir) or daemon.requests_served:
+                print("[FAIL] Rejected request still generated or wrote a file")
+                return False
+
+            print(f"[OK] {len(rejected)} save paths outside the asset directory refused before generating")
+            return True
+        except Exception as e:
+            print(f"[FAIL] Save path test failed: {e}")
+            return False
+        finally:
+            daemon.stop()
+
+def test_daemon_error_reporting():
+    """Test daemon failures reach the client as errors"""
+    daemon = start_mock_daemon()
+    try:
+        try:
+            DaemonClient(port=daemon.port).generate({'positive': 'missing size'})
+            print("[FAIL] Invalid request did not fail")
+            return False
+        except RuntimeError as e:
+            print(f"[OK] Daemon error reported to client: {e}")
+            return True
+    except Exception as e:
+        print(f"[FAIL] Daemon error test failed: {e}")
+        return False
+    finally:
+        daemon.stop()
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("MEDIEVAL DECK - GENERATION DAEMON TEST")
+    print("=" * 60)
+
+    tests = [
+        test_daemon_health,
+        test_client_generation,
+        test_generator_uses_daemon,
+        test_save_path_confined,
+        test_daemon_error_reporting
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+            print()
+        except Exception as e:
+            print(f"[ERROR] Test {test.__name__} crashed: {e}")
+            print()
+
+    print("=" * 60)
+    print(f"GENERATION DAEMON RESULTS: {passed}/{total} tests passed")
+
+    if passed == total:
+        print("[SUCCESS] Generation daemon operational!")
+    else:
+        print(f"[WARNING] {total - passed} tests failed - Review implementation")
+    print("=" * 60)
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Test script for the persistent generation metrics store
+"""
+
+import sys
+import os
+import io
+import tempfile
+from contextlib import redirect_stdout
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gen_assets.metrics import GenerationMetricsStore
+from gen_assets.card_art import CardArtPipeline
+from gen_assets.mock_pipeline import MockSDXLPipeline
+from tests.helpers import run_tests, make_mock_generator
+
+def test_store_queries():
+    """Test events are stored, filtered and aggregated"""
+    try:
+        with tempfile.TemporaryDirectory() as work_dir:
+            store = GenerationMetricsStore(os.path.join(work_dir, "metrics.db"), hardware_id="test")
+            store.record('generation', 'knight_1234.png', 3440, 1440, 30, 42.0, 1.5, 2.0, 'StableDiffusionXLPipeline')
+            store.record('generation', 'mage_5678.png', 3440, 1440, 30, 44.0, 1.5, 2.1, 'StableDiffusionXLPipeline')
+            store.record('generation', 'knight_1234.png', 3440, 1440, backend='StableDiffusionXLPipeline',
+                         cache_hit=True)
+
+            knight_rows = store.query(asset_id='knight')
+            if len(knight_rows) != 2 or not knight_rows[0]['cache_hit']:
+                print(f"[FAIL] Asset query wrong: {knight_rows}")
+                return False
+
+            summary = store.summary()
+            if len(summary) != 1 or summary[0]['count'] != 2 or summary[0]['mean_s'] != 43.0:
+                print(f"[FAIL] Summary wrong: {summary}")
+                return False
+
+            hit_rate = store.get_cache_hit_rate()
+            if abs(hit_rate - 1 / 3) > 1e-9:
+                print(f"[FAIL] Cache hit rate wrong: {hit_rate}")
+                return False
+
+            output = io.StringIO()
+            with redirect_stdout(output):
+                store.print_report(asset_id='knight')
+            report = output.getvalue()
+            if (report.count('knight_1234.png') != 2 or 'mage_5678.png' in report
+                    or "2 runs, mean 43.00s" not in report or "Cache hit rate: 33.3%" not in report):
+                print(f"[FAIL] Report does not match the stored events:\n{report}")
+                return False
+
+            print(f"[OK] Summary: {summary[0]['count']} runs, mean {summary[0]['mean_s']:.1f}s, "
+                  f"hit rate {hit_rate * 100:.0f}%")
+            return True
+    except Exception as e:
+        print(f"[FAIL] Store query test failed: {e}")
+        return False
+
+def test_generations_recorded():
+    """Test generations and cache hits from the asset pipeline are recorded"""
+    try:
+        with tempfile.TemporaryDirectory() as work_dir:
+            generator = make_mock_generator(work_dir)
+            pipeline = CardArtPipeline(generator, os.path.join(work_dir, "cards"))
+            cards = CardArtPipeline.load_card_definitions()[:2]
+
+            pipeline.generate_all(cards)
+            pipeline.generate_all(cards)
+
+            rows = generator.metrics.query()
+            generated = [row for row in rows if not row['cache_hit']]
+            cached = [row for row in rows if row['cache_hit']]
+
+            if len(generated) != 2 or len(cached) != 2:
+                print(f"[FAIL] Expected 2 generations and 2 cache hits: {len(generated)}/{len(cached)}")
+                return False
+
+            if any(row['backend'] != 'mock' or row['wall_time_s'] is None for row in generated):
+                print(f"[FAIL] Generation rows incomplete: {generated}")
+                return False
+
+            print(f"[OK] Recorded {len(generated)} generations and {len(cached)} cache hits")
+            return True
+    except Exception as e:
+        print(f"[FAIL] Generation recording test failed: {e}")
+        return False
+
+def test_pipeline_steps_recorded():
+    """Test the real generation path records steps and batch sizes"""
+    try:
+        with tempfile.TemporaryDirectory() as work_dir:
+            generator = make_mock_generator(work_dir, MockSDXLPipeline())
+
+            prompt_configs = [
+                {'positive': f"Card art {i}", 'negative': "blurry", 'width': 64, 'height': 96,
+                 'seed': i, 'card': f"card_{i}"}
+                for i in range(2)
+            ]
+            generator._generate_and_record(prompt_configs[0], "single.png")
+            generator.generate_image_batch(prompt_configs)
+
+            single = generator.metrics.query(kind='generation')
+            batch = generator.metrics.query(kind='batch')
+
+            if len(single) != 1 or not single[0]['steps'] or single[0]['backend'] != 'MockSDXLPipeline':
+                print(f"[FAIL] Single generation row wrong: {single}")
+                return False
+
+            if len(batch) != 2 or any(row['batch_size'] != 2 for row in batch):
+                print(f"[FAIL] Batch rows wrong: {batch}")
+                return False
+
+            print(f"[OK] Single run recorded with {single[0]['steps']} steps, batch of {len(batch)} recorded")
+            return True
+    except Exception as e:
+        print(f"[FAIL] Pipeline steps test failed: {e}")
+        return False
+
+if __name__ == "__main__":
+    run_tests("GENERATION METRICS TEST", [
+        test_store_queries,
+        test_generations_recorded,
+        test_pipeline_steps_recorded
+    ], "GENERATION METRICS", "Generation metrics store operational!")
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Test script for per-step generation progress, throughput and ETA
+Runs the real generation path against the CPU stand-in pipeline
+"""
+
+import pygame
+import sys
+import os
+import tempfile
+import threading
+import time
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gen_assets.generate_backgrounds import AssetGenerator
+from gen_assets.mock_pipeline import MockSDXLPipeline
+from gen_assets.progress import GenerationProgress, ProgressHistory, ProgressPoller
+from gen_assets.generation_control import GenerationTimeout
+from tests.helpers import make_selection_screen
+
+def make_prompt_config():
+    """Small prompt configuration so the stand-in runs quickly"""
+    return {
+        'positive': "Arcane tower library, floating tomes",
+        'negative': "cartoon, anime, low quality",
+        'width': 64,
+        'height': 64,
+        'seed': 42,
+        'hero': 'mage'
+    }
+
+def test_progress_estimates():
+    """Test ETA comes from history before the first step and from measurement after"""
+    try:
+        progress = GenerationProgress("job", total_steps=20, expected_seconds_per_step=0.5)
+        progress.start()
+
+        if abs(progress.eta_seconds - 10.0) > 0.1:
+            print(f"[FAIL] History ETA wrong: {progress.eta_seconds}")
+            return False
+        print(f"[OK] ETA before first step from history: {progress.eta_seconds:.1f}s")
+
+        time.sleep(0.05)
+        progress.update(5)
+        snapshot = progress.snapshot()
+
+        if snapshot['fraction'] != 0.25 or snapshot['steps_per_second'] < 20:
+            print(f"[FAIL] Measured progress wrong: {snapshot}")
+            return False
+
+        if snapshot['eta_s'] > 5.0:
+            print(f"[FAIL] ETA not based on measured rate: {snapshot['eta_s']}")
+            return False
+
+        print(f"[OK] Measured {snapshot['steps_per_second']:.1f} it/s, ETA {snapshot['eta_s']:.2f}s")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Progress estimate test failed: {e}")
+        return False
+
+def test_history_persistence():
+    """Test step timings persist per resolution and step count"""
+    try:
+        with tempfile.TemporaryDirectory() as history_dir:
+            path = os.path.join(history_dir, "history.json")
+            history = ProgressHistory(path)
+            history.record(1024, 1024, 30, 0.4)
+            history.record(1024, 1024, 30, 0.6)
+
+            reloaded = ProgressHistory(path)
+            expected = reloaded.expected_seconds_per_step(1024, 1024, 30)
+
+            if not 0.4 < expected < 0.6 or reloaded.entries['1024x1024_30']['runs'] != 2:
+                print(f"[FAIL] History not persisted: {reloaded.entries}")
+                return False
+
+            if reloaded.expected_seconds_per_step(512, 512, 30) is not None:
+                print("[FAIL] Unmeasured shape has an estimate")
+                return False
+
+            print(f"[OK] History reloaded: {expected:.2f}s/step for 1024x1024 @ 30 steps")
+            return True
+    except Exception as e:
+        print(f"[FAIL] History persistence test failed: {e}")
+        return False
+
+def test_live_generation_progress():
+    """Test progress is observable while a generation runs and recorded afterwards"""
+    try:
+        with tempfile.TemporaryDirectory() as work_dir:
+            generator = AssetGenerator(use_mock=True)
+            generator.pipeline = MockSDXLPipeline(step_delay=0.01)
+            generator.checkpoint_every = 0
+            generator.progress_history = ProgressHistory(os.path.join(work_dir, "history.json"))
+
+            worker = threading.Thread(target=generator._generate_image, args=(make_prompt_config(),))
+            worker.start()
+
+            observed = []
+            while worker.is_alive():
+                snapshot = generator.get_generation_progress()
+                if snapshot and snapshot['step'] > 0:
+                    observed.append(snapshot)
+                time.sleep(0.02)
+            worker.join()
+
+            if not observed or observed[-1]['step'] <= observed[0]['step']:
+                print(f"[FAIL] No advancing progress observed: {len(observed)} snapshots")
+                return False
+            print(f"[OK] Observed {len(observed)} snapshots up to step "
+                  f"{observed[-1]['step']}/{observed[-1]['total_steps']}")
+
+            if generator.get_generation_progress() is not None:
+                print("[FAIL] Finished generation still reported as running")
+                return False
+
+            if len(generator.progress_history.entries) != 1:
+                print("[FAIL] Finished generation not recorded in history")
+                return False
+            print(f"[OK] History recorded: {generator.progress_history.entries}")
+
+            return True
+    except Exception as e:
+        print(f"[FAIL] Live progress test failed: {e}")
+        return False
+
+def test_interrupted_generation_progress():
+    """Test a generation that times out closes its progress and records the outcome"""
+    try:
+        with tempfile.TemporaryDirectory() as work_dir:
+            generator = AssetGenerator(use_mock=True)
+            generator.pipeline = MockSDXLPipeline(step_delay=0.02)
+            generator.checkpoint_every = 0
+            generator.checkpoint_dir = work_dir
+            generator.generation_timeout = 0.1
+            generator.progress_history = ProgressHistory(os.path.join(work_dir, "history.json"))
+
+            try:
+                generator._generate_image(make_prompt_config())
+                print("[FAIL] Generation finished despite timeout")
+                return False
+            except GenerationTimeout:
+                pass
+
+            if generator.get_generation_progress() is not None or generator.progress.outcome != "timeout":
+                print(f"[FAIL] Timed out generation left running: {generator.progress.snapshot()}")
+                return False
+
+            entry, = generator.progress_history.entries.values()
+            if entry.get('outcomes') != {'timeout': 1} or not entry['seconds_per_step']:
+                print(f"[FAIL] Timeout not recorded in history: {entry}")
+                return False
+
+            print(f"[OK] Timed out run finished with outcome recorded: {entry}")
+            return True
+    except Exception as e:
+        print(f"[FAIL] Interrupted progress test failed: {e}")
+        return False
+
+def test_selection_reads_polled_progress():
+    """Test the selection screen reads progress polled off the game loop"""
+    try:
+        screen, selection = make_selection_screen()
+        selection.asset_generator.scheduler.stop(timeout=30)
+
+        # A stalled daemon: every progress query takes longer than a frame
+        def slow_progress():
+            time.sleep(0.3)
+            return {'job_id': 'hero_knight_background', 'step': 3, 'total_steps': 30}
+
+        poller = selection.progress_poller
+        poller.stop(timeout=5)
+        poller.source = slow_progress
+        poller.start()
+
+        start = time.perf_counter()
+        for _ in range(10):
+            selection.update()
+        elapsed = time.perf_counter() - start
+        if elapsed > 0.25:
+            print(f"[FAIL] update() waited on the progress source: {elapsed:.2f}s for 10 frames")
+            return False
+
+        deadline = time.perf_counter() + 5
+        while selection.generation_progress is None and time.perf_counter() < deadline:
+            time.sleep(0.05)
+            selection.update()
+        if not selection.generation_progress or selection.generation_progress['step'] != 3:
+            print(f"[FAIL] Polled snapshot not shown: {selection.generation_progress}")
+            return False
+
+        selection.unload()
+        if poller.snapshot is not None:
+            print("[FAIL] Snapshot kept after the poller stopped")
+            return False
+
+        print(f"[OK] 10 frames in {elapsed * 1000:.1f}ms with a 300ms progress source")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Polled progress test failed: {e}")
+        return False
+    finally:
+        pygame.quit()
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("MEDIEVAL DECK - GENERATION PROGRESS TEST")
+    print("=" * 60)
+
+    tests = [
+        test_progress_estimates,
+        test_history_persistence,
+        test_live_generation_progress,
+        test_interrupted_generation_progress,
+        test_selection_reads_polled_progress
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+            print()
+        except Exception as e:
+            print(f"[ERROR] Test {test.__name__} crashed: {e}")
+            print()
+
+    print("=" * 60)
+    print(f"GENERATION PROGRESS RESULTS: {passed}/{total} tests passed")
+
+    if passed == total:
+        print("[SUCCESS] Generation progress telemetry operational!")
+    else:
+        print(f"[WARNING] {total - passed} tests failed - Review implementation")
+    print("=" * 60)
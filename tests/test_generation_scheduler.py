@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Test script for priority scheduling of generation jobs
+"""
+
+import pygame
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gen_assets.scheduler import GenerationScheduler, JobPriority
+from screens.selection import SelectionScreen
+
+def test_priority_order():
+    """Test visible jobs run before next and speculative ones"""
+    try:
+        scheduler = GenerationScheduler()
+        order = []
+
+        scheduler.submit('shop_background', lambda: order.append('shop_background'), JobPriority.SPECULATIVE)
+        scheduler.submit('hero_mage_background', lambda: order.append('hero_mage_background'), JobPriority.NEXT)
+        scheduler.submit('hero_knight_background', lambda: order.append('hero_knight_background'), JobPriority.VISIBLE)
+        scheduler.submit('arrow_left', lambda: order.append('arrow_left'), JobPriority.VISIBLE)
+
+        scheduler.run_pending()
+
+        expected = ['hero_knight_background', 'arrow_left', 'hero_mage_background', 'shop_background']
+        if order != expected:
+            print(f"[FAIL] Wrong execution order: {order}")
+            return False
+
+        print(f"[OK] Priority order respected: {order}")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Priority order test failed: {e}")
+        return False
+
+def test_bump_priority():
+    """Test bumping a pending job moves it ahead of the queue"""
+    try:
+        scheduler = GenerationScheduler()
+        order = []
+
+        for asset in ['hero_knight_background', 'hero_mage_background', 'hero_assassin_background']:
+            scheduler.submit(asset, lambda asset=asset: order.append(asset), JobPriority.SPECULATIVE)
+
+        if not scheduler.bump('hero_assassin_background', JobPriority.VISIBLE):
+            print("[FAIL] Pending job could not be bumped")
+            return False
+
+        scheduler.run_pending(max_priority=JobPriority.VISIBLE)
+        if order != ['hero_assassin_background'] or scheduler.pending_count() != 2:
+            print(f"[FAIL] Bumped job not run first: {order}")
+            return False
+
+        if scheduler.bump('hero_assassin_background', JobPriority.NEXT):
+            print("[FAIL] Finished job reported as bumped")
+            return False
+
+        print("[OK] Bumped job runs ahead of speculative work")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Bump priority test failed: {e}")
+        return False
+
+def test_wait_time_report():
+    """Test queue wait time is reported per priority class"""
+    try:
+        scheduler = GenerationScheduler()
+        scheduler.submit('a', lambda: 'a', JobPriority.VISIBLE)
+        scheduler.submit('b', lambda: 'b', JobPriority.SPECULATIVE)
+        scheduler.submit('c', lambda: 'c', JobPriority.SPECULATIVE)
+        scheduler.run_pending()
+
+        stats = scheduler.get_wait_stats()
+        if set(stats) != {'visible', 'next', 'speculative'}:
+            print(f"[FAIL] Unexpected priority classes: {sorted(stats)}")
+            return False
+
+        if stats['visible']['count'] != 1 or stats['speculative']['count'] != 2 or stats['next']['count'] != 0:
+            print(f"[FAIL] Wrong job counts: {stats}")
+            return False
+
+        scheduler.print_wait_report()
+        print("[OK] Wait time reported per priority class")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Wait time report test failed: {e}")
+        return False
+
+def test_background_worker():
+    """Test the worker thread drains the queue and completes callbacks"""
+    try:
+        scheduler = GenerationScheduler()
+        results = {}
+
+        scheduler.submit('x', lambda: 'path_x', JobPriority.NEXT,
+                         on_complete=lambda path: results.update(x=path))
+        scheduler.start()
+
+        if scheduler.wait('x', timeout=5) != 'path_x' or results.get('x') != 'path_x':
+            print("[FAIL] Worker did not complete the job")
+            return False
+
+        scheduler.stop(timeout=5)
+        print("[OK] Background worker completed job")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Background worker test failed: {e}")
+        return False
+
+def test_failing_callback_keeps_worker():
+    """Test a completion callback that raises does not stop the worker or block waiters"""
+    try:
+        scheduler = GenerationScheduler()
+        results = {}
+
+        def broken_callback(path):
+            raise pygame.error("cannot load image")
+
+        scheduler.submit('x', lambda: 'path_x', JobPriority.VISIBLE, on_complete=broken_callback)
+        scheduler.submit('y', lambda: 'path_y', JobPriority.NEXT,
+                         on_complete=lambda path: results.update(y=path))
+        scheduler.start()
+
+        if scheduler.wait('x', timeout=5) != 'path_x' or not scheduler.jobs['x'].done.is_set():
+            print("[FAIL] Job with a failing callback never finished")
+            return False
+        if scheduler.wait('y', timeout=5) != 'path_y' or results.get('y') != 'path_y':
+            print("[FAIL] Worker stopped after a failing callback")
+            return False
+
+        scheduler.stop(timeout=5)
+        print("[OK] Failing callback logged, later jobs still completed")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Failing callback test failed: {e}")
+        return False
+
+def test_selection_navigation_priorities():
+    """Test selection screen promotes the newly shown hero's assets"""
+    try:
+        pygame.init()
+        pygame.display.set_mode((100, 100))
+
+        class MockGame:
+            def __init__(self):
+                self.running = True
+                self.selected_hero = None
+
+        selection = SelectionScreen(MockGame())
+
+        if 'knight' not in selection.hero_backgrounds:
+            print("[FAIL] Visible hero background not generated before first frame")
+            return False
+
+        selection._navigate_hero(1)
+        priorities = selection._get_asset_priorities()
+
+        if priorities['hero_mage_background'] != JobPriority.VISIBLE:
+            print("[FAIL] Navigated hero not promoted to visible")
+            return False
+
+        if priorities['hero_knight_background'] != JobPriority.NEXT:
+            print("[FAIL] Previous hero not kept as next")
+            return False
+
+        selection.asset_generator.scheduler.stop(timeout=30)
+        print("[OK] Navigation bumps hero asset priorities")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Selection priority test failed: {e}")
+        return False
+    finally:
+        pygame.quit()
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("MEDIEVAL DECK - GENERATION SCHEDULER TEST")
+    print("=" * 60)
+
+    tests = [
+        test_priority_order,
+        test_bump_priority,
+        test_wait_time_report,
+        test_background_worker,
+        test_failing_callback_keeps_worker,
+        test_selection_navigation_priorities
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+            print()
+        except Exception as e:
+            print(f"[ERROR] Test {test.__name__} crashed: {e}")
+            print()
+
+    print("=" * 60)
+    print(f"GENERATION SCHEDULER RESULTS: {passed}/{total} tests passed")
+
+    if passed == total:
+        print("[SUCCESS] Generation scheduler operational!")
+    else:
+        print(f"[WARNING] {total - passed} tests failed - Review implementation")
+    print("=" * 60)
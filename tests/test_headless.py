@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Test script for the headless run mode
+"""
+
+import pygame
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.headless import HeadlessRunner, key_press
+
+def test_default_script_report():
+    """Test the default timeline reaches selection and reports both screens"""
+    runner = None
+    try:
+        runner = HeadlessRunner(frames=60)
+        report = runner.run()
+
+        if set(report) != {"menu", "selection"}:
+            print(f"[FAIL] Unexpected screens in report: {sorted(report)}")
+            return False
+
+        if sum(stats['frames'] for stats in report.values()) != 60:
+            print("[FAIL] Not every frame was reported")
+            return False
+
+        selection = runner.game.selection_screen
+        if selection.selected_hero != selection.heroes_list[0] or runner.game.selected_hero is None:
+            print(f"[FAIL] Script did not navigate and confirm: {selection.selected_hero}")
+            return False
+
+        for state, stats in report.items():
+            if not stats['p50_ms'] <= stats['p95_ms'] <= stats['p99_ms'] <= stats['max_ms']:
+                print(f"[FAIL] Percentiles out of order for {state}: {stats}")
+                return False
+
+        runner.print_report()
+        print("[OK] Scripted run covered menu and selection")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Default script test failed: {e}")
+        return False
+    finally:
+        if runner:
+            runner.close()
+
+def test_quit_returns_without_exit():
+    """Test quitting from the script ends the run instead of exiting the process"""
+    runner = None
+    try:
+        runner = HeadlessRunner(frames=100, script={5: key_press(pygame.K_ESCAPE)})
+        report = runner.run()
+
+        if runner.game.running or report["menu"]['frames'] != 6:
+            print(f"[FAIL] Run did not stop after ESC: {report}")
+            return False
+
+        print("[OK] ESC ended the headless run after 6 frames")
+        return True
+    except SystemExit:
+        print("[FAIL] Headless run called sys.exit")
+        return False
+    except Exception as e:
+        print(f"[FAIL] Quit test failed: {e}")
+        return False
+    finally:
+        if runner:
+            runner.close()
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("MEDIEVAL DECK - HEADLESS MODE TEST")
+    print("=" * 60)
+
+    tests = [
+        test_default_script_report,
+        test_quit_returns_without_exit
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+            print()
+        except Exception as e:
+            print(f"[ERROR] Test {test.__name__} crashed: {e}")
+            print()
+
+    print("=" * 60)
+    print(f"HEADLESS MODE RESULTS: {passed}/{total} tests passed")
+
+    if passed == total:
+        print("[SUCCESS] Headless run mode operational!")
+    else:
+        print(f"[WARNING] {total - passed} tests failed - Review implementation")
+    print("=" * 60)
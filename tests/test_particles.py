@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Test script for the NumPy particle system
+"""
+
+import pygame
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import PARTICLE_BUDGET_MS
+from utils.particles import ParticleSystem, PARTICLE_PRESETS, benchmark, print_benchmark
+from main import MedievalDeck
+from tests.helpers import run_tests
+
+def test_emit_update_compact():
+    """Test particles move, expire and are compacted; capacity overflow is dropped"""
+    try:
+        pygame.init()
+        system = ParticleSystem(capacity=100)
+        system.emit((100, 100), 30, speed=(100, 100), angle=0, spread=0, life=(0.1, 0.1))
+        system.emit((100, 100), 90, speed=(100, 100), angle=90, spread=0, life=(1.0, 1.0))
+
+        if system.count != 100 or system.dropped != 20:
+            print(f"[FAIL] Capacity not enforced: {system.get_stats()}")
+            return False
+
+        system.update(0.05)
+        moved = system.particles[:system.count]['pos']
+        if not (moved[:30, 0] > 100).all() or not (moved[30:, 1] > 100).all():
+            print("[FAIL] Particles did not move along their velocity")
+            return False
+
+        system.update(0.1)
+        if system.count != 70 or (system.particles[:system.count]['life'] <= 0).any():
+            print(f"[FAIL] Expired particles not compacted: {system.count} live")
+            return False
+
+        # The survivors are exactly the long-lived 90 degree batch, packed at the front
+        survivors = system.particles[:system.count]
+        if (abs(survivors['vel'][:, 0]) > 1e-3).any() or (abs(survivors['life'] - 0.85) > 1e-4).any():
+            print("[FAIL] Compaction kept the wrong particles")
+            return False
+        if system.get_stats() != {'live': 70, 'peak': 100, 'capacity': 100, 'dropped': 20, 'emitters': 0}:
+            print(f"[FAIL] Unexpected stats after compaction: {system.get_stats()}")
+            return False
+
+        print(f"[OK] {system.count} live after expiry, {system.dropped} dropped at capacity")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Emit/update test failed: {e}")
+        return False
+    finally:
+        pygame.quit()
+
+def test_presets_emitters_and_draw():
+    """Test presets and emitters feed particles that are drawn onto the target"""
+    try:
+        pygame.init()
+        target = pygame.Surface((400, 300))
+        system = ParticleSystem()
+        for preset in PARTICLE_PRESETS:
+            system.burst(preset, (200, 150))
+        emitter = system.add_emitter((50, 50), rate=120, duration=0.5, color=(0, 255, 0), spread=0)
+
+        before = system.count
+        system.update(0.25)
+        if system.count <= before - PARTICLE_PRESETS['attack']['count'] or not emitter.active:
+            print("[FAIL] Emitter did not add particles")
+            return False
+
+        target.fill((0, 0, 0))
+        system.draw(target)
+        lit = sum(1 for x in range(0, 400, 4) for y in range(0, 300, 4) if target.get_at((x, y))[:3] != (0, 0, 0))
+        if not lit:
+            print("[FAIL] Nothing drawn")
+            return False
+
+        for _ in range(120):
+            system.update(1 / 60)
+        if system.count or system.emitters:
+            print(f"[FAIL] Particles or emitters left after their lifetime: {system.get_stats()}")
+            return False
+
+        print(f"[OK] {len(PARTICLE_PRESETS)} presets and an emitter drawn, all expired; peak {system.peak}")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Presets test failed: {e}")
+        return False
+    finally:
+        pygame.quit()
+
+def test_game_integration_and_benchmark():
+    """Test the game updates and draws particles, and report the benchmark"""
+    try:
+        pygame.init()
+        game = MedievalDeck(use_mock=True)
+        game.render()
+        without_particles = pygame.image.tobytes(game.screen, "RGB")
+        game.particles.burst('card_play', (1720, 720))
+        game.update()
+        game.render()
+        if not game.particles.count:
+            print("[FAIL] Game particles expired immediately")
+            return False
+        if pygame.image.tobytes(game.screen, "RGB") == without_particles:
+            print("[FAIL] Game frame unchanged by particles")
+            return False
+
+        counts = (250, 1000, 4000)
+        report = benchmark(frames=5, counts=counts)
+        print_benchmark(report)
+        within = [count for count, ms in report['results'].items() if ms <= PARTICLE_BUDGET_MS]
+        if tuple(report['results']) != counts or report['max_within_budget'] != max(within, default=0):
+            print(f"[FAIL] Benchmark report inconsistent: {report}")
+            return False
+        if report['max_within_budget'] < 250:
+            print("[FAIL] Fewer than 250 particles fit in the budget")
+            return False
+
+        print("[OK] Game particles rendered, benchmark completed")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Game particles test failed: {e}")
+        return False
+    finally:
+        pygame.quit()
+
+if __name__ == "__main__":
+    run_tests("PARTICLES TEST", [
+        test_emit_update_compact,
+        test_presets_emitters_and_draw,
+        test_game_integration_and_benchmark
+    ], "PARTICLES", "Particle system operational!")
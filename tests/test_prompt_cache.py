@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Test script for the SDXL prompt embedding cache
+"""
+
+import sys
+import os
+import tempfile
+import torch
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gen_assets.prompt_cache import PromptEmbeddingCache
+from gen_assets.generate_backgrounds import AssetGenerator
+from gen_assets.art_direction import ArtDirection
+
+class StandInEncoder:
+    """Counts encoder runs and returns deterministic SDXL-shaped embeddings"""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, prompt):
+        self.calls.append(prompt)
+        seed = sum(ord(c) for c in prompt)
+        prompt_embeds = torch.full((1, 77, 2048), float(seed % 97))
+        pooled_prompt_embeds = torch.full((1, 1280), float(seed % 89))
+        return prompt_embeds, pooled_prompt_embeds
+
+def test_memory_cache_hit():
+    """Test repeated prompts are served from memory"""
+    try:
+        with tempfile.TemporaryDirectory() as cache_dir:
+            encoder = StandInEncoder()
+            cache = PromptEmbeddingCache("stand-in", encoder, cache_dir)
+
+            first = cache.get("gothic castle")
+            second = cache.get("gothic castle")
+
+            if len(encoder.calls) != 1:
+                print(f"[FAIL] Encoder ran {len(encoder.calls)} times for one prompt")
+                return False
+
+            if not torch.equal(first[0], second[0]) or not torch.equal(first[1], second[1]):
+                print("[FAIL] Cached embeddings differ from encoded ones")
+                return False
+
+            print(f"[OK] Memory cache hit - stats: {cache.stats}")
+            return True
+    except Exception as e:
+        print(f"[FAIL] Memory cache test failed: {e}")
+        return False
+
+def test_disk_cache_survives_restart():
+    """Test embeddings persisted by one cache are loaded by the next"""
+    try:
+        with tempfile.TemporaryDirectory() as cache_dir:
+            encoder = StandInEncoder()
+            PromptEmbeddingCache("stand-in", encoder, cache_dir).get(ArtDirection.NEGATIVE_PROMPT)
+
+            restarted = PromptEmbeddingCache("stand-in", encoder, cache_dir)
+            prompt_embeds, pooled_prompt_embeds = restarted.get(ArtDirection.NEGATIVE_PROMPT)
+
+            if len(encoder.calls) != 1 or restarted.stats['disk_hits'] != 1:
+                print(f"[FAIL] Disk cache not used - encoder calls: {len(encoder.calls)}")
+                return False
+
+            if tuple(prompt_embeds.shape) != (1, 77, 2048) or tuple(pooled_prompt_embeds.shape) != (1, 1280):
+                print("[FAIL] Persisted embeddings have wrong shape")
+                return False
+
+            print("[OK] Disk cache reused after restart")
+            return True
+    except Exception as e:
+        print(f"[FAIL] Disk cache test failed: {e}")
+        return False
+
+def test_encoder_id_isolation():
+    """Test a different encoder never reuses another encoder's embeddings"""
+    try:
+        with tempfile.TemporaryDirectory() as cache_dir:
+            encoder = StandInEncoder()
+            PromptEmbeddingCache("sdxl:fp16", encoder, cache_dir).get("moonlit alley")
+            PromptEmbeddingCache("sdxl:fp32", encoder, cache_dir).get("moonlit alley")
+
+            if len(encoder.calls) != 2:
+                print("[FAIL] Embeddings shared across encoder ids")
+                return False
+
+            print("[OK] Cache keyed by encoder id")
+            return True
+    except Exception as e:
+        print(f"[FAIL] Encoder isolation test failed: {e}")
+        return False
+
+def test_generator_uses_cached_embeddings():
+    """Test AssetGenerator passes embeddings to the pipeline instead of prompt text"""
+    try:
+        with tempfile.TemporaryDirectory() as cache_dir:
+            generator = AssetGenerator(use_mock=True)
+            encoder = StandInEncoder()
+            generator.prompt_cache = PromptEmbeddingCache("stand-in", encoder, cache_dir)
+
+            # Knight and mage share the negative prompt, so it is only encoded once
+            generator._get_prompt_kwargs(ArtDirection.get_hero_background_prompt('knight'))
+            kwargs = generator._get_prompt_kwargs(ArtDirection.get_hero_background_prompt('mage'))
+
+            expected = {'prompt_embeds', 'pooled_prompt_embeds',
+                        'negative_prompt_embeds', 'negative_pooled_prompt_embeds'}
+            if set(kwargs) != expected:
+                print(f"[FAIL] Unexpected pipeline kwargs: {sorted(kwargs)}")
+                return False
+
+            if len(encoder.calls) != 3:
+                print(f"[FAIL] Expected 3 encoder runs, got {len(encoder.calls)}")
+                return False
+
+            print("[OK] Pipeline receives cached embeddings, shared negative encoded once")
+            return True
+    except Exception as e:
+        print(f"[FAIL] Generator embedding test failed: {e}")
+        return False
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("MEDIEVAL DECK - PROMPT EMBEDDING CACHE TEST")
+    print("=" * 60)
+
+    tests = [
+        test_memory_cache_hit,
+        test_disk_cache_survives_restart,
+        test_encoder_id_isolation,
+        test_generator_uses_cached_embeddings
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+            print()
+        except Exception as e:
+            print(f"[ERROR] Test {test.__name__} crashed: {e}")
+            print()
+
+    print("=" * 60)
+    print(f"PROMPT CACHE RESULTS: {passed}/{total} tests passed")
+
+    if passed == total:
+        print("[SUCCESS] Prompt embedding cache operational!")
+    else:
+        print(f"[WARNING] {total - passed} tests failed - Review implementation")
+    print("=" * 60)
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Test script for dynamic internal render resolution
+"""
+
+import pygame
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import SCREEN_WIDTH, SCREEN_HEIGHT, GOLD
+from utils.canvas import ScaledCanvas
+from utils.render_scale import RenderScaler
+from main import MedievalDeck
+
+def test_scaled_canvas_mapping():
+    """Test logical coordinates land on the right internal pixels"""
+    try:
+        pygame.init()
+        offscreen = pygame.Surface((SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
+        canvas = ScaledCanvas(offscreen, 0.5, (SCREEN_WIDTH, SCREEN_HEIGHT))
+
+        canvas.rect(GOLD, (200, 100, 400, 200))
+        if offscreen.get_at((150, 75))[:3] != GOLD or offscreen.get_at((350, 75))[:3] == GOLD:
+            print("[FAIL] Rect not scaled into the internal frame")
+            return False
+
+        sprite = pygame.Surface((100, 100))
+        sprite.fill(GOLD)
+        canvas.blit(sprite, (1000, 1000))
+        cached = canvas._scaled_cache[sprite]
+        canvas.blit(sprite, (1000, 1000))
+        if canvas._scaled_cache[sprite] is not cached or cached.get_size() != (50, 50):
+            print("[FAIL] Scaled sprite not cached")
+            return False
+
+        if canvas.get_size() != (SCREEN_WIDTH, SCREEN_HEIGHT):
+            print("[FAIL] Canvas does not report the logical size")
+            return False
+
+        print("[OK] Logical drawing maps onto the half resolution frame")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Canvas mapping test failed: {e}")
+        return False
+    finally:
+        pygame.quit()
+
+def test_auto_scale_follows_budget():
+    """Test the scale steps down over budget and back up with headroom"""
+    try:
+        pygame.init()
+        display = pygame.display.set_mode((344, 144))
+        scaler = RenderScaler(display, logical_size=(344, 144), scale=1.0, auto=True,
+                              levels=(1.0, 0.75, 0.5), budget_ms=16.0, window=10)
+
+        for _ in range(10):
+            scaler.record_frame(25.0)
+        if scaler.scale != 0.75:
+            print(f"[FAIL] Scale did not drop over budget: {scaler.scale}")
+            return False
+
+        for _ in range(10):
+            scaler.record_frame(25.0)
+        if scaler.scale != 0.5:
+            print(f"[FAIL] Scale did not reach the lowest level: {scaler.scale}")
+            return False
+
+        scaler.canvas.fill(GOLD)
+        scaler.present()
+        if display.get_at((340, 140))[:3] != GOLD:
+            print("[FAIL] Internal frame not presented across the display")
+            return False
+
+        for _ in range(10):
+            scaler.record_frame(5.0)
+        if scaler.scale != 0.75:
+            print(f"[FAIL] Scale did not recover with headroom: {scaler.scale}")
+            return False
+
+        print("[OK] Scale 1.0 -> 0.5 over budget, back to 0.75 with headroom")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Auto scale test failed: {e}")
+        return False
+    finally:
+        pygame.quit()
+
+def test_hit_testing_at_reduced_scale():
+    """Test buttons still respond at their native positions while rendering scaled"""
+    try:
+        pygame.init()
+        game = MedievalDeck()
+        game.render_scaler.auto = False
+        game.render_scaler.set_scale(0.5)
+        game.render()
+
+        if game.screen.get_size() != (SCREEN_WIDTH, SCREEN_HEIGHT):
+            print("[FAIL] Display size changed")
+            return False
+
+        start_button = game.menu_screen.button_set.get_button_by_text("JOGAR")
+        pos = start_button.rect.center
+        pygame.event.post(pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=(0, 0), buttons=(0, 0, 0)))
+        pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=1))
+        game.handle_events()
+
+        if game.current_state != "selection":
+            print(f"[FAIL] Click at {pos} missed the Start button: {game.current_state}")
+            return False
+
+        half_display = pygame.Surface((SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
+        scaler = RenderScaler(half_display, auto=False)
+        if scaler.to_logical((100, 50)) != (200, 100):
+            print("[FAIL] Window positions not mapped to logical coordinates")
+            return False
+
+        print(f"[OK] Start button hit at {pos} with render scale 0.5")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Hit testing test failed: {e}")
+        return False
+    finally:
+        pygame.quit()
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("MEDIEVAL DECK - RENDER SCALE TEST")
+    print("=" * 60)
+
+    tests = [
+        test_scaled_canvas_mapping,
+        test_auto_scale_follows_budget,
+        test_hit_testing_at_reduced_scale
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+            print()
+        except Exception as e:
+            print(f"[ERROR] Test {test.__name__} crashed: {e}")
+            print()
+
+    print("=" * 60)
+    print(f"RENDER SCALE RESULTS: {passed}/{total} tests passed")
+
+    if passed == total:
+        print("[SUCCESS] Dynamic render resolution operational!")
+    else:
+        print(f"[WARNING] {total - passed} tests failed - Review implementation")
+    print("=" * 60)
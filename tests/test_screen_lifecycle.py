@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Test script for the screen lifecycle: lazy construction, hooks and resource release
+"""
+
+import pygame
+import sys
+import os
+import tracemalloc
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from screens.base import BaseScreen
+from main import MedievalDeck, GameState
+
+class RecordingScreen(BaseScreen):
+    """Screen holding a large buffer and logging its lifecycle"""
+
+    def __init__(self, name, log, size=4 * 1024 * 1024):
+        self.name = name
+        self.log = log
+        self.buffer = bytearray(size)
+        log.append(f"{name}:init")
+
+    def on_enter(self, previous_state):
+        self.log.append(f"{self.name}:enter:{previous_state}")
+
+    def on_exit(self, next_state):
+        self.log.append(f"{self.name}:exit:{next_state}")
+
+    def suspend(self):
+        self.log.append(f"{self.name}:suspend")
+
+    def unload(self):
+        self.log.append(f"{self.name}:unload")
+        self.buffer = None
+
+    def handle_events(self, events):
+        return None
+
+    def update(self):
+        pass
+
+    def render(self, screen):
+        pass
+
+def test_lazy_construction_and_hooks():
+    """Test screens are built on first entry and hooks run in order"""
+    try:
+        pygame.init()
+        game = MedievalDeck()
+        log = []
+        game.screens.register(GameState.EVENTS, lambda: RecordingScreen("events", log))
+
+        if list(game.screens.loaded) != [GameState.MENU] or GameState.EVENTS not in game.screens:
+            print(f"[FAIL] Unexpected screens at startup: {list(game.screens.loaded)}")
+            return False
+
+        game.change_state(GameState.EVENTS)
+        game.change_state(GameState.MENU)
+        expected = ["events:init", "events:enter:menu", "events:exit:menu", "events:suspend"]
+        if log != expected:
+            print(f"[FAIL] Hook order wrong: {log}")
+            return False
+
+        print(f"[OK] Lazy construction with hooks: {log}")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Lazy construction test failed: {e}")
+        return False
+    finally:
+        pygame.quit()
+
+def test_selection_releases_background():
+    """Test the selection background is dropped while inactive and restored on enter"""
+    try:
+        pygame.init()
+        game = MedievalDeck()
+        game.change_state(GameState.SELECTION)
+        selection = game.selection_screen
+
+        if selection.current_background is None:
+            print("[FAIL] No background loaded on enter")
+            return False
+
+        game.change_state(GameState.MENU)
+        if selection.current_background is not None:
+            print("[FAIL] Background kept while inactive")
+            return False
+
+        game.change_state(GameState.SELECTION)
+        if selection.current_background is None:
+            print("[FAIL] Background not restored on enter")
+            return False
+
+        print("[OK] Background released on exit and restored on enter")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Resource release test failed: {e}")
+        return False
+    finally:
+        pygame.quit()
+
+def test_memory_flat_as_screens_are_added():
+    """Test resident screen memory stays bounded while visiting more screens"""
+    try:
+        pygame.init()
+        game = MedievalDeck()
+        log = []
+        states = [f"screen_{i}" for i in range(8)]
+        for state in states:
+            game.screens.register(state, lambda state=state: RecordingScreen(state, log))
+
+        tracemalloc.start()
+        for state in states[:2]:
+            game.change_state(state)
+        after_two = tracemalloc.get_traced_memory()[0]
+
+        for state in states[2:]:
+            game.change_state(state)
+        after_all = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        if len(game.screens.loaded) > game.screens.max_loaded:
+            print(f"[FAIL] {len(game.screens.loaded)} screens still loaded")
+            return False
+
+        growth_mb = (after_all - after_two) / (1024 * 1024)
+        if growth_mb > 2:
+            print(f"[FAIL] Memory grew {growth_mb:.1f} MB visiting {len(states) - 2} more screens")
+            return False
+
+        unloaded = [entry for entry in log if entry.endswith(":unload")]
+        print(f"[OK] {len(unloaded)} screens unloaded, growth {growth_mb:.2f} MB")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Memory test failed: {e}")
+        return False
+    finally:
+        pygame.quit()
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("MEDIEVAL DECK - SCREEN LIFECYCLE TEST")
+    print("=" * 60)
+
+    tests = [
+        test_lazy_construction_and_hooks,
+        test_selection_releases_background,
+        test_memory_flat_as_screens_are_added
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+            print()
+        except Exception as e:
+            print(f"[ERROR] Test {test.__name__} crashed: {e}")
+            print()
+
+    print("=" * 60)
+    print(f"SCREEN LIFECYCLE RESULTS: {passed}/{total} tests passed")
+
+    if passed == total:
+        print("[SUCCESS] Screen lifecycle operational!")
+    else:
+        print(f"[WARNING] {total - passed} tests failed - Review implementation")
+    print("=" * 60)
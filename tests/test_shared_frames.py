@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Test script for shared-memory frame handoff
+Pixels cross the process boundary without a PNG encode/decode
+"""
+
+import sys
+import os
+import tempfile
+import threading
+import time
+import multiprocessing
+from multiprocessing import shared_memory
+import pygame
+from PIL import Image
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gen_assets.shared_frames import SharedImageWriter, SharedImageReceiver, wait_until_saved
+from gen_assets.generate_backgrounds import AssetGenerator
+from gen_assets.daemon import GenerationDaemon, DaemonClient
+from gen_assets.art_direction import ArtDirection
+from tests.helpers import make_selection_screen
+
+def _publish_in_worker(frames):
+    """Worker process: publish a two-colour image and exit"""
+    image = Image.new('RGB', (64, 32), (200, 40, 40))
+    image.paste((40, 40, 200), (32, 0, 64, 32))
+    frames.put(SharedImageWriter().publish(image))
+
+def test_cross_process_handoff():
+    """Test a frame published by another process is displayed without copying"""
+    try:
+        frames = multiprocessing.Queue()
+        worker = multiprocessing.Process(target=_publish_in_worker, args=(frames,))
+        worker.start()
+        frame = frames.get(timeout=30)
+        worker.join()
+
+        # The segment must outlive the worker that created it
+        receiver = SharedImageReceiver()
+        surface = receiver.receive(frame)
+
+        if surface.get_size() != (64, 32):
+            print(f"[FAIL] Wrong surface size: {surface.get_size()}")
+            return False
+
+        if surface.get_at((0, 0))[:3] != (200, 40, 40) or surface.get_at((63, 0))[:3] != (40, 40, 200):
+            print("[FAIL] Surface pixels do not match the published image")
+            return False
+        print(f"[OK] Worker frame displayed from shared memory ({frame['name']})")
+
+        del surface
+        receiver.release(frame['name'])
+        try:
+            shared_memory.SharedMemory(name=frame['name'])
+            print("[FAIL] Segment still exists after release")
+            return False
+        except FileNotFoundError:
+            print("[OK] Segment unlinked on release")
+
+        return True
+    except Exception as e:
+        print(f"[FAIL] Cross-process handoff test failed: {e}")
+        return False
+
+def test_unreceived_frames_expire():
+    """Test the writer unlinks frames after their TTL without breaking received ones"""
+    try:
+        writer = SharedImageWriter(ttl=30)
+        received = writer.publish(Image.new('RGB', (16, 16), (10, 200, 10)))
+        abandoned = writer.publish(Image.new('RGB', (16, 16), (200, 10, 10)))
+        receiver = SharedImageReceiver()
+        surface = receiver.receive(received)
+
+        if writer.expire() != 0 or writer.outstanding != 2:
+            print("[FAIL] Frames expired before their TTL")
+            return False
+        if writer.expire(now=time.monotonic() + 31) != 2 or writer.outstanding:
+            print("[FAIL] Frames not expired after their TTL")
+            return False
+
+        for name in (received['name'], abandoned['name']):
+            try:
+                shared_memory.SharedMemory(name=name).close()
+                print(f"[FAIL] Expired segment {name} still in shared memory")
+                return False
+            except FileNotFoundError:
+                pass
+        if surface.get_at((0, 0))[:3] != (10, 200, 10):
+            print("[FAIL] Received frame broken by expiry")
+            return False
+
+        del surface
+        receiver.release(received['name'])
+        try:
+            receiver.receive(abandoned)
+            print("[FAIL] Expired frame still receivable")
+            return False
+        except FileNotFoundError:
+            pass
+
+        writer.publish(Image.new('RGB', (16, 16)))
+        writer.close()
+        if writer.outstanding:
+            print("[FAIL] Frames left after close")
+            return False
+
+        print("[OK] Unreceived frames unlinked after TTL and on close, received frame kept its pixels")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Frame expiry test failed: {e}")
+        return False
+
+def test_daemon_shared_transfer():
+    """Test the daemon hands frames over shared memory and persists the PNG asynchronously"""
+    output_dir = tempfile.TemporaryDirectory()
+    daemon = GenerationDaemon(AssetGenerator(use_mock=True, use_daemon=False), port=0,
+                              asset_dirs=[output_dir.name])
+    daemon.warm_up()
+    daemon.start()
+    try:
+        with output_dir as output_dir:
+            save_path = os.path.join(output_dir, "arrow.png")
+            prompt_config = ArtDirection.get_ui_element_prompt('arrow_left')
+
+            frame = DaemonClient(port=daemon.port).generate_shared(prompt_config, save_path=save_path)
+            receiver = SharedImageReceiver()
+            surface = receiver.receive(frame)
+
+            if surface.get_size() != (prompt_config['width'], prompt_config['height']):
+                print(f"[FAIL] Wrong frame size: {surface.get_size()}")
+                return False
+            print(f"[OK] Daemon frame received: {frame['width']}x{frame['height']}")
+
+            daemon.png_writer.flush()
+            if not os.path.exists(save_path) or Image.open(save_path).size != surface.get_size():
+                print("[FAIL] PNG not persisted by the daemon")
+                return False
+            print("[OK] PNG persisted in the background")
+
+            del surface
+            receiver.release_all()
+            return True
+    except Exception as e:
+        print(f"[FAIL] Daemon shared transfer test failed: {e}")
+        return False
+    finally:
+        daemon.stop()
+
+def test_frame_before_png_write():
+    """Test the frame is handed out while the daemon is still writing the PNG"""
+    with tempfile.TemporaryDirectory() as backgrounds_dir:
+        daemon = GenerationDaemon(AssetGenerator(use_mock=True, use_daemon=False), port=0,
+                                  asset_dirs=[backgrounds_dir])
+        daemon.warm_up()
+        daemon.start()
+
+        # Hold the daemon's PNG write until the frame has been received
+        write_allowed = threading.Event()
+        save = daemon.png_writer.save
+        daemon.png_writer.save = lambda image, path: threading.Thread(
+            target=lambda: (write_allowed.wait(30), save(image, path))).start()
+        try:
+            generator = AssetGenerator(backgrounds_dir=backgrounds_dir)
+            generator.daemon_client = DaemonClient(port=daemon.port)
+            path, frame = generator.generate_hero_background_frame('knight')
+
+            if not frame or not path:
+                print(f"[FAIL] No shared frame: {path}, {frame}")
+                return False
+            if os.path.exists(path):
+                print("[FAIL] PNG written before the frame was handed out")
+                return False
+
+            receiver = SharedImageReceiver()
+            surface = receiver.receive(frame)
+            size = surface.get_size()
+            del surface
+            receiver.release_all()
+            print(f"[OK] {size[0]}x{size[1]} frame received before its PNG was written")
+
+            write_allowed.set()
+            if not wait_until_saved(path, timeout=30) or Image.open(path).size != size:
+                print("[FAIL] PNG not persisted after the frame")
+                return False
+
+            print(f"[OK] {os.path.basename(path)} persisted afterwards")
+            return True
+        except Exception as e:
+            print(f"[FAIL] Frame handoff order test failed: {e}")
+            return False
+        finally:
+            write_allowed.set()
+            daemon.stop()
+
+def test_selection_shows_frame_before_file():
+    """Test the selection screen displays a pending frame and registers the PNG once it exists"""
+    try:
+        screen, selection = make_selection_screen()
+        selection.asset_generator.scheduler.stop(timeout=30)
+        selection.hero_backgrounds.pop('mage', None)
+        selection.assets.invalidate('hero_mage_background')
+
+        writer = SharedImageWriter()
+        selection.pending_frames['mage'] = writer.publish(Image.new('RGB', (64, 32), (200, 40, 40)))
+
+        with tempfile.TemporaryDirectory() as backgrounds_dir:
+            path = os.path.join(backgrounds_dir, "mage.png")
+            selection._store_asset('hero_mage_background', path)
+            selection._select_hero('mage')
+            selection.update()
+
+            background = selection.current_background
+            if background is None or background.get_at((10, 10))[:3] != (200, 40, 40):
+                print("[FAIL] Pending frame not displayed before its PNG exists")
+                return False
+            if 'mage' in selection.hero_backgrounds:
+                print("[FAIL] Background path registered before the PNG was written")
+                return False
+
+            Image.new('RGB', (64, 32), (200, 40, 40)).save(path)
+            selection.update()
+            if selection.hero_backgrounds.get('mage') != path or \
+                    selection.assets.sources.get('hero_mage_background') != path:
+                print("[FAIL] Background path not registered once written")
+                return False
+            if selection.current_background is not background:
+                print("[FAIL] Displayed frame replaced when the PNG was registered")
+                return False
+
+        selection.unload()
+        writer.close()
+        print("[OK] Frame shown first, PNG registered when the write finished")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Selection frame test failed: {e}")
+        return False
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("MEDIEVAL DECK - SHARED FRAME TEST")
+    print("=" * 60)
+
+    pygame.init()
+
+    tests = [
+        test_cross_process_handoff,
+        test_unreceived_frames_expire,
+        test_daemon_shared_transfer,
+        test_frame_before_png_write,
+        test_selection_shows_frame_before_file
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+            print()
+        except Exception as e:
+            print(f"[ERROR] Test {test.__name__} crashed: {e}")
+            print()
+
+    print("=" * 60)
+    print(f"SHARED FRAME RESULTS: {passed}/{total} tests passed")
+
+    if passed == total:
+        print("[SUCCESS] Shared frame handoff operational!")
+    else:
+        print(f"[WARNING] {total - passed} tests failed - Review implementation")
+    print("=" * 60)
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Test script for the SDL2 texture rendering backend (software renderer driver)
+"""
+
+import pygame
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import GOLD, SCREEN_WIDTH, SCREEN_HEIGHT
+from utils.canvas import TextureCanvas
+from main import MedievalDeck, GameState
+import main
+
+def test_canvas_primitives():
+    """Test fills, borders and blits land where the surface backend puts them"""
+    try:
+        pygame.init()
+        canvas = TextureCanvas.create((200, 100), accelerated=0)
+
+        sprite = pygame.Surface((20, 20))
+        sprite.fill((255, 0, 0))
+        for _ in range(3):
+            canvas.fill((0, 0, 255))
+            canvas.rect(GOLD, (100, 10, 50, 50), 4)
+            canvas.blit(sprite, (10, 10))
+        frame = canvas.renderer.to_surface()
+
+        checks = {
+            (15, 15): (255, 0, 0),      # Sprite
+            (101, 30): GOLD,            # Left border
+            (125, 30): (0, 0, 255),     # Inside the outline
+            (190, 90): (0, 0, 255)      # Cleared background
+        }
+        for pos, expected in checks.items():
+            if frame.get_at(pos)[:3] != expected:
+                print(f"[FAIL] Pixel {pos} is {frame.get_at(pos)}, expected {expected}")
+                return False
+
+        if canvas.uploads != 1:
+            print(f"[FAIL] Static sprite uploaded {canvas.uploads} times")
+            return False
+
+        print("[OK] Primitives match, static sprite uploaded once over 3 frames")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Canvas primitives test failed: {e}")
+        return False
+    finally:
+        pygame.quit()
+
+def test_game_on_texture_backend():
+    """Test menu and selection render through textures with cached backgrounds"""
+    try:
+        pygame.init()
+        game = MedievalDeck(use_mock=True, render_backend="texture")
+        if game.texture_canvas is None or game.screen is not None:
+            print("[FAIL] Texture backend not selected")
+            return False
+
+        game.render()
+        frame = game.texture_canvas.renderer.to_surface()
+        if frame.get_size() != (SCREEN_WIDTH, SCREEN_HEIGHT):
+            print(f"[FAIL] Renderer not at logical size: {frame.get_size()}")
+            return False
+
+        game.change_state(GameState.SELECTION)
+        game.render()
+        background = game.selection_screen.current_background
+        texture = game.texture_canvas._textures.get(background)
+        game.render()
+        if texture is None or game.texture_canvas._textures.get(background) is not texture:
+            print("[FAIL] Background texture not reused between frames")
+            return False
+
+        print("[OK] Menu and selection rendered through the SDL2 renderer")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Texture game test failed: {e}")
+        return False
+    finally:
+        pygame.quit()
+
+def test_surface_fallback():
+    """Test the game falls back to surfaces when no renderer can be created"""
+    create = TextureCanvas.__dict__["create"]
+    try:
+        def unavailable(*args, **kwargs):
+            raise pygame.error("no renderer")
+
+        main.TextureCanvas.create = unavailable
+        pygame.init()
+        game = MedievalDeck(use_mock=True, render_backend="texture")
+        game.render()
+
+        if game.texture_canvas is not None or game.screen is None:
+            print("[FAIL] Did not fall back to the surface backend")
+            return False
+
+        print("[OK] Fell back to software surfaces")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Fallback test failed: {e}")
+        return False
+    finally:
+        main.TextureCanvas.create = create
+        pygame.quit()
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("MEDIEVAL DECK - TEXTURE BACKEND TEST")
+    print("=" * 60)
+
+    tests = [
+        test_canvas_primitives,
+        test_game_on_texture_backend,
+        test_surface_fallback
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+            print()
+        except Exception as e:
+            print(f"[ERROR] Test {test.__name__} crashed: {e}")
+            print()
+
+    print("=" * 60)
+    print(f"TEXTURE BACKEND RESULTS: {passed}/{total} tests passed")
+
+    if passed == total:
+        print("[SUCCESS] Texture rendering backend operational!")
+    else:
+        print(f"[WARNING] {total - passed} tests failed - Review implementation")
+    print("=" * 60)
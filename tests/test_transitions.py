@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Test script for screen transitions
+"""
+
+import pygame
+import sys
+import os
+import time
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import SCREEN_WIDTH, SCREEN_HEIGHT
+from utils.canvas import SurfaceCanvas
+from utils.transitions import TransitionEngine
+from main import MedievalDeck, GameState
+
+def run_midway(style):
+    """Start a transition from red to blue and draw it at half progress"""
+    canvas = SurfaceCanvas(pygame.Surface((100, 50)))
+    engine = TransitionEngine(style=style, duration=1.0)
+
+    canvas.fill((255, 0, 0))
+    engine.start(canvas)
+    canvas.fill((0, 0, 255))
+    engine.update(0.5)
+    engine.draw(canvas)
+    return engine, canvas.surface
+
+def test_styles_midway():
+    """Test each style composites the old and new frames as expected at half progress"""
+    try:
+        pygame.init()
+        _, frame = run_midway("crossfade")
+        red, _, blue, _ = frame.get_at((50, 25))
+        if not (100 < red < 155 and 100 < blue < 155):
+            print(f"[FAIL] Crossfade not blended: {frame.get_at((50, 25))}")
+            return False
+
+        _, frame = run_midway("fade")
+        if max(frame.get_at((50, 25))[:3]) > 5:
+            print(f"[FAIL] Fade not black at the midpoint: {frame.get_at((50, 25))}")
+            return False
+
+        _, frame = run_midway("wipe")
+        if frame.get_at((10, 25))[:3] != (0, 0, 255) or frame.get_at((90, 25))[:3] != (255, 0, 0):
+            print("[FAIL] Wipe edge not at half width")
+            return False
+
+        print("[OK] Crossfade blends, fade reaches black, wipe splits at the edge")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Styles test failed: {e}")
+        return False
+    finally:
+        pygame.quit()
+
+def test_buffers_reused():
+    """Test repeated transitions reuse one snapshot and stop after their duration"""
+    try:
+        pygame.init()
+        canvas = SurfaceCanvas(pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)))
+        engine = TransitionEngine(style="fade", duration=0.25)
+
+        draw_times = []
+        for _ in range(3):
+            engine.start(canvas)
+            while engine.active:
+                start = time.perf_counter()
+                engine.draw(canvas)
+                draw_times.append((time.perf_counter() - start) * 1000)
+                engine.update(1 / 60)
+
+        if engine.allocations != 1:
+            print(f"[FAIL] Buffers allocated {engine.allocations} times")
+            return False
+
+        engine.start(canvas, style=None)
+        engine.style = None
+        engine.start(canvas)
+        if engine.active:
+            print("[FAIL] Style None did not cut")
+            return False
+
+        mean_ms = sum(draw_times) / len(draw_times)
+        print(f"[OK] One buffer allocation over 3 transitions, {mean_ms:.2f}ms per draw at {SCREEN_WIDTH}x{SCREEN_HEIGHT}")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Buffer reuse test failed: {e}")
+        return False
+    finally:
+        pygame.quit()
+
+def test_game_state_change():
+    """Test change_state starts a transition that finishes with the simulation steps"""
+    try:
+        pygame.init()
+        game = MedievalDeck(use_mock=True)
+        game.render()
+        game.change_state(GameState.SELECTION)
+
+        if not game.transitions.active:
+            print("[FAIL] State change did not start a transition")
+            return False
+
+        steps = 0
+        while game.transitions.active and steps < 200:
+            game.update()
+            game.render()
+            steps += 1
+
+        if game.transitions.active:
+            print("[FAIL] Transition never finished")
+            return False
+
+        print(f"[OK] Menu -> selection transition finished after {steps} steps")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Game transition test failed: {e}")
+        return False
+    finally:
+        pygame.quit()
+
+def test_snapshot_excludes_profiler():
+    """Test the outgoing snapshot is taken without the profiler overlay"""
+    try:
+        pygame.init()
+        game = MedievalDeck(use_mock=True)
+        game.render_scaler.set_scale(1.0)
+        game.render()
+        clean = game.render_scaler.canvas.surface.subsurface((20, 20, 520, 360)).copy()
+
+        game.profiler.toggle()
+        game.render()
+        game.change_state(GameState.SELECTION)
+
+        snapshot = game.transitions.snapshot.subsurface((20, 20, 520, 360))
+        differing = sum(snapshot.get_at((x, y)) != clean.get_at((x, y))
+                        for x in range(0, 520, 8) for y in range(0, 360, 8))
+        if differing:
+            print(f"[FAIL] Overlay baked into the snapshot ({differing} sampled pixels differ)")
+            return False
+
+        print("[OK] Transition snapshot matches the frame without the F3 overlay")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Profiler snapshot test failed: {e}")
+        return False
+    finally:
+        pygame.quit()
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("MEDIEVAL DECK - TRANSITIONS TEST")
+    print("=" * 60)
+
+    tests = [
+        test_styles_midway,
+        test_buffers_reused,
+        test_game_state_change,
+        test_snapshot_excludes_profiler
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+            print()
+        except Exception as e:
+            print(f"[ERROR] Test {test.__name__} crashed: {e}")
+            print()
+
+    print("=" * 60)
+    print(f"TRANSITIONS RESULTS: {passed}/{total} tests passed")
+
+    if passed == total:
+        print("[SUCCESS] Screen transitions operational!")
+    else:
+        print(f"[WARNING] {total - passed} tests failed - Review implementation")
+    print("=" * 60)
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Test script for the retained-mode widget tree
+"""
+
+import pygame
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import WHITE, GRAY, DARK_GRAY, GOLD
+from utils.buttons import Button
+from utils.canvas import ScaledCanvas, TextureCanvas
+from utils.widgets import Layer, Panel, Label, Image, ButtonWidget
+from screens.menu import MenuScreen
+
+def test_invalidation_propagates():
+    """Test a change re-renders the node and its ancestors only, once"""
+    try:
+        pygame.init()
+        font = pygame.font.Font(None, 30)
+        root = Layer()
+        panel = root.add(Panel((10, 10, 200, 100), (0, 0, 0, 128), GOLD, 2))
+        label = panel.add(Label((100, 50), "HP 30", font, anchor="center"))
+        icon = root.add(Image((300, 10), pygame.Surface((20, 20))))
+        target = pygame.Surface((400, 200))
+
+        for _ in range(5):
+            root.draw(target)
+        if (panel.rebuilds, label.rebuilds) != (1, 0):
+            print(f"[FAIL] Unchanged tree re-rendered: panel {panel.rebuilds}, label {label.rebuilds}")
+            return False
+
+        label.set_text("HP 30")
+        root.draw(target)
+        label.set_text("HP 25")
+        if not (label.dirty and panel.dirty) or icon.dirty:
+            print("[FAIL] Dirty flag not propagated to ancestors only")
+            return False
+
+        root.draw(target)
+        root.draw(target)
+        if (panel.rebuilds, label.rebuilds) != (2, 1):
+            print(f"[FAIL] Expected one rebuild per change: panel {panel.rebuilds}, label {label.rebuilds}")
+            return False
+
+        panel.set(visible=False)
+        target.fill((0, 0, 0))
+        root.draw(target)
+        if target.get_at((11, 50))[:3] != (0, 0, 0):
+            print("[FAIL] Hidden panel still drawn")
+            return False
+
+        print("[OK] Changes re-render the node and ancestors once, hidden nodes skipped")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Invalidation test failed: {e}")
+        return False
+    finally:
+        pygame.quit()
+
+def test_button_widget_in_panel():
+    """Test nested buttons keep screen-space hit rects and invalidate their panel on hover"""
+    try:
+        pygame.init()
+        font = pygame.font.Font(None, 30)
+        root = Layer()
+        panel = root.add(Panel((100, 100, 300, 200), (20, 20, 20)))
+        button = Button(0, 0, 120, 50, "OK", font)
+        panel.add(ButtonWidget(button, (20, 30)))
+        target = pygame.Surface((500, 400))
+
+        if button.rect.topleft != (120, 130):
+            print(f"[FAIL] Button rect not at its screen position: {button.rect}")
+            return False
+
+        root.draw(target)
+        if target.get_at((125, 160))[:3] != DARK_GRAY:
+            print("[FAIL] Button not composited into the panel")
+            return False
+
+        button.handle_event(pygame.event.Event(pygame.MOUSEMOTION, pos=(150, 150), rel=(0, 0), buttons=(0, 0, 0)))
+        root.draw(target)
+        if panel.rebuilds != 2 or target.get_at((125, 160))[:3] != GRAY:
+            print(f"[FAIL] Hover did not re-render the panel ({panel.rebuilds} rebuilds)")
+            return False
+
+        print("[OK] Nested button hit-tests at (120, 130) and repaints its panel on hover")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Button widget test failed: {e}")
+        return False
+    finally:
+        pygame.quit()
+
+def test_changes_reach_cached_canvases():
+    """Test repainted widgets show their new pixels on canvases that cache by surface"""
+    try:
+        pygame.init()
+        font = pygame.font.Font(None, 30)
+        root = Layer()
+        panel = root.add(Panel((0, 0, 100, 100), (0, 255, 0)))
+        button = Button(0, 0, 60, 40, "OK", font)
+        panel.add(ButtonWidget(button, (20, 50)))
+
+        scaled = ScaledCanvas(pygame.Surface((100, 100)), 0.5, (200, 200))
+        textured = TextureCanvas.create((200, 200), accelerated=0)
+        frames = []
+        for canvas in (scaled, textured):
+            root.draw(canvas)
+        panel.set(color=(255, 0, 0))
+        button.handle_event(pygame.event.Event(pygame.MOUSEMOTION, pos=(30, 60), rel=(0, 0), buttons=(0, 0, 0)))
+        for canvas in (scaled, textured):
+            canvas.fill((0, 0, 0))
+            root.draw(canvas)
+        frames.append((scaled.surface.get_at((5, 5))[:3], scaled.surface.get_at((12, 35))[:3]))
+        frame = textured.renderer.to_surface()
+        frames.append((frame.get_at((10, 10))[:3], frame.get_at((25, 70))[:3]))
+        del textured  # Textures must not outlive pygame.quit
+
+        for name, (panel_color, button_color) in zip(("scaled", "texture"), frames):
+            if panel_color != (255, 0, 0) or button_color != GRAY:
+                print(f"[FAIL] Stale {name} canvas: panel {panel_color}, hovered button {button_color}")
+                return False
+
+        print("[OK] Panel color and button hover reach the scaled and texture canvases")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Cached canvas test failed: {e}")
+        return False
+    finally:
+        pygame.quit()
+
+def test_menu_layout_cached():
+    """Test the menu renders from its widget tree without re-rendering text each frame"""
+    try:
+        pygame.init()
+        screen = pygame.display.set_mode((100, 100))
+        menu = MenuScreen(type('Game', (), {'running': True})())
+        target = pygame.Surface((3440, 1440))
+
+        for _ in range(5):
+            menu.render(target)
+        labels = [child for child in menu.layout.children if isinstance(child, Label)]
+        if any(label.rebuilds for label in labels):
+            print("[FAIL] Menu text re-rendered between frames")
+            return False
+
+        jogar = menu.button_set.get_button_by_text("JOGAR")
+        if target.get_at((jogar.rect.left + 1, jogar.rect.centery))[:3] != WHITE:
+            print("[FAIL] Menu button border not drawn")
+            return False
+
+        print(f"[OK] {len(labels)} menu labels rendered once, buttons composited")
+        return True
+    except Exception as e:
+        print(f"[FAIL] Menu layout test failed: {e}")
+        return False
+    finally:
+        pygame.quit()
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("MEDIEVAL DECK - WIDGETS TEST")
+    print("=" * 60)
+
+    tests = [
+        test_invalidation_propagates,
+        test_button_widget_in_panel,
+        test_changes_reach_cached_canvases,
+        test_menu_layout_cached
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+            print()
+        except Exception as e:
+            print(f"[ERROR] Test {test.__name__} crashed: {e}")
+            print()
+
+    print("=" * 60)
+    print(f"WIDGETS RESULTS: {passed}/{total} tests passed")
+
+    if passed == total:
+        print("[SUCCESS] Widget tree operational!")
+    else:
+        print(f"[WARNING] {total - passed} tests failed - Review implementation")
+    print("=" * 60)
@@ -0,0 +1,205 @@
+"""
+Asset manager for Medieval Deck
+Owns image surfaces: logical ids map to files, loaded surfaces are cached
+per requested size within a byte budget and evicted least recently used first
+"""
+
+import time
+from collections import OrderedDict
+import pygame
+from config import ASSET_BUDGET_MB
+
+def surface_bytes(surface):
+    """Pixel memory held by a surface"""
+    return surface.get_pitch() * surface.get_height()
+
+def _key(asset_id, size):
+    return (asset_id, tuple(size) if size else None)
+
+class AssetManager:
+    """
+    Surface cache keyed by (asset id, size)
+    Acquired surfaces are pinned until released; everything else may be evicted
+    Not thread-safe: use it from the main (render) thread only
+    """
+
+    def __init__(self, budget_bytes=ASSET_BUDGET_MB * 1024 * 1024):
+        """
+        Initialize asset manager
+
+        Args:
+            budget_bytes: Resident pixel memory allowed before eviction
+        """
+        self.budget_bytes = budget_bytes
+        self.sources = {}
+        self.entries = OrderedDict()
+        self.refcounts = {}
+        self.evict_callbacks = {}
+        self.failed = set()
+        self.resident_bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.load_ms = 0.0
+
+    def register(self, asset_id, path):
+        """
+        Map a logical id to an image file; cached surfaces of a previous file are
+        dropped, surfaces handed over with put before the first registration are kept
+
+        Args:
+            asset_id: Logical id ('hero_knight_sprite', 'arrow_left', ...)
+            path: Image file
+        """
+        if asset_id in self.sources and self.sources[asset_id] != path:
+            self.invalidate(asset_id)
+        self.sources[asset_id] = path
+        self.failed.discard(asset_id)
+
+    def has(self, asset_id):
+        """True if the id is registered or has a surface cached"""
+        return asset_id in self.sources or any(key[0] == asset_id for key in self.entries)
+
+    def get(self, asset_id, size=None):
+        """
+        Look up a surface, loading and scaling it on a miss
+
+        Args:
+            asset_id: Logical id
+            size: (width, height) to scale to, None for the file's size
+
+        Returns:
+            pygame.Surface or None if the asset is unknown or failed to load
+        """
+        key = _key(asset_id, size)
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        if asset_id not in self.sources or asset_id in self.failed:
+            return None
+
+        self.misses += 1
+        start = time.perf_counter()
+        try:
+            surface = self._load(self.sources[asset_id], key[1])
+        except (pygame.error, OSError) as e:
+            print(f"Error loading asset {asset_id}: {e}")
+            self.failed.add(asset_id)
+            return None
+        finally:
+            self.load_ms += (time.perf_counter() - start) * 1000
+
+        self._insert(key, surface)
+        return surface
+
+    def _load(self, path, size):
+        """Load, convert to the display format and scale an image"""
+        surface = pygame.image.load(path)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha() if surface.get_flags() & pygame.SRCALPHA else surface.convert()
+        if size and surface.get_size() != size:
+            surface = pygame.transform.scale(surface, size)
+        return surface
+
+    def put(self, asset_id, surface, size=None, on_evict=None):
+        """
+        Hand an already created surface to the manager (e.g. a shared memory frame)
+
+        Args:
+            asset_id: Logical id
+            surface: Surface to own
+            size: Size it is looked up with (None matches get(asset_id))
+            on_evict: Called once the surface leaves the cache
+        """
+        key = _key(asset_id, size)
+        self._remove(key)
+        if on_evict:
+            self.evict_callbacks[key] = on_evict
+        self._insert(key, surface)
+
+    def acquire(self, asset_id, size=None):
+        """
+        Get a surface and pin it against eviction
+
+        Returns:
+            pygame.Surface or None
+        """
+        surface = self.get(asset_id, size)
+        if surface is not None:
+            key = _key(asset_id, size)
+            self.refcounts[key] = self.refcounts.get(key, 0) + 1
+        return surface
+
+    def release(self, asset_id, size=None):
+        """Unpin a surface taken with acquire; it stays cached until evicted"""
+        key = _key(asset_id, size)
+        count = self.refcounts.get(key, 0) - 1
+        if count > 0:
+            self.refcounts[key] = count
+        else:
+            self.refcounts.pop(key, None)
+        self._evict()
+
+    def invalidate(self, asset_id):
+        """Drop every cached size of an asset, pinned or not"""
+        for key in [key for key in self.entries if key[0] == asset_id]:
+            self.refcounts.pop(key, None)
+            self._remove(key)
+
+    def _insert(self, key, surface):
+        self.entries[key] = surface
+        self.resident_bytes += surface_bytes(surface)
+        self._evict()
+
+    def _remove(self, key):
+        surface = self.entries.pop(key, None)
+        if surface is None:
+            return False
+        self.resident_bytes -= surface_bytes(surface)
+        callback = self.evict_callbacks.pop(key, None)
+        if callback:
+            callback()
+        return True
+
+    def _evict(self):
+        """Drop unpinned surfaces, least recently used first, until within budget"""
+        if self.resident_bytes <= self.budget_bytes:
+            return
+        for key in list(self.entries):
+            if self.resident_bytes <= self.budget_bytes:
+                break
+            if self.refcounts.get(key):
+                continue
+            self._remove(key)
+            self.evictions += 1
+
+    def get_stats(self):
+        """
+        Cache statistics
+
+        Returns:
+            dict: resident_bytes, budget_bytes, entries, pinned, hits, misses, evictions, load_ms
+        """
+        return {
+            'resident_bytes': self.resident_bytes,
+            'budget_bytes': self.budget_bytes,
+            'entries': len(self.entries),
+            'pinned': len(self.refcounts),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'load_ms': self.load_ms
+        }
+
+    def print_stats(self):
+        """Print cache statistics"""
+        stats = self.get_stats()
+        lookups = stats['hits'] + stats['misses']
+        hit_rate = stats['hits'] / lookups * 100 if lookups else 0.0
+        print(f"Assets: {stats['entries']} surfaces, {stats['resident_bytes'] / 1024 / 1024:.1f}/"
+              f"{stats['budget_bytes'] / 1024 / 1024:.0f} MB, hit rate {hit_rate:.1f}%, "
+              f"{stats['evictions']} evictions, {stats['load_ms']:.1f}ms loading")
@@ -5,15 +5,21 @@ Reusable UI components optimized for 3440x1440 ultrawide resolution
 
 import pygame
 from config import WHITE, BLACK, GRAY, DARK_GRAY, GOLD
+from utils.canvas import as_canvas
+
+BUTTON_STATES = ("normal", "hover", "pressed")
 
 class Button:
     """
     Reusable button class with hover effects and click detection
     Optimized for ultrawide display with appropriate sizing
+    Each state is pre-composited into a cached surface, rebuilt only when
+    the text, size or style changes, so drawing is a single blit
     """
     
     def __init__(self, x, y, width, height, text, font, 
-                 color=WHITE, bg_color=DARK_GRAY, hover_color=GRAY):
+                 color=WHITE, bg_color=DARK_GRAY, hover_color=GRAY,
+                 pressed_color=None, border_color=WHITE, border_width=3, skin=None):
         """
         Initialize button with position, size, and styling
         
@@ -25,6 +31,10 @@ class Button:
             color: Text color
             bg_color: Background color
             hover_color: Hover state color
+            pressed_color: Pressed state color (defaults to hover_color)
+            border_color: Border color
+            border_width: Border thickness, 0 for none
+            skin: Image used instead of the colored background, see set_skin
         """
         self.rect = pygame.Rect(x, y, width, height)
         self.text = text
@@ -32,13 +42,24 @@ class Button:
         self.color = color
         self.bg_color = bg_color
         self.hover_color = hover_color
+        self.pressed_color = pressed_color
+        self.border_color = border_color
+        self.border_width = border_width
+        self.skin = skin
+        self.skin_text = True
         self.is_hovered = False
         self.is_clicked = False
+        self.on_change = None  # Called when the visual state or skin changes
         
         # Pre-render text for performance
         self.text_surface = self.font.render(self.text, True, self.color)
         self.text_rect = self.text_surface.get_rect(center=self.rect.center)
         
+        # State composites, valid while the style key is unchanged
+        self._composites = {}
+        self._composite_key = None
+        self.rebuilds = 0
+        
     def handle_event(self, event):
         """
         Handle mouse events for button interaction
@@ -49,36 +70,136 @@ class Button:
         Returns:
             bool: True if button was clicked
         """
+        state = self.state
+        clicked = False
         if event.type == pygame.MOUSEMOTION:
             self.is_hovered = self.rect.collidepoint(event.pos)
             
         elif event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1 and self.rect.collidepoint(event.pos):
                 self.is_clicked = True
-                return True
+                clicked = True
                 
         elif event.type == pygame.MOUSEBUTTONUP:
             if event.button == 1:
                 self.is_clicked = False
                 
-        return False
+        if self.on_change and self.state != state:
+            self.on_change()
+        return clicked
         
-    def draw(self, screen):
+    def subscribe(self, event_bus, on_click):
         """
-        Draw button with current state styling
+        Register the button on an event bus; clicks only reach it inside its rect
         
         Args:
-            screen: Pygame surface to draw on
+            event_bus: EventBus to subscribe to
+            on_click: Called on click; its return value ends dispatch if not None
+        """
+        def click(event):
+            if self.handle_event(event):
+                return on_click()
+            return None
+        
+        event_bus.subscribe(pygame.MOUSEMOTION, self.handle_event)
+        event_bus.subscribe(pygame.MOUSEBUTTONDOWN, click, region=self.rect)
+        event_bus.subscribe(pygame.MOUSEBUTTONUP, self.handle_event)
+        
+    @property
+    def state(self):
+        """Current visual state: 'normal', 'hover' or 'pressed'"""
+        if self.is_clicked:
+            return "pressed"
+        return "hover" if self.is_hovered else "normal"
+        
+    def set_skin(self, skin, show_text=True):
         """
-        # Choose color based on state
-        current_bg = self.hover_color if self.is_hovered else self.bg_color
+        Skin the button with an image (e.g. generated UI art)
         
-        # Draw button background
-        pygame.draw.rect(screen, current_bg, self.rect)
-        pygame.draw.rect(screen, WHITE, self.rect, 3)  # Border
+        Args:
+            skin: Surface scaled to the button (hover and pressed states are
+                  brightened / darkened from it), a dict of state -> Surface,
+                  or None for the colored background
+            show_text: Draw the button text over the skin
+        """
+        self.skin = skin
+        self.skin_text = show_text
+        if self.on_change:
+            self.on_change()
+        
+    def _style_key(self):
+        """Everything a composite depends on; any change triggers a rebuild"""
+        return (self.text, self.rect.size, self.font, self.color, self.bg_color, self.hover_color,
+                self.pressed_color, self.border_color, self.border_width, self.skin, self.skin_text)
+        
+    def get_surface(self, state=None):
+        """
+        Pre-composited surface of a state
+        
+        Args:
+            state: One of BUTTON_STATES (defaults to the current state)
+            
+        Returns:
+            pygame.Surface: Background, border and text at the button size
+        """
+        key = self._style_key()
+        if key != self._composite_key:
+            self._composites = {}
+            self._composite_key = key
+            self.text_surface = self.font.render(self.text, True, self.color)
+            self.text_rect = self.text_surface.get_rect(center=self.rect.center)
+            
+        state = state or self.state
+        surface = self._composites.get(state)
+        if surface is None:
+            surface = self._compose(state)
+            self._composites[state] = surface
+            self.rebuilds += 1
+        return surface
         
-        # Draw text
-        screen.blit(self.text_surface, self.text_rect)
+    def _compose(self, state):
+        """Render one state into a new surface"""
+        size = self.rect.size
+        if self.skin is not None:
+            surface = pygame.Surface(size, pygame.SRCALPHA)
+            if isinstance(self.skin, dict):
+                surface.blit(pygame.transform.smoothscale(self.skin.get(state, self.skin["normal"]), size), (0, 0))
+            else:
+                surface.blit(pygame.transform.smoothscale(self.skin, size), (0, 0))
+                if state == "hover":
+                    surface.fill((40, 40, 40, 0), special_flags=pygame.BLEND_RGBA_ADD)
+                elif state == "pressed":
+                    surface.fill((180, 180, 180, 255), special_flags=pygame.BLEND_RGBA_MULT)
+        else:
+            surface = pygame.Surface(size)
+            colors = {"normal": self.bg_color, "hover": self.hover_color,
+                      "pressed": self.pressed_color or self.hover_color}
+            surface.fill(colors[state])
+            if self.border_width:
+                pygame.draw.rect(surface, self.border_color, surface.get_rect(), self.border_width)
+                
+        if self.skin is None or self.skin_text:
+            # Pressed text sinks slightly
+            offset = 2 if state == "pressed" else 0
+            surface.blit(self.text_surface, self.text_surface.get_rect(center=(size[0] // 2, size[1] // 2 + offset)))
+            
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha() if self.skin is not None else surface.convert()
+        return surface
+        
+    def blit_item(self):
+        """(surface, position) of the current state, for batched Surface.blits"""
+        return (self.get_surface(), self.rect.topleft)
+        
+    def draw(self, screen):
+        """
+        Draw button with current state styling
+        
+        Args:
+            screen: Pygame surface or canvas to draw on
+        """
+        screen = as_canvas(screen)
+        screen.blit(*self.blit_item())
 
 
 class MenuButtonSet:
@@ -153,15 +274,32 @@ class MenuButtonSet:
                     return button_data['text']
         return None
         
-    def draw(self, screen):
+    def subscribe(self, event_bus):
         """
-        Draw all buttons in the set
+        Register all buttons on an event bus
+        A click runs the button callback and dispatch returns the button text
         
         Args:
-            screen: Pygame surface to draw on
+            event_bus: EventBus to subscribe to
         """
         for button_data in self.buttons:
-            button_data['button'].draw(screen)
+            button_data['button'].subscribe(event_bus, lambda data=button_data: self._click(data))
+            
+    def _click(self, button_data):
+        """Run a button callback and report the button text"""
+        if button_data['callback']:
+            button_data['callback']()
+        return button_data['text']
+        
+    def draw(self, screen):
+        """
+        Draw all buttons in the set with one blits call
+        
+        Args:
+            screen: Pygame surface or canvas to draw on
+        """
+        screen = as_canvas(screen)
+        screen.blits([button_data['button'].blit_item() for button_data in self.buttons])
             
     def get_button_by_text(self, text):
         """
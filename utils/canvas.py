@@ -0,0 +1,268 @@
+"""
+Drawing canvases for Medieval Deck
+Screens draw in logical (native SCREEN_WIDTH x SCREEN_HEIGHT) coordinates;
+the canvas decides at which internal resolution and with which backend
+(software surfaces or SDL2 textures) the pixels are produced
+"""
+
+import weakref
+import pygame
+
+def as_canvas(target):
+    """
+    Wrap a surface as a canvas (canvases are returned unchanged)
+
+    Args:
+        target: pygame.Surface or canvas
+
+    Returns:
+        Canvas drawing onto target
+    """
+    if isinstance(target, pygame.Surface):
+        return SurfaceCanvas(target)
+    return target
+
+class SurfaceCanvas:
+    """Draws straight onto a surface; logical and surface coordinates match"""
+
+    scale = 1.0
+
+    def __init__(self, surface):
+        """
+        Initialize canvas
+
+        Args:
+            surface: Target surface
+        """
+        self.surface = surface
+
+    def get_size(self):
+        """Logical size of the canvas"""
+        return self.surface.get_size()
+
+    def fill(self, color, rect=None):
+        """Fill the canvas or a logical rect"""
+        return self.surface.fill(color, rect)
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        """Blit a surface at a logical position"""
+        return self.surface.blit(source, dest, area, special_flags)
+
+    def blits(self, blit_sequence):
+        """Blit many (source, dest) pairs in one call (pygame.Surface.blits)"""
+        self.surface.blits(blit_sequence, doreturn=False)
+
+    def rect(self, color, rect, width=0):
+        """Draw a rectangle (pygame.draw.rect)"""
+        return pygame.draw.rect(self.surface, color, rect, width)
+
+    def line(self, color, start, end, width=1):
+        """Draw a line (pygame.draw.line)"""
+        return pygame.draw.line(self.surface, color, start, end, width)
+
+    def circle(self, color, center, radius, width=0):
+        """Draw a circle (pygame.draw.circle)"""
+        return pygame.draw.circle(self.surface, color, center, radius, width)
+
+class ScaledCanvas(SurfaceCanvas):
+    """
+    Draws logical coordinates into a smaller offscreen surface
+    Blitted surfaces are scaled once and cached while they are alive
+    """
+
+    def __init__(self, surface, scale, logical_size):
+        """
+        Initialize canvas
+
+        Args:
+            surface: Offscreen surface at the internal resolution
+            scale: Internal / logical size ratio
+            logical_size: Size screens lay out against
+        """
+        super().__init__(surface)
+        self.scale = scale
+        self.logical_size = logical_size
+        self._scaled_cache = weakref.WeakKeyDictionary()
+
+    def get_size(self):
+        """Logical size of the canvas"""
+        return self.logical_size
+
+    def _scale_point(self, point):
+        return (int(point[0] * self.scale), int(point[1] * self.scale))
+
+    def _scale_rect(self, rect):
+        rect = pygame.Rect(rect)
+        left, top = int(rect.left * self.scale), int(rect.top * self.scale)
+        return pygame.Rect(left, top,
+                           int(rect.right * self.scale) - left, int(rect.bottom * self.scale) - top)
+
+    def _scale_width(self, width):
+        return max(1, round(width * self.scale)) if width > 0 else 0
+
+    def _scale_surface(self, source):
+        """Scaled copy of a surface, cached for surfaces reused across frames"""
+        scaled = self._scaled_cache.get(source)
+        if scaled is not None:
+            return scaled
+
+        size = (max(1, int(source.get_width() * self.scale)),
+                max(1, int(source.get_height() * self.scale)))
+        try:
+            scaled = pygame.transform.smoothscale(source, size)
+        except ValueError:
+            scaled = pygame.transform.scale(source, size)  # Palettized surfaces
+
+        # Surface-level alpha and colorkey are not carried over by the transform
+        if source.get_alpha() is not None and not source.get_flags() & pygame.SRCALPHA:
+            scaled.set_alpha(source.get_alpha())
+        if source.get_colorkey() is not None:
+            scaled.set_colorkey(source.get_colorkey())
+
+        self._scaled_cache[source] = scaled
+        return scaled
+
+    def fill(self, color, rect=None):
+        return self.surface.fill(color, self._scale_rect(rect) if rect is not None else None)
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        return self.surface.blit(
+            self._scale_surface(source), self._scale_point(dest),
+            self._scale_rect(area) if area is not None else None, special_flags
+        )
+
+    def blits(self, blit_sequence):
+        self.surface.blits([(self._scale_surface(source), self._scale_point(dest))
+                            for source, dest in blit_sequence], doreturn=False)
+
+    def rect(self, color, rect, width=0):
+        return pygame.draw.rect(self.surface, color, self._scale_rect(rect), self._scale_width(width))
+
+    def line(self, color, start, end, width=1):
+        return pygame.draw.line(self.surface, color, self._scale_point(start),
+                                self._scale_point(end), self._scale_width(width))
+
+    def circle(self, color, center, radius, width=0):
+        return pygame.draw.circle(self.surface, color, self._scale_point(center),
+                                  max(1, int(radius * self.scale)), self._scale_width(width))
+
+class TextureCanvas:
+    """
+    Draws through an SDL2 renderer (pygame._sdl2.video)
+    Blitted surfaces are uploaded as textures once and reused while the surface
+    lives, so static art costs a GPU copy per frame instead of a CPU blit
+    """
+
+    scale = 1.0
+
+    def __init__(self, renderer, logical_size):
+        """
+        Initialize canvas
+
+        Args:
+            renderer: pygame._sdl2.video.Renderer
+            logical_size: Size screens lay out against; SDL scales it to the window
+        """
+        self.renderer = renderer
+        self.logical_size = logical_size
+        self.renderer.logical_size = logical_size
+        self._textures = weakref.WeakKeyDictionary()
+        self.uploads = 0
+
+    @classmethod
+    def create(cls, logical_size, title="Medieval Deck", window_size=None, accelerated=-1, vsync=False):
+        """
+        Open a window with a renderer
+
+        Args:
+            logical_size: Size screens lay out against
+            title: Window title
+            window_size: Window size (defaults to the logical size)
+            accelerated: 1 GPU renderer, 0 software renderer, -1 whichever SDL picks
+            vsync: Present in sync with the display refresh
+
+        Returns:
+            TextureCanvas
+
+        Raises:
+            ImportError: pygame built without SDL2 video bindings
+            pygame.error: No renderer could be created
+        """
+        from pygame._sdl2.video import Window, Renderer
+
+        window = Window(title, size=window_size or logical_size)
+        renderer = Renderer(window, accelerated=accelerated, vsync=vsync)
+        canvas = cls(renderer, logical_size)
+        canvas.window = window
+        return canvas
+
+    def get_size(self):
+        """Logical size of the canvas"""
+        return self.logical_size
+
+    def _set_color(self, color):
+        self.renderer.draw_color = tuple(color) if len(color) == 4 else (*color, 255)
+
+    def texture_for(self, source):
+        """Texture for a surface, uploaded on first use"""
+        texture = self._textures.get(source)
+        if texture is None:
+            from pygame._sdl2.video import Texture
+            texture = Texture.from_surface(self.renderer, source)
+            self._textures[source] = texture
+            self.uploads += 1
+        return texture
+
+    def fill(self, color, rect=None):
+        self._set_color(color)
+        if rect is None:
+            self.renderer.clear()
+        else:
+            self.renderer.fill_rect(pygame.Rect(rect))
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        area = pygame.Rect(area) if area is not None else source.get_rect()
+        dest_rect = pygame.Rect(dest[0], dest[1], area.width, area.height)
+        self.texture_for(source).draw(srcrect=area, dstrect=dest_rect)
+        return dest_rect
+
+    def blits(self, blit_sequence):
+        for source, dest in blit_sequence:
+            self.texture_for(source).draw(dstrect=(dest[0], dest[1], source.get_width(), source.get_height()))
+
+    def rect(self, color, rect, width=0):
+        rect = pygame.Rect(rect)
+        self._set_color(color)
+        if width <= 0:
+            self.renderer.fill_rect(rect)
+        else:
+            # Border as four filled strips, matching pygame.draw.rect
+            self.renderer.fill_rect((rect.left, rect.top, rect.width, width))
+            self.renderer.fill_rect((rect.left, rect.bottom - width, rect.width, width))
+            self.renderer.fill_rect((rect.left, rect.top, width, rect.height))
+            self.renderer.fill_rect((rect.right - width, rect.top, width, rect.height))
+        return rect
+
+    def line(self, color, start, end, width=1):
+        self._set_color(color)
+        if width <= 1:
+            self.renderer.draw_line(start, end)
+        elif start[1] == end[1]:
+            self.renderer.fill_rect((min(start[0], end[0]), start[1] - width // 2, abs(end[0] - start[0]) + 1, width))
+        elif start[0] == end[0]:
+            self.renderer.fill_rect((start[0] - width // 2, min(start[1], end[1]), width, abs(end[1] - start[1]) + 1))
+        else:
+            for offset in range(-(width // 2), width - width // 2):
+                self.renderer.draw_line((start[0] + offset, start[1]), (end[0] + offset, end[1]))
+        return pygame.Rect(min(start[0], end[0]), min(start[1], end[1]),
+                           abs(end[0] - start[0]) + 1, abs(end[1] - start[1]) + 1)
+
+    def circle(self, color, center, radius, width=0):
+        # No circle primitive in the renderer; draw it on a small surface
+        surface = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+        pygame.draw.circle(surface, color, (radius, radius), radius, width)
+        return self.blit(surface, (center[0] - radius, center[1] - radius))
+
+    def present(self):
+        """Show the frame"""
+        self.renderer.present()
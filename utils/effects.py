@@ -0,0 +1,255 @@
+"""
+Effects compositor for Medieval Deck
+Glows, translucent panels and gradients are baked once into cached surfaces
+and composited with plain blits, so drawing them allocates nothing per frame
+"""
+
+import weakref
+from collections import OrderedDict
+import pygame
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # Glows fall back to a smoothscale-only blur
+
+class SurfacePool:
+    """Scratch surfaces reused by size; contents are undefined until the caller fills them"""
+
+    def __init__(self):
+        """Initialize pool"""
+        self.surfaces = {}
+        self.allocations = 0
+
+    def get(self, size, alpha=True):
+        """
+        Get the scratch surface for a size
+
+        Args:
+            size: (width, height)
+            alpha: Per-pixel alpha (SRCALPHA) or opaque
+
+        Returns:
+            pygame.Surface: Shared scratch surface, valid until the next get of the same size
+        """
+        key = (tuple(size), alpha)
+        surface = self.surfaces.get(key)
+        if surface is None:
+            surface = pygame.Surface(key[0], pygame.SRCALPHA if alpha else 0)
+            self.surfaces[key] = surface
+            self.allocations += 1
+        return surface
+
+    def clear(self):
+        """Drop all scratch surfaces"""
+        self.surfaces.clear()
+
+def _display_format(surface):
+    """Convert a baked surface to the display's pixel format so blits skip conversion"""
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert_alpha() if surface.get_flags() & pygame.SRCALPHA else surface.convert()
+
+def _box_blur(values, radius, axis):
+    """Running-sum box blur of a 2D array along one axis"""
+    pad = [(0, 0), (0, 0)]
+    pad[axis] = (radius + 1, radius)
+    sums = np.cumsum(np.pad(values, pad, mode='edge'), axis=axis)
+    window = 2 * radius + 1
+    if axis == 0:
+        return (sums[window:] - sums[:-window]) / window
+    return (sums[:, window:] - sums[:, :-window]) / window
+
+class Effects:
+    """
+    Cache of prebaked effect surfaces
+    Glows of sprites are cached while the sprite surface lives; panels and
+    gradients are kept least recently used first up to max_entries
+    """
+
+    def __init__(self, max_entries=64, downsample=4):
+        """
+        Initialize effects cache
+
+        Args:
+            max_entries: Baked panels, gradients and rect glows kept
+            downsample: Factor glows are blurred at below full resolution
+        """
+        self.max_entries = max_entries
+        self.downsample = downsample
+        self.pool = SurfacePool()
+        self._baked = OrderedDict()
+        self._glows = weakref.WeakKeyDictionary()
+
+        self.bakes = 0
+        self.hits = 0
+
+    def _cached(self, key, bake):
+        """Look up a baked surface, baking and storing it on a miss"""
+        surface = self._baked.get(key)
+        if surface is not None:
+            self._baked.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        surface = bake()
+        self.bakes += 1
+        self._baked[key] = surface
+        while len(self._baked) > self.max_entries:
+            self._baked.popitem(last=False)
+        return surface
+
+    def glow(self, source, color, radius=24, strength=1.0):
+        """
+        Soft glow around a sprite's shape (or a rectangle)
+
+        Args:
+            source: Sprite surface (its alpha is the glow shape) or (width, height)
+            color: Glow RGB color
+            radius: Blur radius in pixels; the glow extends this far past the source
+            strength: Peak opacity, 0 to 1
+
+        Returns:
+            pygame.Surface: SRCALPHA surface radius pixels larger than the source on each side
+        """
+        params = (tuple(color[:3]), radius, strength)
+        if not isinstance(source, pygame.Surface):
+            return self._cached(('glow', tuple(source)) + params,
+                                lambda: self._bake_glow(None, tuple(source), *params))
+
+        glows = self._glows.setdefault(source, {})
+        surface = glows.get(params)
+        if surface is None:
+            surface = self._bake_glow(source, source.get_size(), *params)
+            glows[params] = surface
+            self.bakes += 1
+        else:
+            self.hits += 1
+        return surface
+
+    def _bake_glow(self, source, size, color, radius, strength):
+        """Downsample the shape, blur it on NumPy and upsample the result"""
+        factor = self.downsample
+        full_size = (size[0] + 2 * radius, size[1] + 2 * radius)
+        small_size = (max(1, full_size[0] // factor), max(1, full_size[1] // factor))
+        inner = (max(1, size[0] // factor), max(1, size[1] // factor))
+        offset = ((small_size[0] - inner[0]) // 2, (small_size[1] - inner[1]) // 2)
+
+        small = self.pool.get(small_size)
+        small.fill((*color, 0))
+        if source is not None and source.get_flags() & pygame.SRCALPHA:
+            shape = pygame.transform.smoothscale(source, inner)
+        else:
+            shape = self.pool.get(inner, alpha=False)
+            shape.fill(color)
+        small.blit(shape, offset, special_flags=pygame.BLEND_RGBA_MAX)
+
+        if np is not None:
+            blur_radius = max(1, radius // (2 * factor))
+            alpha = pygame.surfarray.array_alpha(small).astype(np.float32)
+            for _ in range(3):  # Three box passes approximate a gaussian
+                alpha = _box_blur(_box_blur(alpha, blur_radius, 0), blur_radius, 1)
+            small.fill((*color, 0))
+            pixels = pygame.surfarray.pixels_alpha(small)
+            pixels[...] = np.clip(alpha * strength, 0, 255).astype(np.uint8)
+            del pixels  # Unlock the surface
+        else:
+            # Keep the shape's alpha, recolor it; the upsample alone softens the edge
+            small.fill((0, 0, 0, int(255 * strength)), special_flags=pygame.BLEND_RGBA_MULT)
+            small.fill((*color, 0), special_flags=pygame.BLEND_RGBA_ADD)
+
+        return _display_format(pygame.transform.smoothscale(small, full_size))
+
+    def draw_glow(self, canvas, source, center, color, radius=24, strength=1.0):
+        """
+        Blit a glow centered on a position
+
+        Args:
+            canvas: Canvas to draw on
+            source: Sprite surface or (width, height), see glow()
+            center: Logical center of the sprite
+            color, radius, strength: See glow()
+        """
+        glow = self.glow(source, color, radius, strength)
+        canvas.blit(glow, glow.get_rect(center=center))
+
+    def panel(self, size, color=(0, 0, 0, 180), border_color=None, border_width=0):
+        """
+        Translucent panel with an optional opaque border
+
+        Args:
+            size: (width, height)
+            color: RGBA fill; the alpha sets the translucency
+            border_color: Border RGB(A), None for no border
+            border_width: Border thickness in pixels
+
+        Returns:
+            pygame.Surface: SRCALPHA surface of the given size
+        """
+        key = ('panel', tuple(size), tuple(color), tuple(border_color) if border_color else None, border_width)
+
+        def bake():
+            surface = pygame.Surface(size, pygame.SRCALPHA)
+            surface.fill(color)
+            if border_color and border_width:
+                pygame.draw.rect(surface, border_color, surface.get_rect(), border_width)
+            return _display_format(surface)
+        return self._cached(key, bake)
+
+    def draw_panel(self, canvas, rect, color=(0, 0, 0, 180), border_color=None, border_width=0):
+        """
+        Blit a translucent panel over a logical rect
+
+        Args:
+            canvas: Canvas to draw on
+            rect: Logical rect the panel covers
+            color, border_color, border_width: See panel()
+        """
+        rect = pygame.Rect(rect)
+        canvas.blit(self.panel(rect.size, color, border_color, border_width), rect.topleft)
+
+    def gradient(self, size, top, bottom):
+        """
+        Opaque vertical gradient
+
+        Args:
+            size: (width, height)
+            top: RGB at the first row
+            bottom: RGB at the last row
+
+        Returns:
+            pygame.Surface
+        """
+        key = ('gradient', tuple(size), tuple(top), tuple(bottom))
+
+        def bake():
+            surface = pygame.Surface(size)
+            width, height = size
+            if np is not None:
+                t = np.linspace(0.0, 1.0, height, dtype=np.float32)[:, None]
+                rows = np.array(top, np.float32) * (1 - t) + np.array(bottom, np.float32) * t
+                pixels = pygame.surfarray.pixels3d(surface)
+                pixels[...] = rows.astype(np.uint8)[None, :, :]
+                del pixels
+            else:
+                for y in range(height):
+                    t = y / max(1, height - 1)
+                    color = [int(a * (1 - t) + b * t) for a, b in zip(top, bottom)]
+                    pygame.draw.line(surface, color, (0, y), (width, y))
+            return _display_format(surface)
+        return self._cached(key, bake)
+
+    def get_stats(self):
+        """
+        Cache statistics
+
+        Returns:
+            dict: baked, sprite_glows, bakes, hits, scratch_allocations
+        """
+        return {
+            'baked': len(self._baked),
+            'sprite_glows': sum(len(glows) for glows in self._glows.values()),
+            'bakes': self.bakes,
+            'hits': self.hits,
+            'scratch_allocations': self.pool.allocations
+        }
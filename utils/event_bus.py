@@ -0,0 +1,105 @@
+"""
+Event bus for Medieval Deck
+Handlers subscribe by event type (and optionally a screen region), so an
+event only reaches the handlers interested in it
+"""
+
+import pygame
+
+class EventBus:
+    """
+    Type-indexed event dispatch with per-frame coalescing
+    A handler returning a value ends dispatch and that value is returned
+    (screens use it for the next game state)
+    """
+
+    def __init__(self, coalesce_types=(pygame.MOUSEMOTION,)):
+        """
+        Initialize event bus
+
+        Args:
+            coalesce_types: Event types where only the last event of a frame matters
+        """
+        self.coalesce_types = set(coalesce_types)
+        self.handlers = {}
+
+    def subscribe(self, event_type, handler, region=None):
+        """
+        Register a handler for an event type
+
+        Args:
+            event_type: pygame event type
+            handler: Callable taking the event
+            region: Optional pygame.Rect; positional events outside it are skipped
+
+        Returns:
+            Handler, for unsubscribe
+        """
+        self.handlers.setdefault(event_type, []).append((region, handler))
+        return handler
+
+    def unsubscribe(self, event_type, handler):
+        """
+        Remove a handler
+
+        Args:
+            event_type: pygame event type it was registered for
+            handler: Handler returned by subscribe
+        """
+        entries = self.handlers.get(event_type, [])
+        entries[:] = [entry for entry in entries if entry[1] is not handler]
+        if not entries:
+            self.handlers.pop(event_type, None)
+
+    def coalesce(self, events):
+        """
+        Keep only the last event of each coalesced type, at its position in the frame
+        Relative mouse motion is summed so nothing is lost
+
+        Args:
+            events: Events of one frame
+
+        Returns:
+            list: Events to dispatch
+        """
+        last = {}
+        for index, event in enumerate(events):
+            if event.type in self.coalesce_types:
+                last.setdefault(event.type, []).append(index)
+        if all(len(indices) == 1 for indices in last.values()):
+            return list(events)
+
+        keep = {indices[-1] for indices in last.values()}
+        result = []
+        for index, event in enumerate(events):
+            if event.type not in self.coalesce_types:
+                result.append(event)
+            elif index in keep:
+                merged = [events[i] for i in last[event.type]]
+                if event.type == pygame.MOUSEMOTION and all(hasattr(e, 'rel') for e in merged):
+                    rel = (sum(e.rel[0] for e in merged), sum(e.rel[1] for e in merged))
+                    event = pygame.event.Event(event.type, dict(event.dict, rel=rel))
+                result.append(event)
+        return result
+
+    def dispatch(self, events):
+        """
+        Deliver a frame of events to subscribed handlers
+
+        Args:
+            events: Events of one frame
+
+        Returns:
+            First non-empty handler result, or None
+        """
+        for event in self.coalesce(events):
+            entries = self.handlers.get(event.type)
+            if not entries:
+                continue
+            for region, handler in list(entries):
+                if region is not None and not region.collidepoint(event.pos):
+                    continue
+                result = handler(event)
+                if result:
+                    return result
+        return None
@@ -0,0 +1,156 @@
+"""
+Font registry for Medieval Deck
+Font objects are shared by (face, size) across screens, and frequently
+changing strings (HP, mana, damage numbers, timings) are composed from a
+glyph atlas instead of rasterizing the whole string every frame
+"""
+
+import string
+import pygame
+from config import WHITE
+from utils.canvas import as_canvas
+
+ATLAS_CHARSET = string.digits + string.ascii_letters + string.punctuation + " "
+ATLAS_WIDTH = 1024  # Atlas row width before wrapping to the next shelf
+
+class GlyphAtlas:
+    """
+    Pre-rendered glyphs of one font and color packed into a single surface
+    Glyphs are subsurfaces of the atlas, so drawing a string is one blits call
+    """
+
+    def __init__(self, font, color=WHITE, charset=ATLAS_CHARSET):
+        """
+        Initialize atlas
+
+        Args:
+            font: pygame.font.Font
+            color: Text color
+            charset: Characters packed up front; others are rendered on first use
+        """
+        self.font = font
+        self.color = color
+        self.height = font.get_height()
+        self.glyphs = {}
+        self.advances = {}
+
+        rendered = [(char, font.render(char, True, color)) for char in dict.fromkeys(charset)]
+        row_height = max(glyph.get_height() for _, glyph in rendered)
+        positions = []
+        x = y = 0
+        for char, glyph in rendered:
+            if x + glyph.get_width() > ATLAS_WIDTH:
+                x, y = 0, y + row_height
+            positions.append((x, y))
+            x += glyph.get_width()
+
+        self.surface = pygame.Surface((ATLAS_WIDTH, y + row_height), pygame.SRCALPHA)
+        for (char, glyph), (x, y) in zip(rendered, positions):
+            # MAX copies the antialiased glyph exactly onto the transparent atlas
+            self.surface.blit(glyph, (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+            self.glyphs[char] = self.surface.subsurface((x, y, glyph.get_width(), glyph.get_height()))
+            self.advances[char] = font.size(char)[0]
+
+    def _glyph(self, char):
+        """Glyph surface of a character, rendering characters outside the charset once"""
+        glyph = self.glyphs.get(char)
+        if glyph is None:
+            glyph = self.font.render(char, True, self.color)
+            self.glyphs[char] = glyph
+            self.advances[char] = self.font.size(char)[0]
+        return glyph
+
+    def size(self, text):
+        """(width, height) the text occupies"""
+        for char in text:
+            self._glyph(char)
+        return (sum(self.advances[char] for char in text), self.height)
+
+    def draw(self, canvas, text, pos, anchor="topleft"):
+        """
+        Draw a string from cached glyphs
+
+        Args:
+            canvas: Surface or canvas to draw on (logical coordinates)
+            text: String to draw
+            pos: Anchor position
+            anchor: pygame.Rect attribute pos refers to ('center', 'bottomright', ...)
+
+        Returns:
+            pygame.Rect: Area covered by the text
+        """
+        glyphs = []
+        x = 0
+        for char in text:
+            glyph = self.glyphs.get(char)
+            if glyph is None:
+                glyph = self._glyph(char)
+            if char != " ":
+                glyphs.append((glyph, x))
+            x += self.advances[char]
+
+        rect = pygame.Rect(0, 0, x, self.height)
+        setattr(rect, anchor, pos)
+        left, top = rect.topleft
+        as_canvas(canvas).blits([(glyph, (left + offset, top)) for glyph, offset in glyphs])
+        return rect
+
+class FontRegistry:
+    """
+    Shared fonts keyed by (face, size) and glyph atlases keyed by (face, size, color)
+    """
+
+    def __init__(self):
+        """Initialize registry"""
+        self.fonts = {}
+        self.atlases = {}
+        self.requests = 0
+
+    def get(self, size, face=None):
+        """
+        Get a font, creating it on first request
+
+        Args:
+            size: Point size
+            face: Font file (None for pygame's default font)
+
+        Returns:
+            pygame.font.Font
+        """
+        self.requests += 1
+        key = (face, size)
+        font = self.fonts.get(key)
+        if font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            font = pygame.font.Font(face, size)
+            self.fonts[key] = font
+        return font
+
+    def atlas(self, size, color=WHITE, face=None):
+        """
+        Get the glyph atlas of a font and color
+
+        Args:
+            size: Point size
+            color: Text color
+            face: Font file (None for pygame's default font)
+
+        Returns:
+            GlyphAtlas
+        """
+        key = (face, size, tuple(color))
+        atlas = self.atlases.get(key)
+        if atlas is None:
+            atlas = GlyphAtlas(self.get(size, face), color)
+            self.atlases[key] = atlas
+        return atlas
+
+    def get_stats(self):
+        """
+        Registry statistics
+
+        Returns:
+            dict: fonts, atlases, requests
+        """
+        return {'fonts': len(self.fonts), 'atlases': len(self.atlases), 'requests': self.requests}
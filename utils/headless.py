@@ -0,0 +1,146 @@
+"""
+Headless run mode for Medieval Deck
+Plays a scripted input timeline without a display and reports frame time
+percentiles per screen (python -m utils.headless --frames 600)
+"""
+
+import os
+import time
+import pygame
+from config import FPS
+from utils.profiler import compute_percentiles
+from main import MedievalDeck
+
+def motion(pos):
+    """Mouse motion to a logical position"""
+    return [pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=(0, 0), buttons=(0, 0, 0))]
+
+def click(pos):
+    """Move to a position and left click it"""
+    return motion(pos) + [
+        pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=1),
+        pygame.event.Event(pygame.MOUSEBUTTONUP, pos=pos, button=1)
+    ]
+
+def key_press(key):
+    """Press and release a key"""
+    return [
+        pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode="", scancode=0),
+        pygame.event.Event(pygame.KEYUP, key=key, mod=0, unicode="", scancode=0)
+    ]
+
+def default_script(game, frames):
+    """
+    Menu -> JOGAR -> navigate heroes -> confirm, spread over the run
+
+    Args:
+        game: MedievalDeck instance (button positions are read from its layout)
+        frames: Frames the run lasts
+
+    Returns:
+        dict: frame index -> events posted before that frame
+    """
+    jogar = game.menu_screen.button_set.get_button_by_text("JOGAR").rect.center
+    step = max(1, frames // 10)
+    script = {
+        step: motion(jogar),
+        2 * step: click(jogar)
+    }
+    for i in range(3):
+        script[(4 + i) * step] = key_press(pygame.K_RIGHT)
+    script[8 * step] = key_press(pygame.K_RETURN)
+    return script
+
+class HeadlessRunner:
+    """
+    Runs the game on the SDL dummy video driver for a fixed number of frames
+    Frames advance by a fixed simulated time and run back to back (no frame cap)
+    """
+
+    def __init__(self, frames=600, script=None, frame_time=None, use_mock=True, render_scale=1.0):
+        """
+        Initialize runner
+
+        Args:
+            frames: Frames to run
+            script: dict frame -> events, or callable(game, frames) building one
+            frame_time: Simulated seconds per frame (defaults to 1 / FPS)
+            use_mock: Generate assets with the mock pipeline
+            render_scale: Fixed internal render scale (automatic scaling is disabled)
+        """
+        # Must be set before the display is initialized
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+        self.game = MedievalDeck(use_mock=use_mock)
+        self.game.render_scaler.auto = False
+        self.game.render_scaler.set_scale(render_scale)
+
+        self.frames = frames
+        self.frame_time = frame_time or 1.0 / (FPS or 60)
+        script = script if script is not None else default_script
+        self.script = script(self.game, frames) if callable(script) else script
+        self.frame_times = {}
+
+    def run(self):
+        """
+        Play the script
+
+        Returns:
+            dict: Per-screen report (see get_report)
+        """
+        for frame in range(self.frames):
+            for event in self.script.get(frame, ()):
+                pygame.event.post(event)
+
+            start = time.perf_counter()
+            self.game.run_frame(self.frame_time)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+
+            # Attributed to the screen that rendered the frame
+            self.frame_times.setdefault(self.game.current_state, []).append(elapsed_ms)
+            if not self.game.running:
+                break
+
+        return self.get_report()
+
+    def get_report(self):
+        """
+        Frame time statistics per screen
+
+        Returns:
+            dict: state -> {'frames', 'mean_ms', 'p50_ms', 'p95_ms', 'p99_ms', 'max_ms'}
+        """
+        report = {}
+        for state, times in self.frame_times.items():
+            percentiles = compute_percentiles(times)
+            report[state] = {
+                'frames': len(times),
+                'mean_ms': sum(times) / len(times),
+                'p50_ms': percentiles[50],
+                'p95_ms': percentiles[95],
+                'p99_ms': percentiles[99],
+                'max_ms': max(times)
+            }
+        return report
+
+    def print_report(self):
+        """Print per-screen frame times"""
+        print(f"{'screen':<12} {'frames':>7} {'mean':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8}")
+        for state, stats in self.get_report().items():
+            print(f"{state:<12} {stats['frames']:>7} {stats['mean_ms']:>6.2f}ms {stats['p50_ms']:>6.2f}ms "
+                  f"{stats['p95_ms']:>6.2f}ms {stats['p99_ms']:>6.2f}ms {stats['max_ms']:>6.2f}ms")
+
+    def close(self):
+        """Shut pygame down"""
+        pygame.quit()
+
+if __name__ == "__main__":
+    import sys
+
+    frames = int(sys.argv[sys.argv.index('--frames') + 1]) if '--frames' in sys.argv else 600
+    scale = float(sys.argv[sys.argv.index('--scale') + 1]) if '--scale' in sys.argv else 1.0
+    runner = HeadlessRunner(frames, use_mock='--real' not in sys.argv, render_scale=scale)
+    runner.run()
+    runner.print_report()
+    runner.close()
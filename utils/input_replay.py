@@ -0,0 +1,174 @@
+"""
+Input recording and deterministic replay for Medieval Deck
+The raw pygame event stream is stored per frame, with the frame time the
+simulation advanced by, as gzip-compressed JSON lines
+(python main.py --record run.jsonl.gz, python main.py --replay run.jsonl.gz [--fast])
+"""
+
+import gzip
+import json
+import time
+import pygame
+from config import SCREEN_WIDTH, SCREEN_HEIGHT, UPDATE_RATE
+
+REPLAY_FORMAT_VERSION = 1
+
+def serialize_event(event):
+    """
+    Convert a pygame event to a JSON-compatible dict
+    Attributes that cannot be stored (window handles and the like) are dropped
+
+    Args:
+        event: pygame event
+
+    Returns:
+        dict: {'type': int, 'attrs': {...}}
+    """
+    attrs = {}
+    for name, value in event.dict.items():
+        if isinstance(value, tuple):
+            value = list(value)
+        if isinstance(value, (int, float, str, bool, list)) or value is None:
+            attrs[name] = value
+    return {'type': event.type, 'attrs': attrs}
+
+def deserialize_event(data):
+    """
+    Rebuild a pygame event stored by serialize_event
+
+    Args:
+        data: dict from serialize_event
+
+    Returns:
+        pygame.event.Event
+    """
+    attrs = {name: tuple(value) if isinstance(value, list) else value
+             for name, value in data['attrs'].items()}
+    return pygame.event.Event(data['type'], attrs)
+
+class InputRecorder:
+    """Writes one line per frame: index, wall clock offset, frame time and raw events"""
+
+    def __init__(self, path):
+        """
+        Initialize recorder
+
+        Args:
+            path: Output file (.jsonl.gz)
+        """
+        self.path = path
+        self.file = gzip.open(path, "wt", encoding="utf-8")
+        self.file.write(json.dumps({
+            'version': REPLAY_FORMAT_VERSION, 'update_rate': UPDATE_RATE,
+            'screen': [SCREEN_WIDTH, SCREEN_HEIGHT], 'recorded_at': time.strftime('%Y-%m-%d %H:%M:%S')
+        }) + "\n")
+        self.frame_index = 0
+        self.frame_time = 0.0
+        self.start_time = time.perf_counter()
+        print(f"Recording input to {path}")
+
+    def begin_frame(self, frame_time):
+        """
+        Remember the frame time the simulation advances by this frame
+
+        Args:
+            frame_time: Seconds since the previous frame
+        """
+        self.frame_time = frame_time
+
+    def record_events(self, events):
+        """
+        Store the frame's raw events
+
+        Args:
+            events: Events returned by pygame.event.get()
+        """
+        self.file.write(json.dumps({
+            'f': self.frame_index,
+            't': round(time.perf_counter() - self.start_time, 6),
+            'dt': self.frame_time,
+            'e': [serialize_event(event) for event in events]
+        }, separators=(',', ':')) + "\n")
+        self.frame_index += 1
+
+    def close(self):
+        """Flush and close the file"""
+        if self.file:
+            self.file.close()
+            self.file = None
+            print(f"Recorded {self.frame_index} frames to {self.path}")
+
+class InputReplay:
+    """
+    Feeds recorded frames back: each frame gets its recorded frame time and events
+    In fast mode the game loop skips its frame cap to measure throughput
+    """
+
+    def __init__(self, path, fast=False):
+        """
+        Initialize replay
+
+        Args:
+            path: Recording written by InputRecorder
+            fast: Replay as fast as possible
+        """
+        self.path = path
+        self.fast = fast
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            self.header = json.loads(f.readline())
+            self.frames = [json.loads(line) for line in f if line.strip()]
+
+        if self.header.get('update_rate') != UPDATE_RATE:
+            print(f"Warning: recorded at UPDATE_RATE {self.header.get('update_rate')}, "
+                  f"running {UPDATE_RATE}; replay will diverge")
+
+        self.frame_index = 0
+        self.current = None
+        self.start_time = None
+        self.end_time = None
+        print(f"Replaying {len(self.frames)} frames from {path}{' (fast)' if fast else ''}")
+
+    @property
+    def finished(self):
+        """True once every recorded frame was replayed"""
+        return self.frame_index >= len(self.frames)
+
+    def begin_frame(self):
+        """
+        Advance to the next recorded frame
+
+        Returns:
+            float: Recorded frame time, or None when the recording is exhausted
+        """
+        if self.start_time is None:
+            self.start_time = time.perf_counter()
+        if self.finished:
+            self.end_time = self.end_time or time.perf_counter()
+            return None
+
+        self.current = self.frames[self.frame_index]
+        self.frame_index += 1
+        if self.finished:
+            self.end_time = time.perf_counter()
+        return self.current['dt']
+
+    def next_events(self):
+        """
+        Recorded events of the current frame
+
+        Returns:
+            list: pygame events
+        """
+        if self.current is None:
+            return []
+        events = [deserialize_event(data) for data in self.current['e']]
+        self.current = None
+        return events
+
+    def print_summary(self):
+        """Print replay throughput"""
+        if self.start_time is None:
+            return
+        elapsed = (self.end_time or time.perf_counter()) - self.start_time
+        fps = self.frame_index / elapsed if elapsed > 0 else 0.0
+        print(f"Replayed {self.frame_index}/{len(self.frames)} frames in {elapsed:.2f}s ({fps:.1f} FPS)")
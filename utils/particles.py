@@ -0,0 +1,318 @@
+"""
+Particle system for Medieval Deck
+Attack, damage and card-play feedback: particle state lives in one NumPy
+structured array updated with vectorized math, dead particles are compacted
+away and live ones are drawn with a single batched blits call
+(python -m utils.particles benchmarks particles per frame within budget)
+"""
+
+import time
+import numpy as np
+import pygame
+from config import SCREEN_WIDTH, SCREEN_HEIGHT, GOLD, PARTICLE_CAPACITY, PARTICLE_BUDGET_MS
+from utils.canvas import as_canvas
+
+PARTICLE_DTYPE = np.dtype([
+    ('pos', np.float32, 2),
+    ('vel', np.float32, 2),
+    ('gravity', np.float32),
+    ('life', np.float32),
+    ('max_life', np.float32),
+    ('color', np.uint8),
+    ('size', np.uint8)
+])
+
+PARTICLE_SIZES = (6, 12, 24)  # Sprite diameters for size 0, 1, 2
+FADE_STEPS = 8  # Prebaked opacity levels per color and size
+
+# Burst presets for combat feedback (angles in degrees, 0 = right, 90 = down)
+PARTICLE_PRESETS = {
+    'attack': {
+        'count': 40, 'speed': (500, 1100), 'angle': 0, 'spread': 50,
+        'life': (0.15, 0.35), 'color': (255, 235, 180), 'size': 1, 'gravity': 0.0
+    },
+    'damage': {
+        'count': 60, 'speed': (150, 550), 'angle': -90, 'spread': 360,
+        'life': (0.4, 0.8), 'color': (220, 40, 40), 'size': 1, 'gravity': 1200.0
+    },
+    'card_play': {
+        'count': 80, 'speed': (80, 320), 'angle': -90, 'spread': 360,
+        'life': (0.5, 1.0), 'color': GOLD, 'size': 0, 'gravity': -250.0
+    }
+}
+
+class Emitter:
+    """Continuous source of particles, owned and updated by a ParticleSystem"""
+
+    def __init__(self, system, pos, rate, duration=None, **params):
+        """
+        Initialize emitter
+
+        Args:
+            system: ParticleSystem particles are emitted into
+            pos: Logical position
+            rate: Particles per second
+            duration: Seconds to run, None until stop()
+            **params: ParticleSystem.emit parameters (speed, angle, spread, life, color, size, gravity)
+        """
+        self.system = system
+        self.pos = pos
+        self.rate = rate
+        self.duration = duration
+        self.params = params
+        self.elapsed = 0.0
+        self.pending = 0.0
+        self.active = True
+
+    def update(self, dt):
+        """Emit the particles due over dt seconds"""
+        if not self.active:
+            return
+        self.elapsed += dt
+        self.pending += self.rate * dt
+        count = int(self.pending)
+        if count:
+            self.pending -= count
+            self.system.emit(self.pos, count, **self.params)
+        if self.duration is not None and self.elapsed >= self.duration:
+            self.active = False
+
+    def stop(self):
+        """Stop emitting; live particles finish their lifetime"""
+        self.active = False
+
+class ParticleSystem:
+    """
+    Fixed-capacity particle pool
+    Live particles occupy the first `count` rows of the array; emission past
+    capacity is dropped and counted rather than growing the array
+    """
+
+    def __init__(self, capacity=PARTICLE_CAPACITY, drag=0.2, seed=0):
+        """
+        Initialize particle system
+
+        Args:
+            capacity: Maximum live particles
+            drag: Fraction of velocity kept after one second
+            seed: Random seed, so replays emit identical particles
+        """
+        self.capacity = capacity
+        self.drag = drag
+        self.particles = np.zeros(capacity, dtype=PARTICLE_DTYPE)
+        self.count = 0
+        self.rng = np.random.default_rng(seed)
+        self.emitters = []
+
+        # Prebaked sprites: index = (color * len(PARTICLE_SIZES) + size) * FADE_STEPS + step
+        self.palette = []
+        self.sprites = []
+        self.offsets = np.zeros((0, 2), dtype=np.float32)
+
+        self.peak = 0
+        self.dropped = 0
+
+    def _color_index(self, color):
+        """Palette index of a color, baking its sprites the first time it is used"""
+        color = tuple(color[:3])
+        if color in self.palette:
+            return self.palette.index(color)
+
+        self.palette.append(color)
+        offsets = []
+        for diameter in PARTICLE_SIZES:
+            radius = diameter // 2
+            for step in range(1, FADE_STEPS + 1):
+                alpha = 255 * step // FADE_STEPS
+                sprite = pygame.Surface((diameter, diameter), pygame.SRCALPHA)
+                pygame.draw.circle(sprite, (*color, alpha // 3), (radius, radius), radius)
+                pygame.draw.circle(sprite, (*color, alpha), (radius, radius), max(1, radius * 2 // 3))
+                if pygame.display.get_surface() is not None:
+                    sprite = sprite.convert_alpha()
+                self.sprites.append(sprite)
+                offsets.append((radius, radius))
+        self.offsets = np.concatenate([self.offsets, np.array(offsets, dtype=np.float32)])
+        return len(self.palette) - 1
+
+    def emit(self, pos, count, speed=(100, 300), angle=0.0, spread=360.0, life=(0.5, 1.0),
+             color=GOLD, size=1, gravity=0.0):
+        """
+        Emit a burst of particles
+
+        Args:
+            pos: Logical (x, y) origin
+            count: Particles to emit
+            speed: (min, max) pixels per second
+            angle: Mean direction in degrees
+            spread: Angular spread in degrees around angle
+            life: (min, max) lifetime in seconds
+            color: RGB color
+            size: Index into PARTICLE_SIZES
+            gravity: Vertical acceleration in pixels per second squared
+
+        Returns:
+            int: Particles actually emitted
+        """
+        emitted = min(count, self.capacity - self.count)
+        self.dropped += count - emitted
+        if emitted <= 0:
+            return 0
+
+        color_index = self._color_index(color)
+        directions = np.radians(angle + (self.rng.random(emitted) - 0.5) * spread)
+        speeds = self.rng.uniform(speed[0], speed[1], emitted)
+        lifetimes = self.rng.uniform(life[0], life[1], emitted)
+
+        batch = self.particles[self.count:self.count + emitted]
+        batch['pos'] = pos
+        batch['vel'][:, 0] = np.cos(directions) * speeds
+        batch['vel'][:, 1] = np.sin(directions) * speeds
+        batch['gravity'] = gravity
+        batch['life'] = lifetimes
+        batch['max_life'] = lifetimes
+        batch['color'] = color_index
+        batch['size'] = size
+
+        self.count += emitted
+        self.peak = max(self.peak, self.count)
+        return emitted
+
+    def burst(self, preset, pos, **overrides):
+        """
+        Emit a preset burst ('attack', 'damage', 'card_play')
+
+        Args:
+            preset: Key of PARTICLE_PRESETS
+            pos: Logical (x, y) origin
+            **overrides: emit parameters replacing the preset's
+
+        Returns:
+            int: Particles actually emitted
+        """
+        params = dict(PARTICLE_PRESETS[preset], **overrides)
+        return self.emit(pos, **params)
+
+    def add_emitter(self, pos, rate, duration=None, **params):
+        """
+        Start a continuous emitter
+
+        Returns:
+            Emitter: Handle to move (emitter.pos) or stop()
+        """
+        emitter = Emitter(self, pos, rate, duration, **params)
+        self.emitters.append(emitter)
+        return emitter
+
+    def update(self, dt):
+        """
+        Advance emitters and particles, compacting dead particles away
+
+        Args:
+            dt: Seconds of simulation time
+        """
+        for emitter in self.emitters:
+            emitter.update(dt)
+        self.emitters = [emitter for emitter in self.emitters if emitter.active]
+
+        if not self.count:
+            return
+        live = self.particles[:self.count]
+        velocity = live['vel']
+        velocity[:, 1] += live['gravity'] * dt
+        velocity *= self.drag ** dt
+        live['pos'] += velocity * dt
+        live['life'] -= dt
+
+        alive = live['life'] > 0
+        survivors = int(np.count_nonzero(alive))
+        if survivors < self.count:
+            self.particles[:survivors] = live[alive]
+            self.count = survivors
+
+    def draw(self, canvas):
+        """
+        Draw live particles with one blits call
+
+        Args:
+            canvas: Surface or canvas to draw on (logical coordinates)
+        """
+        if not self.count:
+            return
+        canvas = as_canvas(canvas)
+        live = self.particles[:self.count]
+
+        steps = np.ceil(live['life'] / live['max_life'] * FADE_STEPS).astype(np.int32)
+        np.clip(steps - 1, 0, FADE_STEPS - 1, out=steps)
+        indices = (live['color'].astype(np.int32) * len(PARTICLE_SIZES) + live['size']) * FADE_STEPS + steps
+        positions = (live['pos'] - self.offsets[indices]).astype(np.int32)
+
+        sprites = self.sprites
+        canvas.blits([(sprites[index], dest) for index, dest in zip(indices.tolist(), positions.tolist())])
+
+    def clear(self):
+        """Remove all particles and emitters"""
+        self.count = 0
+        self.emitters = []
+
+    def get_stats(self):
+        """
+        Particle statistics
+
+        Returns:
+            dict: live, peak, capacity, dropped, emitters
+        """
+        return {
+            'live': self.count,
+            'peak': self.peak,
+            'capacity': self.capacity,
+            'dropped': self.dropped,
+            'emitters': len(self.emitters)
+        }
+
+def benchmark(budget_ms=PARTICLE_BUDGET_MS, counts=(250, 500, 1000, 2000, 4000, 8000, 16000),
+              frames=30, size=(SCREEN_WIDTH, SCREEN_HEIGHT)):
+    """
+    Time update + draw of steady particle populations on a full-size frame
+
+    Args:
+        budget_ms: Per-frame time particles may take
+        counts: Particle populations to measure
+        frames: Frames averaged per population
+        size: Target surface size
+
+    Returns:
+        dict: 'results' (count -> mean ms) and 'max_within_budget'
+    """
+    target = pygame.Surface(size)
+    dt = 1.0 / 60
+    results = {}
+    for count in counts:
+        system = ParticleSystem(capacity=count)
+        for preset in PARTICLE_PRESETS:
+            system.burst(preset, (size[0] // 2, size[1] // 2), count=count // len(PARTICLE_PRESETS) + 1,
+                         life=(1e6, 1e6), gravity=0.0)
+        total = 0.0
+        for _ in range(frames):
+            start = time.perf_counter()
+            system.update(dt)
+            system.draw(target)
+            total += time.perf_counter() - start
+        results[count] = total / frames * 1000
+
+    within = [count for count, ms in results.items() if ms <= budget_ms]
+    return {'results': results, 'max_within_budget': max(within) if within else 0}
+
+def print_benchmark(report, budget_ms=PARTICLE_BUDGET_MS):
+    """Print a benchmark report"""
+    print(f"Particle benchmark (budget {budget_ms:.1f}ms per frame)")
+    for count, ms in report['results'].items():
+        print(f"  {count:>6} particles  {ms:6.2f}ms  {'OK' if ms <= budget_ms else 'over'}")
+    print(f"Particles per frame within budget: {report['max_within_budget']}")
+
+if __name__ == "__main__":
+    import sys
+
+    budget = float(sys.argv[sys.argv.index('--budget') + 1]) if '--budget' in sys.argv else PARTICLE_BUDGET_MS
+    pygame.init()
+    print_benchmark(benchmark(budget), budget)
+    pygame.quit()
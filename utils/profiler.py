@@ -0,0 +1,222 @@
+"""
+Frame profiler for Medieval Deck
+Rolling per-phase frame timings with an in-game overlay (F3) and CSV export (F4)
+"""
+
+import os
+import csv
+import time
+from collections import deque
+import pygame
+from config import PROFILER_HISTORY, PROFILER_CSV_DIR, WHITE, GOLD
+from utils.canvas import as_canvas
+from utils.effects import Effects
+from utils.fonts import FontRegistry
+
+OVERLAY_RECT = pygame.Rect(20, 20, 520, 360)  # Area the overlay panel covers
+LINE_HEIGHT = 24  # Overlay text row spacing
+
+def compute_percentiles(times, percentiles=(50, 95, 99)):
+    """
+    Nearest-rank percentiles of a list of frame times
+
+    Args:
+        times: Frame times in ms
+        percentiles: Percentiles to compute
+
+    Returns:
+        dict: percentile -> frame time in ms (empty without times)
+    """
+    if not times:
+        return {}
+    times = sorted(times)
+    return {p: times[min(len(times) - 1, int(len(times) * p / 100))] for p in percentiles}
+
+class FrameProfiler:
+    """
+    Records how long each phase of a frame takes
+    While disabled every call returns after a single attribute check
+    """
+
+    def __init__(self, history=PROFILER_HISTORY, fonts=None):
+        """
+        Initialize profiler
+
+        Args:
+            history: Number of recent frames kept
+            fonts: FontRegistry the overlay text comes from
+        """
+        self.enabled = False
+        self.frames = deque(maxlen=history)
+        self._current = None
+        self._frame_start = 0.0
+        self._last_mark = 0.0
+        self.fonts = fonts
+        self._atlas = None
+        self._effects = Effects(max_entries=1)
+
+    def toggle(self):
+        """
+        Enable or disable profiling
+
+        Returns:
+            bool: New enabled state
+        """
+        self.enabled = not self.enabled
+        self._current = None
+        print(f"Frame profiler {'enabled' if self.enabled else 'disabled'}")
+        return self.enabled
+
+    def begin_frame(self):
+        """Start timing a frame"""
+        if not self.enabled:
+            return
+        self._current = {}
+        self._frame_start = self._last_mark = time.perf_counter()
+
+    def mark(self, phase):
+        """
+        Attribute the time since the previous mark to a phase
+
+        Args:
+            phase: Phase name ('events', 'update', 'render.menu', 'flip', ...)
+        """
+        if self._current is None:
+            return
+        now = time.perf_counter()
+        self._current[phase] = self._current.get(phase, 0.0) + (now - self._last_mark) * 1000
+        self._last_mark = now
+
+    def end_frame(self):
+        """Finish the frame and add it to the history"""
+        if self._current is None:
+            return
+        total_ms = (time.perf_counter() - self._frame_start) * 1000
+        self.frames.append((total_ms, self._current))
+        self._current = None
+
+    def get_phase_stats(self):
+        """
+        Rolling statistics per phase
+
+        Returns:
+            dict: phase -> {'mean_ms', 'max_ms'} over frames where it ran
+        """
+        totals = {}
+        for _, phases in self.frames:
+            for phase, ms in phases.items():
+                total, count, peak = totals.get(phase, (0.0, 0, 0.0))
+                totals[phase] = (total + ms, count + 1, max(peak, ms))
+        return {phase: {'mean_ms': total / count, 'max_ms': peak}
+                for phase, (total, count, peak) in totals.items()}
+
+    def get_percentiles(self, percentiles=(50, 95, 99)):
+        """
+        Frame time percentiles
+
+        Args:
+            percentiles: Percentiles to compute
+
+        Returns:
+            dict: percentile -> frame time in ms (empty without frames)
+        """
+        return compute_percentiles([total for total, _ in self.frames], percentiles)
+
+    def get_histogram(self, bin_ms=2.0, max_ms=50.0):
+        """
+        Frame time histogram
+
+        Args:
+            bin_ms: Bucket width
+            max_ms: Upper bound; slower frames land in the last bucket
+
+        Returns:
+            list: Frame counts per bucket
+        """
+        bins = [0] * int(max_ms / bin_ms)
+        for total, _ in self.frames:
+            bins[min(len(bins) - 1, int(total / bin_ms))] += 1
+        return bins
+
+    def dump_csv(self, path=None, last=None):
+        """
+        Write recent frames to CSV
+
+        Args:
+            path: Output file (defaults to a timestamped file in PROFILER_CSV_DIR)
+            last: Number of most recent frames (defaults to the whole history)
+
+        Returns:
+            str: Path written
+        """
+        if path is None:
+            os.makedirs(PROFILER_CSV_DIR, exist_ok=True)
+            path = os.path.join(PROFILER_CSV_DIR, f"frames_{time.strftime('%Y%m%d_%H%M%S')}.csv")
+
+        frames = list(self.frames)[-last:] if last else list(self.frames)
+        phases = sorted({phase for _, frame_phases in frames for phase in frame_phases})
+
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["frame", "total_ms"] + phases)
+            for index, (total, frame_phases) in enumerate(frames):
+                writer.writerow([index, f"{total:.3f}"] +
+                                [f"{frame_phases.get(phase, 0.0):.3f}" for phase in phases])
+
+        print(f"Frame profile written: {path} ({len(frames)} frames)")
+        return path
+
+    def draw(self, surface):
+        """
+        Draw the overlay: per-phase timings and a frame time histogram
+
+        Args:
+            surface: Surface or canvas to draw on
+        """
+        surface = as_canvas(surface)
+        if self._atlas is None:
+            # Timings change every frame; compose them from cached glyphs
+            self._atlas = (self.fonts or FontRegistry()).atlas(28, WHITE)
+
+        panel = OVERLAY_RECT
+        self._effects.draw_panel(surface, panel, (0, 0, 0, 180))
+
+        # Histogram along the bottom of the panel; text rows must end above it
+        graph = pygame.Rect(panel.left + 10, panel.bottom - 90, panel.width - 20, 80)
+        max_lines = (graph.top - panel.top - 10) // LINE_HEIGHT
+
+        percentiles = self.get_percentiles()
+        lines = [f"FRAME PROFILER ({len(self.frames)} frames)  F4: CSV"]
+        if percentiles:
+            lines.append(f"p50 {percentiles[50]:.1f}ms  p95 {percentiles[95]:.1f}ms  p99 {percentiles[99]:.1f}ms")
+        phase_stats = self.get_phase_stats()
+        shown = sorted(phase_stats)
+        if len(lines) + len(shown) > max_lines:
+            # Too many phases (per-screen render.* phases): list the slowest ones
+            shown = sorted(phase_stats, key=lambda phase: phase_stats[phase]['mean_ms'], reverse=True)
+            shown = sorted(shown[:max_lines - len(lines) - 1])
+        for phase in shown:
+            stats = phase_stats[phase]
+            lines.append(f"{phase:<18} {stats['mean_ms']:6.2f}ms  max {stats['max_ms']:6.2f}ms")
+        if len(shown) < len(phase_stats):
+            lines.append(f"+{len(phase_stats) - len(shown)} faster phases (F4: CSV)")
+
+        y = panel.top + 10
+        for line in lines:
+            self._atlas.draw(surface, line, (panel.left + 10, y))
+            y += LINE_HEIGHT
+
+        bin_ms, max_ms = 2.0, 50.0
+        bins = self.get_histogram(bin_ms, max_ms)
+        bar_width = graph.width / len(bins)
+        peak = max(bins) or 1
+        for index, count in enumerate(bins):
+            height = int(graph.height * count / peak)
+            if height:
+                surface.rect((120, 160, 220), (
+                    graph.left + int(index * bar_width), graph.bottom - height,
+                    max(1, int(bar_width) - 1), height
+                ))
+        for ms in percentiles.values():
+            x = graph.left + int(min(ms, max_ms) / max_ms * graph.width)
+            surface.line(GOLD, (x, graph.top), (x, graph.bottom), 2)
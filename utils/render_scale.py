@@ -0,0 +1,155 @@
+"""
+Dynamic internal render resolution for Medieval Deck
+Screens draw into an offscreen surface at a fraction of the native size,
+presented with one scale blit; the fraction follows the frame budget
+"""
+
+from collections import deque
+import pygame
+from config import (SCREEN_WIDTH, SCREEN_HEIGHT, FPS, RENDER_SCALE, RENDER_SCALE_AUTO,
+                    RENDER_SCALE_LEVELS, RENDER_SCALE_WINDOW, RENDER_SCALE_HEADROOM)
+from utils.canvas import SurfaceCanvas, ScaledCanvas
+
+class RenderScaler:
+    """
+    Owns the canvas screens render into and presents it on the display
+    At scale 1.0 screens draw straight onto the display with no extra copy
+    """
+
+    def __init__(self, display, logical_size=(SCREEN_WIDTH, SCREEN_HEIGHT), scale=RENDER_SCALE,
+                 auto=RENDER_SCALE_AUTO, levels=RENDER_SCALE_LEVELS, budget_ms=None,
+                 window=RENDER_SCALE_WINDOW, headroom=RENDER_SCALE_HEADROOM):
+        """
+        Initialize scaler
+
+        Args:
+            display: Display surface
+            logical_size: Coordinate space screens lay out against
+            scale: Starting internal resolution fraction
+            auto: Adjust the scale from measured frame times
+            levels: Allowed scales, highest first
+            budget_ms: Frame time budget (defaults to 1000 / FPS)
+            window: Frames averaged before the scale may change
+            headroom: Budget fraction frames must fit in before scaling up
+        """
+        self.display = display
+        self.logical_size = logical_size
+        self.auto = auto
+        self.levels = sorted(set(levels) | {scale}, reverse=True)
+        self.budget_ms = budget_ms or 1000.0 / (FPS or 60)
+        self.headroom = headroom
+        self.frame_times = deque(maxlen=window)
+
+        self.scale = None
+        self.canvas = None
+        self.overlay = SurfaceCanvas(display)  # Drawn after the upscale, at native resolution
+        self.set_scale(scale)
+
+    def set_scale(self, scale):
+        """
+        Switch the internal resolution
+
+        Args:
+            scale: Fraction of the logical size
+        """
+        if scale == self.scale:
+            return
+        self.scale = scale
+        self.frame_times.clear()
+
+        if scale >= 1.0:
+            self.canvas = SurfaceCanvas(self.display)
+        else:
+            size = (max(1, int(self.logical_size[0] * scale)), max(1, int(self.logical_size[1] * scale)))
+            offscreen = pygame.Surface(size).convert(self.display)
+            self.canvas = ScaledCanvas(offscreen, scale, self.logical_size)
+        print(f"Render scale: {scale:.2f} ({self.canvas.surface.get_width()}x{self.canvas.surface.get_height()})")
+
+    def present(self):
+        """Upscale the internal frame onto the display"""
+        if self.scale < 1.0:
+            pygame.transform.scale(self.canvas.surface, self.display.get_size(), self.display)
+
+    def flip(self):
+        """Show the frame"""
+        pygame.display.flip()
+
+    def record_frame(self, frame_ms):
+        """
+        Feed a frame's work time; steps the scale down when over budget
+        and back up when there is headroom
+
+        Args:
+            frame_ms: Time spent on the frame, excluding the frame cap wait
+
+        Returns:
+            bool: True if the scale changed
+        """
+        if not self.auto:
+            return False
+        self.frame_times.append(frame_ms)
+        if len(self.frame_times) < self.frame_times.maxlen:
+            return False
+
+        mean_ms = sum(self.frame_times) / len(self.frame_times)
+        index = self.levels.index(self.scale)
+        if mean_ms > self.budget_ms and index + 1 < len(self.levels):
+            self.set_scale(self.levels[index + 1])
+            return True
+        if mean_ms < self.budget_ms * self.headroom and index > 0:
+            self.set_scale(self.levels[index - 1])
+            return True
+        return False
+
+    def to_logical(self, pos):
+        """
+        Map a window position to logical coordinates
+
+        Args:
+            pos: (x, y) as reported by pygame mouse events
+
+        Returns:
+            tuple: (x, y) in the coordinate space screens lay out against
+        """
+        width, height = self.display.get_size()
+        if (width, height) == self.logical_size:
+            return pos
+        return (int(pos[0] * self.logical_size[0] / width), int(pos[1] * self.logical_size[1] / height))
+
+class TexturePresenter:
+    """
+    Render target for the SDL2 texture backend, with the RenderScaler interface
+    The renderer scales the logical size to the window on the GPU, so there is
+    no internal resolution to adjust and mouse positions arrive in logical coordinates
+    """
+
+    auto = False
+    scale = 1.0
+
+    def __init__(self, canvas):
+        """
+        Initialize presenter
+
+        Args:
+            canvas: TextureCanvas screens render into
+        """
+        self.canvas = canvas
+        self.overlay = canvas
+
+    def set_scale(self, scale):
+        """Resolution scaling is left to the renderer"""
+
+    def present(self):
+        """Nothing to upscale; screens drew straight into the renderer"""
+
+    def flip(self):
+        """Show the frame"""
+        self.canvas.present()
+
+    def record_frame(self, frame_ms):
+        """Frame times do not drive a scale on this backend"""
+        return False
+
+    def to_logical(self, pos):
+        """SDL already reports mouse positions in logical coordinates"""
+        return pos
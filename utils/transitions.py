@@ -0,0 +1,128 @@
+"""
+Screen transitions for Medieval Deck
+Fade, crossfade and wipe between screens without per-frame allocations:
+the outgoing frame is snapshotted once into a reused buffer and composited
+with surface-alpha blits, which SDL runs as SIMD blends
+"""
+
+import pygame
+from config import TRANSITION_STYLE, TRANSITION_DURATION
+from utils.canvas import TextureCanvas
+
+TRANSITION_STYLES = ("fade", "crossfade", "wipe")
+
+class TransitionEngine:
+    """
+    Runs one transition at a time over the freshly rendered new screen
+    Progress advances with the fixed simulation step, so replays are deterministic
+    """
+
+    def __init__(self, style=TRANSITION_STYLE, duration=TRANSITION_DURATION):
+        """
+        Initialize transition engine
+
+        Args:
+            style: Default style ('fade', 'crossfade', 'wipe', or None for cuts)
+            duration: Seconds a transition lasts
+        """
+        self.style = style
+        self.duration = duration
+        self.active_style = None
+        self.elapsed = 0.0
+
+        # Buffers at the canvas resolution, allocated once and reused
+        self.snapshot = None
+        self.black = None
+        self.allocations = 0
+
+    @property
+    def active(self):
+        """True while a transition is running"""
+        return self.active_style is not None
+
+    @property
+    def progress(self):
+        """Transition progress from 0 to 1"""
+        return min(1.0, self.elapsed / self.duration) if self.duration > 0 else 1.0
+
+    def _ensure_buffers(self, surface):
+        """(Re)allocate the snapshot and black buffers only when the target size changes"""
+        if self.snapshot is not None and self.snapshot.get_size() == surface.get_size():
+            return
+        self.snapshot = pygame.Surface(surface.get_size()).convert(surface)
+        self.black = pygame.Surface(surface.get_size()).convert(surface)
+        self.black.fill((0, 0, 0))
+        self.allocations += 1
+
+    def start(self, canvas, style=None):
+        """
+        Snapshot the outgoing frame and begin a transition
+
+        Args:
+            canvas: Canvas holding the last rendered frame
+            style: Overrides the default style for this change
+        """
+        style = style or self.style
+        if style not in TRANSITION_STYLES or self.duration <= 0:
+            self.active_style = None
+            return
+
+        if isinstance(canvas, TextureCanvas):
+            # The renderer's back buffer is undefined after present; fade in from black
+            style = "fade"
+            self.elapsed = self.duration / 2
+        else:
+            self._ensure_buffers(canvas.surface)
+            self.snapshot.blit(canvas.surface, (0, 0))
+            self.elapsed = 0.0
+        self.active_style = style
+
+    def update(self, dt):
+        """
+        Advance the running transition
+
+        Args:
+            dt: Seconds of simulation time
+        """
+        if self.active_style is None:
+            return
+        self.elapsed += dt
+        if self.elapsed >= self.duration:
+            self.active_style = None
+
+    def draw(self, canvas):
+        """
+        Composite the transition over the new screen's frame
+
+        Args:
+            canvas: Canvas the new screen was rendered into
+        """
+        if self.active_style is None:
+            return
+        t = self.progress
+
+        if isinstance(canvas, TextureCanvas):
+            alpha = int(255 * min(1.0, 2 * (1 - t)))
+            canvas.renderer.draw_blend_mode = 1  # SDL_BLENDMODE_BLEND
+            canvas.fill((0, 0, 0, alpha), (0, 0, *canvas.get_size()))
+            canvas.renderer.draw_blend_mode = 0
+            return
+
+        target = canvas.surface
+        if self.active_style == "crossfade":
+            self.snapshot.set_alpha(int(255 * (1 - t)))
+            target.blit(self.snapshot, (0, 0))
+        elif self.active_style == "fade":
+            # Old frame fades to black over the first half, new frame fades in over the second
+            if t < 0.5:
+                self.snapshot.set_alpha(None)
+                target.blit(self.snapshot, (0, 0))
+                self.black.set_alpha(int(255 * t * 2))
+            else:
+                self.black.set_alpha(int(255 * (1 - t) * 2))
+            target.blit(self.black, (0, 0))
+        elif self.active_style == "wipe":
+            # New screen sweeps in from the left; the old frame keeps the rest
+            edge = int(target.get_width() * t)
+            self.snapshot.set_alpha(None)
+            target.blit(self.snapshot, (edge, 0), pygame.Rect(edge, 0, target.get_width() - edge, target.get_height()))
@@ -0,0 +1,276 @@
+"""
+Retained-mode widgets for Medieval Deck
+Screens declare a widget tree once; each node caches its rendered subtree and
+a change marks the node and its ancestors dirty, so a frame only re-renders
+what changed and otherwise composites cached surfaces
+"""
+
+import pygame
+from config import WHITE
+from utils.canvas import as_canvas
+
+class Widget:
+    """
+    Node of the widget tree
+    Rects are relative to the parent; the subtree is cached in one surface
+    """
+
+    def __init__(self, rect=(0, 0, 0, 0), opaque=False):
+        """
+        Initialize widget
+
+        Args:
+            rect: (x, y, width, height) relative to the parent
+            opaque: Cache without per-pixel alpha (for nodes that cover their whole rect)
+        """
+        self.rect = pygame.Rect(rect)
+        self.opaque = opaque
+        self.parent = None
+        self.children = []
+        self.visible = True
+        self.dirty = True
+        self._surface = None
+        self.rebuilds = 0
+
+    @property
+    def abs_rect(self):
+        """Rect in screen (logical) coordinates"""
+        if self.parent is None:
+            return self.rect.copy()
+        return self.rect.move(self.parent.abs_rect.topleft)
+
+    def add(self, child):
+        """
+        Append a child widget
+
+        Returns:
+            The child, so layouts can be declared in one expression
+        """
+        child.parent = self
+        self.children.append(child)
+        child._attached()
+        self.invalidate()
+        return child
+
+    def remove(self, child):
+        """Detach a child widget"""
+        self.children.remove(child)
+        child.parent = None
+        self.invalidate()
+
+    def _attached(self):
+        """Called once the widget has a parent (and a screen position)"""
+        for child in self.children:
+            child._attached()
+
+    def invalidate(self):
+        """Mark this widget and its ancestors for re-rendering"""
+        node = self
+        while node is not None:
+            node.dirty = True
+            node = node.parent
+
+    def set(self, **attributes):
+        """
+        Change attributes, invalidating only if a value actually changed
+
+        Returns:
+            self
+        """
+        changed = False
+        for name, value in attributes.items():
+            if getattr(self, name) != value:
+                setattr(self, name, value)
+                changed = True
+        if changed:
+            self.invalidate()
+        return self
+
+    def paint(self, surface):
+        """Draw this node's own content (children are composited after); overridden by subclasses"""
+
+    def render(self):
+        """
+        Cached surface of the subtree, re-rendered only when dirty
+
+        Returns:
+            pygame.Surface at the widget size
+        """
+        if self.dirty or self._surface is None or self._surface.get_size() != self.rect.size:
+            # A fresh surface per rebuild: ScaledCanvas and TextureCanvas cache
+            # by surface identity, so repainting in place would show stale pixels
+            self._surface = pygame.Surface(self.rect.size, 0 if self.opaque else pygame.SRCALPHA)
+            self.paint(self._surface)
+            for child in self.children:
+                if child.visible:
+                    self._surface.blit(child.render(), child.rect.topleft)
+            self.dirty = False
+            self.rebuilds += 1
+        return self._surface
+
+    def draw(self, canvas):
+        """
+        Composite the widget onto a canvas at its screen position
+
+        Args:
+            canvas: Surface or canvas to draw on (logical coordinates)
+        """
+        if self.visible:
+            as_canvas(canvas).blit(self.render(), self.abs_rect.topleft)
+
+class Layer(Widget):
+    """
+    Uncached container: draws its children's cached surfaces with one blits call
+    Use as the root of a screen so sparse layouts are not composited into a
+    full-screen transparent surface
+    """
+
+    def __init__(self, rect=(0, 0, 0, 0)):
+        super().__init__(rect)
+
+    def draw(self, canvas):
+        if not self.visible:
+            return
+        origin = self.abs_rect.topleft
+        as_canvas(canvas).blits([(child.render(), child.rect.move(origin).topleft)
+                                 for child in self.children if child.visible])
+        self.dirty = False
+
+class Panel(Widget):
+    """Filled (optionally translucent) rectangle with an optional border"""
+
+    def __init__(self, rect, color=(0, 0, 0, 180), border_color=None, border_width=0):
+        """
+        Initialize panel
+
+        Args:
+            rect: Rect relative to the parent
+            color: RGB or RGBA fill
+            border_color: Border color, None for no border
+            border_width: Border thickness
+        """
+        super().__init__(rect, opaque=len(color) == 3 or color[3] == 255)
+        self.color = color
+        self.border_color = border_color
+        self.border_width = border_width
+
+    def paint(self, surface):
+        surface.fill(self.color)
+        if self.border_color and self.border_width:
+            pygame.draw.rect(surface, self.border_color, surface.get_rect(), self.border_width)
+
+class Label(Widget):
+    """Text rendered once per change"""
+
+    def __init__(self, pos, text, font, color=WHITE, anchor="topleft"):
+        """
+        Initialize label
+
+        Args:
+            pos: Anchor position relative to the parent
+            text: Text to show
+            font: pygame.font.Font
+            color: Text color
+            anchor: pygame.Rect attribute pos refers to ('center', 'bottomright', ...)
+        """
+        super().__init__()
+        self.pos = pos
+        self.text = text
+        self.font = font
+        self.color = color
+        self.anchor = anchor
+        self._layout()
+
+    def _layout(self):
+        self._surface = self.font.render(self.text, True, self.color)
+        self.rect = self._surface.get_rect(**{self.anchor: self.pos})
+        self.dirty = False
+
+    def set_text(self, text):
+        """Change the text; re-renders only if it differs"""
+        if text != self.text:
+            self.text = text
+            self.invalidate()
+
+    def render(self):
+        if self.dirty:
+            self._layout()
+            self.rebuilds += 1
+        return self._surface
+
+class Image(Widget):
+    """A surface shown as is"""
+
+    def __init__(self, pos, surface, anchor="topleft"):
+        """
+        Initialize image
+
+        Args:
+            pos: Anchor position relative to the parent
+            surface: Image surface
+            anchor: pygame.Rect attribute pos refers to
+        """
+        super().__init__(surface.get_rect(**{anchor: pos}))
+        self.anchor = anchor
+        self.pos = pos
+        self._surface = surface
+        self.dirty = False
+
+    def set_image(self, surface):
+        """Swap the image (keeping the anchor)"""
+        if surface is not self._surface:
+            self._surface = surface
+            self.rect = surface.get_rect(**{self.anchor: self.pos})
+            self.invalidate()
+
+    def render(self):
+        self.dirty = False
+        return self._surface
+
+class ButtonWidget(Widget):
+    """
+    Places a Button in the tree; the button's cached state composites are
+    used directly and its hover/press changes invalidate the ancestors
+    """
+
+    def __init__(self, button, pos=None):
+        """
+        Initialize button widget
+
+        Args:
+            button: utils.buttons.Button (keeps handling its own events)
+            pos: Position relative to the parent (defaults to the button's rect)
+        """
+        super().__init__(pygame.Rect(pos or button.rect.topleft, button.rect.size))
+        self.button = button
+        button.on_change = self.invalidate
+
+    def _attached(self):
+        # Hit testing uses the button rect, so keep it at the widget's screen position
+        self.button.rect.topleft = self.abs_rect.topleft
+
+    def render(self):
+        self.dirty = False
+        surface = self.button.get_surface()
+        self.rect.size = surface.get_size()
+        return surface
+
+class ButtonSetWidget(Layer):
+    """
+    All buttons of a MenuButtonSet: drawn directly it issues one blits call,
+    inside a cached parent the buttons are composited with it
+    """
+
+    def __init__(self, button_set):
+        """
+        Initialize button set widget
+
+        Args:
+            button_set: utils.buttons.MenuButtonSet with its buttons added
+        """
+        buttons = [button_data['button'] for button_data in button_set.buttons]
+        bounds = buttons[0].rect.unionall([button.rect for button in buttons[1:]]) if buttons else pygame.Rect(0, 0, 0, 0)
+        super().__init__(bounds)
+        self.button_set = button_set
+        for button in buttons:
+            self.add(ButtonWidget(button, (button.rect.x - bounds.x, button.rect.y - bounds.y)))